@@ -0,0 +1,79 @@
+"""Request deduplication: idempotency keys and fingerprints of in-flight scan requests."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Optional
+
+from .metrics import metrics
+
+IDEMPOTENCY_HEADER = "idempotency-key"
+
+# Fields that change what a scan does; anything else in the body is ignored.
+_FINGERPRINT_FIELDS = ("provider", "checks", "region", "services", "compliance", "severity", "config_file", "profile", "role")
+_UNORDERED_FIELDS = ("checks", "services", "compliance", "severity")
+
+
+def scan_fingerprint(request: dict[str, Any]) -> str:
+    """Stable hash of the scan-relevant request fields (list order does not matter)."""
+    canonical = {}
+    for field in _FINGERPRINT_FIELDS:
+        value = request.get(field)
+        if field in _UNORDERED_FIELDS and value:
+            value = sorted(value)
+        canonical[field] = value
+    return hashlib.sha256(json.dumps(canonical, sort_keys=True).encode()).hexdigest()
+
+
+def dedupe_key(request: dict[str, Any], idempotency_key: Optional[str]) -> str:
+    """An explicit Idempotency-Key wins; otherwise identical requests share a fingerprint."""
+    if idempotency_key:
+        return f"idem:{idempotency_key.strip()}"
+    return f"fp:{scan_fingerprint(request)}"
+
+
+class IdempotencyConflict(Exception):
+    """An Idempotency-Key was reused with a request that fingerprints differently."""
+
+    def __init__(self, key: str) -> None:
+        super().__init__(f"Idempotency-Key {key.removeprefix('idem:')!r} was already used with a different request")
+
+
+class RequestCoalescer:
+    """
+    Runs one task per key: callers with the same key while it is in flight
+    await the same result instead of starting another scan. The task is
+    shielded, so a caller that gives up (timeout, disconnect) does not cancel
+    it for the others, and a retry attaches to the scan already running.
+    A caller whose fingerprint differs from the running task's (same
+    Idempotency-Key, different request) gets IdempotencyConflict.
+    """
+
+    def __init__(self, endpoint: str) -> None:
+        self.endpoint = endpoint
+        self._inflight: dict[str, tuple[asyncio.Task, Optional[str]]] = {}
+
+    async def run(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]],
+        fingerprint: Optional[str] = None,
+    ) -> Any:
+        entry = self._inflight.get(key)
+        if entry is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = (task, fingerprint)
+            task.add_done_callback(lambda _t: self._inflight.pop(key, None))
+            # Consume the exception if every caller has gone away.
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        else:
+            task, running = entry
+            if fingerprint is not None and running is not None and fingerprint != running:
+                raise IdempotencyConflict(key)
+            metrics.record_coalesced(self.endpoint)
+        return await asyncio.shield(task)
+
+    def inflight(self) -> int:
+        return len(self._inflight)
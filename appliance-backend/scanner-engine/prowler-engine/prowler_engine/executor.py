@@ -3,22 +3,24 @@
 from __future__ import annotations
 
 import asyncio
-import gc
 import importlib
 import logging
 import os
 import sys
+import threading
 import time
 import tracemalloc
 from argparse import Namespace
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Optional
+from collections import deque
+from typing import Any, Awaitable, Callable, Optional
 
 from .compliance_parser import parse_compliance_mappings
 from .context import build_provider_args
 from .metrics import metrics
 from .result_normalizer import extract_compliance_from_finding, normalize_finding
 from .settings import get_settings
+from .warm_cache import warm_cache
 
 _core = os.environ.get("PROWLER_CORE", "")
 if _core and _core not in sys.path:
@@ -26,6 +28,10 @@ if _core and _core not in sys.path:
 
 logger = logging.getLogger(__name__)
 
+_pool: ThreadPoolExecutor | None = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
 
 def _service_from_check(provider: str, check_name: str) -> str:
     service = check_name.split("_")[0]
@@ -61,6 +67,31 @@ def _init_provider(args: Namespace) -> Any:
     return Provider.get_global_provider()
 
 
+def _activate_provider(global_provider: Any) -> None:
+    from prowler.providers.common.provider import Provider
+
+    Provider.set_global_provider(global_provider)
+
+
+def _provider_cache_key(
+    provider: str,
+    region: Optional[str],
+    config_file: Optional[str],
+    kwargs: dict[str, Any],
+) -> tuple:
+    # Identity inputs only (profile, role, subscription, ...); services/checks don't change init.
+    identity = tuple(sorted((k, repr(v)) for k, v in kwargs.items()))
+    return (provider, region, config_file, identity)
+
+
+def _warm_provider(args: Namespace, key: tuple, ttl_seconds: int) -> Any:
+    global_provider, hit = warm_cache.provider(key, lambda: _init_provider(args), ttl_seconds)
+    if hit:
+        # Prowler resolves the provider globally; point it back at this scan's identity.
+        _activate_provider(global_provider)
+    return global_provider
+
+
 async def _collector_with_retry(
     provider: str,
     service: str,
@@ -88,6 +119,118 @@ async def _collector_with_retry(
     return []
 
 
+def _shared_pool(max_workers: int) -> ThreadPoolExecutor:
+    """Long-lived rule pool shared by all scans; rebuilt only if the worker count changes."""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != max_workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="prowler-rule")
+            _pool_workers = max_workers
+        return _pool
+
+
+class _ServiceRun:
+    """
+    Progress of one service inside a scan: queued checks, in-flight count, results,
+    and its timeout budget. The budget is charged only for the service's own busy
+    time (summed check durations) divided by the workers it can use (the pool size,
+    or fewer if it has fewer checks), i.e. the wall time it would have taken with
+    the pool to itself, so a service is not timed out for waiting its turn behind
+    other services. No single check may run longer than the whole timeout.
+    """
+
+    def __init__(self, name: str, check_names: list[str], timeout_seconds: int, workers: int = 1) -> None:
+        self.name = name
+        self.queued = deque(check_names)
+        self.timeout_seconds = timeout_seconds
+        self.workers = max(1, min(workers, len(check_names)))
+        self.in_flight = 0
+        self.results: list[dict[str, Any]] = []
+        self.findings = 0
+        self.started_at: float | None = None
+        self.timed_out = False
+        self.busy_seconds = 0.0
+        self._running: list[float] = []
+
+    def check_started(self) -> float:
+        started = time.perf_counter()
+        self._running.append(started)
+        return started
+
+    def check_finished(self, started: float) -> None:
+        self._running.remove(started)
+        self.busy_seconds += time.perf_counter() - started
+
+    def charged(self) -> float:
+        """Busy time of this service's checks so far, as wall time on the workers it can use."""
+        now = time.perf_counter()
+        return (self.busy_seconds + sum(now - started for started in self._running)) / self.workers
+
+    def remaining(self) -> float:
+        """Budget left before the service timeout."""
+        return self.timeout_seconds - self.charged()
+
+    def check_timeout(self, started: float) -> float:
+        """
+        Wall seconds the check started at `started` may still run: until the budget is
+        spent at the running checks' current rate, and never past timeout_seconds itself.
+        """
+        budget = max(0.0, self.remaining()) * self.workers / max(1, len(self._running))
+        return max(0.0, min(budget, self.timeout_seconds - (time.perf_counter() - started)))
+
+    @property
+    def done(self) -> bool:
+        return not self.queued and self.in_flight == 0
+
+
+class _CheckScheduler:
+    """
+    Hands out checks round-robin across services so every worker stays busy
+    until the last check of the scan, instead of idling at each service boundary.
+    Services that have spent their timeout budget stop receiving workers.
+    """
+
+    def __init__(self, services: list[_ServiceRun]) -> None:
+        self._active = deque(svc for svc in services if svc.queued)
+
+    def next(self) -> tuple[_ServiceRun, str] | None:
+        while self._active:
+            svc = self._active.popleft()
+            if svc.started_at is None:
+                svc.started_at = time.perf_counter()
+            elif svc.remaining() <= 0:
+                svc.timed_out = True
+                svc.queued.clear()
+                continue
+            check_name = svc.queued.popleft()
+            svc.in_flight += 1
+            if svc.queued:
+                self._active.append(svc)
+            return svc, check_name
+        return None
+
+
+async def _within_budget(svc: _ServiceRun, started: float, coro: Awaitable[Any]) -> Any:
+    """
+    Await coro (a check started at `started`), cancelling it (asyncio.TimeoutError)
+    once svc has spent its timeout budget or the check has run for the whole timeout.
+    """
+    task = asyncio.ensure_future(coro)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=svc.check_timeout(started))
+            if done:
+                return task.result()
+            # Re-check: the budget is spent more slowly if sibling checks finished meanwhile.
+            if svc.check_timeout(started) <= 0:
+                raise asyncio.TimeoutError
+    finally:
+        if not task.done():
+            task.cancel()
+
+
 def _timeout_result(provider: str, service: str, check_id: str, message: str) -> dict[str, Any]:
     return {
         "provider": provider,
@@ -119,7 +262,7 @@ async def _execute_rule(
     async with semaphore:
         metrics.inc_active_workers()
         try:
-            check_instance = await asyncio.to_thread(_import_check, provider, check_name)
+            check_instance = await asyncio.to_thread(warm_cache.check, provider, check_name, _import_check)
             if check_instance is None:
                 metrics.record_rule(time.perf_counter() - start, failed=True)
                 return []
@@ -165,9 +308,25 @@ async def run_scan_async(
     compliance: Optional[list[str]] = None,
     severity: Optional[list[str]] = None,
     config_file: Optional[str] = None,
+    on_event: Optional[Callable[[dict[str, Any]], Awaitable[None]]] = None,
     **kwargs: Any,
 ) -> list[dict[str, Any]]:
+    """
+    Run checks and return normalized findings. With on_event, results are
+    streamed instead: it is awaited with {"event": "started", services, checks}
+    once checks are known, {"event": "check", service, check_id, results} as
+    each check completes, and {"event": "results", results} for timeout/error
+    results; the return value is then empty.
+    """
     settings = get_settings()
+
+    async def _finish(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        if on_event is None:
+            return results
+        if results:
+            await on_event({"event": "results", "results": results})
+        return []
+
     args = build_provider_args(
         provider=provider,
         region=region,
@@ -182,9 +341,13 @@ async def run_scan_async(
 
     tracemalloc.start()
     try:
-        global_provider = _init_provider(args)
+        global_provider = _warm_provider(
+            args,
+            _provider_cache_key(provider, region, config_file, kwargs),
+            settings.provider_cache_ttl_seconds,
+        )
     except (Exception, SystemExit) as exc:
-        return [
+        return await _finish([
             {
                 "provider": provider,
                 "service": "engine",
@@ -198,12 +361,10 @@ async def run_scan_async(
                 "compliance": [],
                 "region": "",
             }
-        ]
+        ])
 
-    compliance_map = parse_compliance_mappings(provider)
+    compliance_map = warm_cache.compliance_map(provider, parse_compliance_mappings)
     semaphore = asyncio.Semaphore(settings.engine_max_workers)
-    cache_lock = asyncio.Lock()
-    service_cache: dict[str, list[str]] = {}
 
     async def _collect_services() -> dict[str, list[str]]:
         if checks:
@@ -232,21 +393,29 @@ async def run_scan_async(
                 result[svc] = check_names
         return result
 
-    async def _execute_service(service_name: str, check_names: list[str]) -> list[dict[str, Any]]:
-        start = time.perf_counter()
-        async with cache_lock:
-            service_cache[service_name] = list(check_names)
+    def _service_complete(svc: _ServiceRun) -> None:
+        elapsed = time.perf_counter() - (svc.started_at or time.perf_counter())
+        current_mem, peak_mem = tracemalloc.get_traced_memory()
+        logger.info(
+            "service_complete service=%s elapsed=%.3fs current_mem=%d peak_mem=%d findings=%d",
+            svc.name,
+            elapsed,
+            current_mem,
+            peak_mem,
+            svc.findings,
+        )
 
-        pool = ThreadPoolExecutor(max_workers=settings.engine_max_workers)
-        try:
-            flat: list[dict[str, Any]] = []
-            batch_size = max(1, settings.rule_batch_size)
-            for i in range(0, len(check_names), batch_size):
-                batch = check_names[i : i + batch_size]
-                tasks = [
+    async def _worker(scheduler: _CheckScheduler, pool: ThreadPoolExecutor) -> None:
+        while (item := scheduler.next()) is not None:
+            svc, check_name = item
+            started = svc.check_started()
+            try:
+                findings = await _within_budget(
+                    svc,
+                    started,
                     _execute_rule(
                         provider=provider,
-                        service=service_name,
+                        service=svc.name,
                         check_name=check_name,
                         global_provider=global_provider,
                         args=args,
@@ -254,58 +423,60 @@ async def run_scan_async(
                         semaphore=semaphore,
                         pool=pool,
                         rule_timeout_seconds=settings.rule_timeout_seconds,
-                    )
-                    for check_name in batch
-                ]
-                nested = await asyncio.gather(*tasks)
-                for chunk in nested:
-                    flat.extend(chunk)
-            elapsed = time.perf_counter() - start
-            current_mem, peak_mem = tracemalloc.get_traced_memory()
-            logger.info(
-                "service_complete service=%s elapsed=%.3fs current_mem=%d peak_mem=%d findings=%d",
-                service_name,
-                elapsed,
-                current_mem,
-                peak_mem,
-                len(flat),
-            )
-            return flat
-        finally:
-            pool.shutdown(wait=True, cancel_futures=True)
-            async with cache_lock:
-                service_cache.pop(service_name, None)
-            gc.collect()
+                    ),
+                )
+            except asyncio.TimeoutError:
+                svc.timed_out = True
+                svc.queued.clear()
+                continue
+            finally:
+                svc.check_finished(started)
+                svc.in_flight -= 1
+            svc.findings += len(findings)
+            last = svc.done and not svc.timed_out
+            if on_event is None:
+                svc.results.extend(findings)
+            else:
+                await on_event({"event": "check", "service": svc.name, "check_id": check_name, "results": findings})
+            if last:
+                _service_complete(svc)
 
     async def _orchestrate() -> list[dict[str, Any]]:
         service_map = await _collect_services()
+        services = [
+            _ServiceRun(name, check_names, settings.service_timeout_seconds, settings.engine_max_workers)
+            for name, check_names in service_map.items()
+        ]
+        scheduler = _CheckScheduler(services)
+        pool = _shared_pool(settings.engine_max_workers)
+        total_checks = sum(len(names) for names in service_map.values())
+        worker_count = max(1, min(settings.engine_max_workers, total_checks))
+        if on_event is not None:
+            await on_event({"event": "started", "services": len(services), "checks": total_checks})
+        await asyncio.gather(*(_worker(scheduler, pool) for _ in range(worker_count)))
+
         all_results: list[dict[str, Any]] = []
-        for service_name, check_names in service_map.items():
-            try:
-                svc_results = await asyncio.wait_for(
-                    _execute_service(service_name, check_names),
-                    timeout=settings.service_timeout_seconds,
-                )
-                all_results.extend(svc_results)
-            except asyncio.TimeoutError:
-                logger.warning("service_timeout service=%s timeout=%ss", service_name, settings.service_timeout_seconds)
+        for svc in services:
+            all_results.extend(svc.results)
+            if svc.timed_out:
+                logger.warning("service_timeout service=%s timeout=%ss", svc.name, settings.service_timeout_seconds)
                 all_results.append(
-                    _timeout_result(provider, service_name, "service_timeout", "Service execution timeout")
+                    _timeout_result(provider, svc.name, "service_timeout", "Service execution timeout")
                 )
-        return all_results
+        return await _finish(all_results)
 
     try:
         return await asyncio.wait_for(_orchestrate(), timeout=settings.global_timeout_seconds)
     except asyncio.TimeoutError:
         logger.warning("global_timeout timeout=%ss", settings.global_timeout_seconds)
-        return [
+        return await _finish([
             _timeout_result(
                 provider,
                 "engine",
                 "global_timeout",
                 "Global scan timeout exceeded; partial execution may have completed.",
             )
-        ]
+        ])
     finally:
         tracemalloc.stop()
 
@@ -0,0 +1,216 @@
+"""SQLite-backed job store: scan job status plus spilled results, paged by cursor."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+
+QUEUED, RUNNING, SUCCEEDED, FAILED = "queued", "running", "succeeded", "failed"
+TERMINAL = (SUCCEEDED, FAILED)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    request TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    checks_total INTEGER NOT NULL DEFAULT 0,
+    checks_done INTEGER NOT NULL DEFAULT 0,
+    findings INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    dedupe_key TEXT,
+    fingerprint TEXT
+);
+CREATE TABLE IF NOT EXISTS job_results (
+    job_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (job_id, seq)
+) WITHOUT ROWID;
+"""
+
+_JOB_COLUMNS = (
+    "id",
+    "status",
+    "request",
+    "created_at",
+    "started_at",
+    "finished_at",
+    "checks_total",
+    "checks_done",
+    "findings",
+    "error",
+    "dedupe_key",
+    "fingerprint",
+)
+
+
+class JobStore:
+    """
+    Results are appended as each check completes and read back in pages, so
+    memory does not grow with the number or size of outstanding jobs.
+    Result cursors are the sequence number of the last result returned.
+    Blocking; call from a worker thread (asyncio.to_thread) in async code.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def open(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                return
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            columns = {r[1] for r in conn.execute("PRAGMA table_info(jobs)")}
+            if "dedupe_key" not in columns:
+                conn.execute("ALTER TABLE jobs ADD COLUMN dedupe_key TEXT")
+            if "fingerprint" not in columns:
+                conn.execute("ALTER TABLE jobs ADD COLUMN fingerprint TEXT")
+            conn.execute("CREATE INDEX IF NOT EXISTS jobs_dedupe_key ON jobs (dedupe_key)")
+            self._conn = conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def create(
+        self,
+        job_id: str,
+        request: dict[str, Any],
+        dedupe_key: Optional[str] = None,
+        fingerprint: Optional[str] = None,
+    ) -> None:
+        with self._lock:
+            self._db().execute(
+                "INSERT INTO jobs (id, status, request, created_at, dedupe_key, fingerprint) VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, QUEUED, json.dumps(request, default=str), time.time(), dedupe_key, fingerprint),
+            )
+
+    def find(self, dedupe_key: str, include_finished: bool) -> Optional[tuple[str, Optional[str]]]:
+        """(id, fingerprint) of the newest job with this dedupe key; only queued/running ones unless include_finished."""
+        sql = "SELECT id, fingerprint FROM jobs WHERE dedupe_key = ?"
+        if not include_finished:
+            sql += " AND status IN (?, ?)"
+        sql += " ORDER BY created_at DESC LIMIT 1"
+        params = (dedupe_key,) if include_finished else (dedupe_key, QUEUED, RUNNING)
+        with self._lock:
+            row = self._db().execute(sql, params).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def mark_running(self, job_id: str) -> None:
+        with self._lock:
+            self._db().execute(
+                "UPDATE jobs SET status = ?, started_at = ? WHERE id = ?",
+                (RUNNING, time.time(), job_id),
+            )
+
+    def set_total(self, job_id: str, checks_total: int) -> None:
+        with self._lock:
+            self._db().execute("UPDATE jobs SET checks_total = ? WHERE id = ?", (checks_total, job_id))
+
+    def append(self, job_id: str, results: list[dict[str, Any]], check_done: bool) -> None:
+        """Spill one check's results and advance progress in a single transaction."""
+        with self._lock:
+            db = self._db()
+            db.execute("BEGIN")
+            try:
+                (seq,) = db.execute("SELECT findings FROM jobs WHERE id = ?", (job_id,)).fetchone()
+                db.executemany(
+                    "INSERT INTO job_results (job_id, seq, data) VALUES (?, ?, ?)",
+                    [
+                        (job_id, seq + i, json.dumps(result, default=str, separators=(",", ":")))
+                        for i, result in enumerate(results, start=1)
+                    ],
+                )
+                db.execute(
+                    "UPDATE jobs SET findings = findings + ?, checks_done = checks_done + ? WHERE id = ?",
+                    (len(results), int(check_done), job_id),
+                )
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+
+    def finish(self, job_id: str, status: str, error: Optional[str] = None) -> None:
+        with self._lock:
+            self._db().execute(
+                "UPDATE jobs SET status = ?, finished_at = ?, error = ? WHERE id = ?",
+                (status, time.time(), error, job_id),
+            )
+
+    def get(self, job_id: str) -> Optional[dict[str, Any]]:
+        with self._lock:
+            row = self._db().execute(
+                f"SELECT {', '.join(_JOB_COLUMNS)} FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        job = dict(zip(_JOB_COLUMNS, row))
+        job["request"] = json.loads(job["request"])
+        return job
+
+    def results(self, job_id: str, cursor: int = 0, limit: int = 500) -> dict[str, Any]:
+        """Page of results after cursor: {results, next_cursor, done}."""
+        with self._lock:
+            db = self._db()
+            rows = db.execute(
+                "SELECT seq, data FROM job_results WHERE job_id = ? AND seq > ? ORDER BY seq LIMIT ?",
+                (job_id, cursor, limit + 1),
+            ).fetchall()
+            (status,) = db.execute("SELECT status FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        more = len(rows) > limit
+        rows = rows[:limit]
+        return {
+            "results": [json.loads(data) for _, data in rows],
+            "next_cursor": rows[-1][0] if rows else cursor,
+            "done": status in TERMINAL and not more,
+        }
+
+    def fail_unfinished(self, reason: str) -> int:
+        """Mark jobs left queued/running by a previous process as failed."""
+        with self._lock:
+            cur = self._db().execute(
+                "UPDATE jobs SET status = ?, finished_at = ?, error = ? WHERE status IN (?, ?)",
+                (FAILED, time.time(), reason, QUEUED, RUNNING),
+            )
+        return cur.rowcount
+
+    def purge(self, max_age_seconds: float) -> int:
+        """Drop finished jobs (and their results) older than max_age_seconds."""
+        cutoff = time.time() - max_age_seconds
+        with self._lock:
+            db = self._db()
+            db.execute("BEGIN")
+            try:
+                expired = [
+                    r[0]
+                    for r in db.execute(
+                        "SELECT id FROM jobs WHERE status IN (?, ?) AND finished_at < ?",
+                        (*TERMINAL, cutoff),
+                    ).fetchall()
+                ]
+                for job_id in expired:
+                    db.execute("DELETE FROM job_results WHERE job_id = ?", (job_id,))
+                    db.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+        return len(expired)
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            raise RuntimeError("JobStore is not open")
+        return self._conn
@@ -26,7 +26,12 @@ class EngineSettings:
     queue_max_size: int
     queue_worker_count: int
     collector_retry_count: int
-    rule_batch_size: int
+    provider_cache_ttl_seconds: int
+    stream_heartbeat_seconds: int
+    job_store_path: str
+    job_retention_hours: int
+    job_results_page_size: int
+    infra_scan_page_size: int
     auth_token: str
     expected_rule_baseline: int
     expected_compliance_mappings_baseline: int
@@ -43,7 +48,12 @@ def get_settings() -> EngineSettings:
         queue_max_size=_env_int("ENGINE_QUEUE_MAX_SIZE", 128),
         queue_worker_count=_env_int("ENGINE_QUEUE_WORKERS", 2),
         collector_retry_count=_env_int("COLLECTOR_RETRY_COUNT", 2),
-        rule_batch_size=_env_int("RULE_BATCH_SIZE", 100),
+        provider_cache_ttl_seconds=_env_int("PROVIDER_CACHE_TTL_SECONDS", 900, minimum=0),
+        stream_heartbeat_seconds=_env_int("STREAM_HEARTBEAT_SECONDS", 15),
+        job_store_path=os.getenv("JOB_STORE_PATH", "/tmp/prowler-engine-jobs.sqlite3").strip(),
+        job_retention_hours=_env_int("JOB_RETENTION_HOURS", 24),
+        job_results_page_size=_env_int("JOB_RESULTS_PAGE_SIZE", 500),
+        infra_scan_page_size=_env_int("INFRA_SCAN_PAGE_SIZE", 0, minimum=0),
         auth_token=os.getenv("ENGINE_AUTH_TOKEN", "").strip(),
         expected_rule_baseline=_env_int("EXPECTED_RULE_BASELINE", 1, minimum=0),
         expected_compliance_mappings_baseline=_env_int(
@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+
+from prowler_engine.dedupe import IdempotencyConflict, RequestCoalescer, dedupe_key, scan_fingerprint
+from prowler_engine.job_store import JobStore, SUCCEEDED
+from prowler_engine.jobs import ScanJobs
+from prowler_engine.metrics import metrics
+from prowler_engine.scan_queue import ScanJobQueue
+
+
+def test_fingerprint_ignores_list_order_and_unrelated_fields():
+    a = {"provider": "aws", "checks": ["b", "a"], "region": "us-east-1", "role": "r"}
+    b = {"provider": "aws", "checks": ["a", "b"], "region": "us-east-1", "role": "r", "extra": 1}
+    assert scan_fingerprint(a) == scan_fingerprint(b)
+    assert scan_fingerprint(a) != scan_fingerprint({**a, "role": "other"})
+    assert dedupe_key(a, "abc") == "idem:abc"
+    assert dedupe_key(a, None) == f"fp:{scan_fingerprint(a)}"
+
+
+def test_coalescer_runs_identical_requests_once():
+    coalescer = RequestCoalescer("test-scan")
+    runs = []
+
+    async def scan():
+        runs.append(1)
+        await asyncio.sleep(0.02)
+        return ["finding"]
+
+    async def _scenario():
+        first = asyncio.ensure_future(coalescer.run("k", scan))
+        await asyncio.sleep(0)
+        # A caller giving up must not cancel the scan for the one that attached.
+        second = asyncio.ensure_future(coalescer.run("k", scan))
+        await asyncio.sleep(0)
+        first.cancel()
+        result = await second
+        after = await coalescer.run("k", scan)
+        return result, after
+
+    before = metrics.snapshot()["coalesced_requests"].get("test-scan", 0)
+    result, after = asyncio.run(_scenario())
+    assert result == after == ["finding"]
+    assert len(runs) == 2
+    assert metrics.snapshot()["coalesced_requests"]["test-scan"] == before + 1
+    assert 'engine_coalesced_requests_total{endpoint="test-scan"}' in metrics.prometheus_text()
+
+
+def test_jobs_attach_to_inflight_or_idempotent_job(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    store.open()
+    release = None
+
+    def job_factory(_on_event):
+        async def run():
+            await release.wait()
+            return []
+
+        return run
+
+    async def _scenario():
+        nonlocal release
+        release = asyncio.Event()
+        queue = ScanJobQueue(max_size=4, worker_count=1)
+        await queue.start()
+        jobs = ScanJobs(store, queue)
+        fp = dedupe_key({"provider": "aws"}, None)
+        first = await jobs.submit({"provider": "aws"}, job_factory, dedupe_key=fp)
+        again = await jobs.submit({"provider": "aws"}, job_factory, dedupe_key=fp)
+        keyed = await jobs.submit({"provider": "aws"}, job_factory, dedupe_key="idem:k1")
+        release.set()
+        while jobs.active():
+            await asyncio.sleep(0.01)
+        # Finished: a fingerprint starts a new job, an idempotency key still returns the old one.
+        after_fp = await jobs.submit({"provider": "aws"}, job_factory, dedupe_key=fp)
+        after_key = await jobs.submit({"provider": "aws"}, job_factory, dedupe_key="idem:k1")
+        while jobs.active():
+            await asyncio.sleep(0.01)
+        await queue.stop()
+        return first, again, keyed, after_fp, after_key
+
+    first, again, keyed, after_fp, after_key = asyncio.run(_scenario())
+    assert again == (first[0], True)
+    assert not keyed[1] and keyed[0] != first[0]
+    assert not after_fp[1] and after_fp[0] != first[0]
+    assert after_key == (keyed[0], True)
+    assert store.get(first[0])["status"] == SUCCEEDED
+
+
+def test_idempotency_key_reused_with_a_different_request_conflicts(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    store.open()
+    coalescer = RequestCoalescer("test-conflict")
+    aws = {"provider": "aws", "checks": ["a", "b"]}
+    other = {"provider": "aws", "checks": ["c"]}
+
+    def job_factory(_on_event):
+        async def run():
+            return []
+
+        return run
+
+    async def scan():
+        await asyncio.sleep(0.02)
+        return []
+
+    async def _scenario():
+        queue = ScanJobQueue(max_size=4, worker_count=1)
+        await queue.start()
+        jobs = ScanJobs(store, queue)
+        first = await jobs.submit(aws, job_factory, dedupe_key="idem:k1")
+        # Same body in another list order is the same request.
+        same = await jobs.submit({**aws, "checks": ["b", "a"]}, job_factory, dedupe_key="idem:k1")
+        with pytest.raises(IdempotencyConflict):
+            await jobs.submit(other, job_factory, dedupe_key="idem:k1")
+        while jobs.active():
+            await asyncio.sleep(0.01)
+        await queue.stop()
+
+        running = asyncio.ensure_future(coalescer.run("idem:k2", scan, fingerprint=scan_fingerprint(aws)))
+        await asyncio.sleep(0)
+        with pytest.raises(IdempotencyConflict):
+            await coalescer.run("idem:k2", scan, fingerprint=scan_fingerprint(other))
+        attached = await coalescer.run("idem:k2", scan, fingerprint=scan_fingerprint(aws))
+        await running
+        return first, same, attached
+
+    first, same, attached = asyncio.run(_scenario())
+    assert same == (first[0], True)
+    assert attached == []
+    assert store.get(first[0])["fingerprint"] == scan_fingerprint(aws)
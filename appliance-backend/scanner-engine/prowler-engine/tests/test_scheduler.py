@@ -0,0 +1,165 @@
+import asyncio
+import threading
+import time
+
+from prowler_engine.executor import _CheckScheduler, _ServiceRun, run_scan_async
+
+
+def _finding(check_id):
+    class Meta:
+        CheckID = check_id
+        ServiceName = check_id.split("_")[0]
+        Severity = type("S", (), {"value": "medium"})()
+        CheckTitle = "Title"
+        Risk = ""
+        Remediation = ""
+
+    class Finding:
+        status = "PASS"
+        check_metadata = Meta()
+        resource_id = "r1"
+        region = "us-east-1"
+        compliance = {}
+
+    return Finding()
+
+
+def _patch(monkeypatch, execute_sync, service_timeout=10, max_workers=2):
+    monkeypatch.setattr("prowler_engine.executor._import_check", lambda _p, name: name)
+    monkeypatch.setattr("prowler_engine.executor._init_provider", lambda _args: object())
+    monkeypatch.setattr("prowler_engine.executor._execute_check_sync", execute_sync)
+    monkeypatch.setattr("prowler_engine.executor.parse_compliance_mappings", lambda _p: {})
+    monkeypatch.setattr("prowler_engine.executor.get_settings", lambda: type(
+        "Cfg",
+        (),
+        {
+            "engine_max_workers": max_workers,
+            "collector_timeout_seconds": 5,
+            "collector_retry_count": 0,
+            "rule_timeout_seconds": 5,
+            "service_timeout_seconds": service_timeout,
+            "global_timeout_seconds": 15,
+            "provider_cache_ttl_seconds": 0,
+        },
+    )())
+
+
+def test_scheduler_round_robins_services():
+    iam = _ServiceRun("iam", ["iam_a", "iam_b", "iam_c"], 10)
+    s3 = _ServiceRun("s3", ["s3_a"], 10)
+    scheduler = _CheckScheduler([iam, s3])
+    order = []
+    while (item := scheduler.next()) is not None:
+        order.append(item[1])
+    assert order == ["iam_a", "s3_a", "iam_b", "iam_c"]
+    assert iam.in_flight == 3 and s3.in_flight == 1
+
+
+def test_services_run_concurrently(monkeypatch):
+    running = set()
+    overlap = []
+    lock = threading.Lock()
+
+    def execute_sync(check_name, _provider, _args):
+        with lock:
+            running.add(check_name.split("_")[0])
+            overlap.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.discard(check_name.split("_")[0])
+        return [_finding(check_name)]
+
+    _patch(monkeypatch, execute_sync)
+    results = asyncio.run(run_scan_async(provider="aws", checks=["iam_one", "s3_one"]))
+    assert [r["check_id"] for r in results] == ["iam_one", "s3_one"]
+    assert max(overlap) == 2
+
+
+def test_service_timeout_keeps_other_services(monkeypatch):
+    release = threading.Event()
+
+    def execute_sync(check_name, _provider, _args):
+        if check_name.startswith("ec2"):
+            # Released after the scan so the cancelled check frees its pool thread.
+            release.wait(0.5)
+        return [_finding(check_name)]
+
+    _patch(monkeypatch, execute_sync, service_timeout=0.2)
+    try:
+        results = asyncio.run(run_scan_async(provider="aws", checks=["ec2_slow", "ec2_next", "iam_fast"]))
+    finally:
+        release.set()
+    ids = [(r["service"], r["check_id"]) for r in results]
+    assert ("iam", "iam_fast") in ids
+    assert ("ec2", "service_timeout") in ids
+    assert ("ec2", "ec2_next") not in ids
+
+
+def test_large_service_is_not_charged_for_waiting_its_turn(monkeypatch):
+    # ec2 alone needs 12 x 0.05s / 2 workers = 0.3s; interleaved with the small
+    # services it spans ~0.6s of wall time, past the 0.45s service timeout.
+    def execute_sync(check_name, _provider, _args):
+        time.sleep(0.05)
+        return [_finding(check_name)]
+
+    _patch(monkeypatch, execute_sync, service_timeout=0.45)
+    large = [f"ec2_{i}" for i in range(12)]
+    small = [f"{svc}_{i}" for svc in ("iam", "s3", "kms", "rds") for i in range(3)]
+    start = time.perf_counter()
+    results = asyncio.run(run_scan_async(provider="aws", checks=large + small))
+    assert time.perf_counter() - start > 0.45
+    ids = [r["check_id"] for r in results]
+    assert "service_timeout" not in ids
+    assert sorted(ids) == sorted(large + small)
+
+
+def test_service_budget_counts_busy_time_per_worker():
+    svc = _ServiceRun("ec2", ["ec2_a", "ec2_b", "ec2_c", "ec2_d"], 10, workers=4)
+    first = svc.check_started()
+    second = svc.check_started()
+    time.sleep(0.1)
+    svc.check_finished(first)
+    svc.check_finished(second)
+    # Two checks busy for ~0.1s each on a 4-worker pool: ~0.05s charged.
+    assert 0.04 <= svc.charged() < 0.1
+    assert svc.remaining() > 9.9
+
+
+def test_service_budget_is_shared_only_by_workers_it_can_use():
+    svc = _ServiceRun("ec2", ["ec2_only"], 10, workers=8)
+    assert svc.workers == 1
+    started = svc.check_started()
+    assert 9.9 < svc.check_timeout(started) <= 10
+
+
+def test_single_slow_check_times_out_on_its_own_wall_time(monkeypatch):
+    # With the budget split over the whole 8-worker pool, the check would be
+    # allowed 8 x 0.2s and finish after 0.6s instead of timing out.
+    release = threading.Event()
+
+    def execute_sync(check_name, _provider, _args):
+        if check_name == "ec2_slow":
+            release.wait(0.6)
+        return [_finding(check_name)]
+
+    _patch(monkeypatch, execute_sync, service_timeout=0.2, max_workers=8)
+    start = time.perf_counter()
+    try:
+        results = asyncio.run(run_scan_async(provider="aws", checks=["ec2_slow", "iam_fast"]))
+        elapsed = time.perf_counter() - start
+    finally:
+        release.set()
+    assert elapsed < 0.5
+    ids = [(r["service"], r["check_id"]) for r in results]
+    assert ("ec2", "service_timeout") in ids
+    assert ("ec2", "ec2_slow") not in ids
+    assert ("iam", "iam_fast") in ids
+
+
+def test_hung_check_is_capped_at_the_service_timeout():
+    # Alone on an 8-worker budget the check could run ~8s; it is capped at the 1s timeout.
+    svc = _ServiceRun("ec2", [f"ec2_{i}" for i in range(8)], 1, workers=8)
+    hung = svc.check_started()
+    time.sleep(0.05)
+    assert svc.check_timeout(hung) <= 0.95
+    assert svc.check_timeout(hung - 1) == 0
@@ -0,0 +1,93 @@
+"""Background scan jobs: run through the scan queue, results spilled to the job store."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from typing import Any, Awaitable, Callable, Optional
+
+from .dedupe import IdempotencyConflict, scan_fingerprint
+from .job_store import FAILED, SUCCEEDED, JobStore
+from .metrics import metrics
+from .scan_queue import ScanJobQueue
+
+logger = logging.getLogger(__name__)
+
+OnEvent = Callable[[dict[str, Any]], Awaitable[None]]
+JobFactory = Callable[[OnEvent], Callable[[], Awaitable[Any]]]
+
+
+class ScanJobs:
+    """
+    submit() records a job and returns its id at once; the scan runs in the
+    background through the bounded ScanJobQueue, and its events (see
+    run_scan_async(on_event=...)) are written to the JobStore as they arrive.
+    With a dedupe key (see dedupe.dedupe_key), a matching job is returned
+    instead: any retained job for an Idempotency-Key, an in-flight one for a
+    request fingerprint. Reusing an Idempotency-Key with a request that
+    fingerprints differently raises IdempotencyConflict.
+    """
+
+    def __init__(self, store: JobStore, queue: ScanJobQueue) -> None:
+        self.store = store
+        self.queue = queue
+        self._tasks: set[asyncio.Task] = set()
+        self._submit_lock = asyncio.Lock()
+
+    async def submit(
+        self,
+        request: dict[str, Any],
+        job_factory: JobFactory,
+        dedupe_key: Optional[str] = None,
+    ) -> tuple[str, bool]:
+        """Returns (job_id, coalesced)."""
+        fingerprint = scan_fingerprint(request)
+        async with self._submit_lock:
+            if dedupe_key is not None:
+                existing = await asyncio.to_thread(
+                    self.store.find, dedupe_key, dedupe_key.startswith("idem:")
+                )
+                if existing is not None:
+                    existing_id, existing_fingerprint = existing
+                    # Jobs stored before fingerprints were recorded match any request.
+                    if existing_fingerprint is not None and existing_fingerprint != fingerprint:
+                        raise IdempotencyConflict(dedupe_key)
+                    metrics.record_coalesced("jobs")
+                    return existing_id, True
+            job_id = uuid.uuid4().hex
+            await asyncio.to_thread(self.store.create, job_id, request, dedupe_key, fingerprint)
+        task = asyncio.create_task(self._run(job_id, job_factory))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job_id, False
+
+    def active(self) -> int:
+        return len(self._tasks)
+
+    async def stop(self) -> None:
+        """Cancel background jobs; the store marks them failed on the next startup."""
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _run(self, job_id: str, job_factory: JobFactory) -> None:
+        async def on_event(event: dict[str, Any]) -> None:
+            if event["event"] == "started":
+                await asyncio.to_thread(self.store.set_total, job_id, event["checks"])
+            else:
+                await asyncio.to_thread(self.store.append, job_id, event["results"], event["event"] == "check")
+
+        run = job_factory(on_event)
+
+        async def _job() -> Any:
+            await asyncio.to_thread(self.store.mark_running, job_id)
+            return await run()
+
+        try:
+            await self.queue.submit(_job)
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("job_failed job_id=%s error=%s", job_id, exc)
+            await asyncio.to_thread(self.store.finish, job_id, FAILED, str(exc))
+            return
+        await asyncio.to_thread(self.store.finish, job_id, SUCCEEDED)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import threading
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -12,6 +12,7 @@ class _State:
     failed_rules_count: int = 0
     cumulative_rule_execution_time_seconds: float = 0.0
     active_workers: int = 0
+    coalesced_requests: dict[str, int] = field(default_factory=dict)
 
 
 class EngineMetrics:
@@ -34,7 +35,11 @@ class EngineMetrics:
             if failed:
                 self._state.failed_rules_count += 1
 
-    def snapshot(self) -> dict[str, float | int]:
+    def record_coalesced(self, endpoint: str) -> None:
+        with self._lock:
+            self._state.coalesced_requests[endpoint] = self._state.coalesced_requests.get(endpoint, 0) + 1
+
+    def snapshot(self) -> dict[str, float | int | dict[str, int]]:
         with self._lock:
             total = self._state.total_rules_executed
             avg = (
@@ -47,6 +52,7 @@ class EngineMetrics:
                 "failed_rules_count": self._state.failed_rules_count,
                 "average_rule_execution_time_seconds": avg,
                 "active_worker_count": self._state.active_workers,
+                "coalesced_requests": dict(self._state.coalesced_requests),
             }
 
     def prometheus_text(self) -> str:
@@ -65,6 +71,12 @@ class EngineMetrics:
                 "# HELP engine_active_worker_count Active worker count",
                 "# TYPE engine_active_worker_count gauge",
                 f"engine_active_worker_count {snap['active_worker_count']}",
+                "# HELP engine_coalesced_requests_total Scan requests attached to an identical in-flight scan",
+                "# TYPE engine_coalesced_requests_total counter",
+                *(
+                    f'engine_coalesced_requests_total{{endpoint="{endpoint}"}} {count}'
+                    for endpoint, count in sorted(snap["coalesced_requests"].items())
+                ),
                 "",
             ]
         )
@@ -7,17 +7,23 @@ import logging
 import time
 from typing import Any, Optional
 
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import PlainTextResponse
+from fastapi import FastAPI, Header, HTTPException, Query, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
 
 from .compatibility import validate_compatibility
 from .compliance_parser import get_framework_list, parse_compliance_mappings
+from .dedupe import IdempotencyConflict, RequestCoalescer, dedupe_key, scan_fingerprint
 from .executor import run_scan_async
+from .job_store import JobStore
+from .jobs import ScanJobs
 from .metrics import metrics
 from .rule_loader import discover_checks
 from .scan_queue import ScanJobQueue
 from .settings import get_settings
+from .streaming import NDJSON_MEDIA_TYPE, SSE_MEDIA_TYPE, ScanEventStream, encode_ndjson, encode_sse
+from .warm_cache import warm_cache
 from scanner.orchestrator import run_infra_scan
 
 logger = logging.getLogger(__name__)
@@ -26,8 +32,13 @@ scan_queue = ScanJobQueue(
     max_size=settings.queue_max_size,
     worker_count=settings.queue_worker_count,
 )
+job_store = JobStore(settings.job_store_path)
+scan_jobs = ScanJobs(job_store, scan_queue)
+scan_coalescer = RequestCoalescer("scan")
 compatibility_report: dict[str, object] = {}
 
+MAX_RESULTS_PAGE_SIZE = 5000
+
 app = FastAPI(title="Prowler Engine", version="1.1.0")
 
 
@@ -73,49 +84,46 @@ async def auth_placeholder_middleware(request: Request, call_next):
 
 
 @app.middleware("http")
-async def retry_timeout_middleware(request: Request, call_next):
-    max_attempts = 2
-    last_exc: Exception | None = None
-    for attempt in range(max_attempts):
-        try:
-            start = time.perf_counter()
-            response = await asyncio.wait_for(
-                call_next(request),
-                timeout=settings.engine_request_timeout_seconds,
-            )
-            elapsed = time.perf_counter() - start
-            logger.info("http_request path=%s status=%s elapsed=%.3fs", request.url.path, response.status_code, elapsed)
-            return response
-        except asyncio.TimeoutError as exc:
-            last_exc = exc
-            logger.warning("http_timeout path=%s attempt=%d", request.url.path, attempt + 1)
-            if attempt + 1 >= max_attempts:
-                raise HTTPException(status_code=504, detail="Request timeout exceeded") from exc
-        except Exception as exc:  # noqa: BLE001
-            last_exc = exc
-            if attempt + 1 >= max_attempts:
-                raise
-    raise HTTPException(status_code=500, detail=f"Request failed: {last_exc}")
+async def request_timeout_middleware(request: Request, call_next):
+    # Never re-run call_next: a retry would start a second scan. Clients retry
+    # with the same Idempotency-Key (or identical body) and attach to the first.
+    start = time.perf_counter()
+    try:
+        response = await asyncio.wait_for(
+            call_next(request),
+            timeout=settings.engine_request_timeout_seconds,
+        )
+    except asyncio.TimeoutError:
+        logger.warning("http_timeout path=%s", request.url.path)
+        return JSONResponse(status_code=504, content={"detail": "Request timeout exceeded"})
+    elapsed = time.perf_counter() - start
+    logger.info("http_request path=%s status=%s elapsed=%.3fs", request.url.path, response.status_code, elapsed)
+    return response
 
 
 @app.on_event("startup")
 async def _startup() -> None:
     global compatibility_report
     await scan_queue.start()
+    job_store.open()
+    job_store.fail_unfinished("Engine restarted before the job finished")
+    job_store.purge(settings.job_retention_hours * 3600)
     compatibility_report = validate_compatibility(settings)
 
 
 @app.on_event("shutdown")
 async def _shutdown() -> None:
+    await scan_jobs.stop()
     await scan_queue.stop()
+    job_store.close()
 
 
-@app.post("/scan", response_model=ScanResponse)
-async def run_scan_endpoint(req: ScanRequest) -> ScanResponse:
-    """Execute Prowler checks via direct Python import (no CLI)."""
+def _validate_provider(req: ScanRequest) -> None:
     if req.provider not in ("aws", "azure", "gcp", "kubernetes"):
         raise HTTPException(status_code=400, detail=f"Unsupported provider: {req.provider}")
 
+
+def _scan_job(req: ScanRequest, on_event=None):
     async def _job():
         return await run_scan_async(
             provider=req.provider,
@@ -125,17 +133,116 @@ async def run_scan_endpoint(req: ScanRequest) -> ScanResponse:
             compliance=req.compliance,
             severity=req.severity,
             config_file=req.config_file,
+            on_event=on_event,
             profile=req.profile,
             role=req.role,
         )
 
+    return _job
+
+
+@app.post("/scan", response_model=ScanResponse)
+async def run_scan_endpoint(
+    req: ScanRequest,
+    idempotency_key: Optional[str] = Header(None),
+) -> ScanResponse:
+    """
+    Execute Prowler checks via direct Python import (no CLI).
+    An identical request (or one with the same Idempotency-Key) arriving while
+    this scan runs waits for its result instead of starting another scan;
+    reusing a running scan's Idempotency-Key with a different request is a 422.
+    """
+    _validate_provider(req)
+    request = jsonable_encoder(req)
+    key = dedupe_key(request, idempotency_key)
     try:
-        results = await scan_queue.submit(_job)
+        results = await scan_coalescer.run(
+            key, lambda: scan_queue.submit(_scan_job(req)), fingerprint=scan_fingerprint(request)
+        )
         return ScanResponse(results=results)
+    except IdempotencyConflict as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
+@app.post("/scan/stream")
+async def stream_scan_endpoint(
+    req: ScanRequest,
+    request: Request,
+    fmt: Optional[str] = Query(None, alias="format"),
+) -> StreamingResponse:
+    """
+    Same scan as POST /scan, streamed as each check completes: one `finding`
+    event per result, `progress` after every check, `heartbeat` while idle,
+    and a final `complete` or `error`. NDJSON by default; server-sent events
+    with ?format=sse or Accept: text/event-stream.
+    """
+    _validate_provider(req)
+    sse = fmt == "sse" or (fmt is None and SSE_MEDIA_TYPE in request.headers.get("accept", ""))
+    encode = encode_sse if sse else encode_ndjson
+    stream = ScanEventStream()
+
+    async def _body():
+        async for event in stream.events(
+            lambda: scan_queue.submit(_scan_job(req, on_event=stream.emit)),
+            heartbeat_seconds=settings.stream_heartbeat_seconds,
+        ):
+            yield encode(event)
+
+    return StreamingResponse(
+        _body(),
+        media_type=SSE_MEDIA_TYPE if sse else NDJSON_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/jobs", status_code=202)
+async def create_job(
+    req: ScanRequest,
+    idempotency_key: Optional[str] = Header(None),
+) -> dict[str, Any]:
+    """
+    Queue a scan and return at once; poll GET /jobs/{id} and page GET /jobs/{id}/results.
+    Returns the existing job for a retained Idempotency-Key, or for an
+    identical request that is still queued or running (`coalesced: true`).
+    Reusing an Idempotency-Key with a different request is a 422.
+    """
+    _validate_provider(req)
+    await asyncio.to_thread(job_store.purge, settings.job_retention_hours * 3600)
+    request = jsonable_encoder(req)
+    try:
+        job_id, coalesced = await scan_jobs.submit(
+            request,
+            lambda on_event: _scan_job(req, on_event=on_event),
+            dedupe_key=dedupe_key(request, idempotency_key),
+        )
+    except IdempotencyConflict as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    job = await asyncio.to_thread(job_store.get, job_id)
+    return {"job_id": job_id, "status": job["status"] if job else "queued", "coalesced": coalesced}
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str) -> dict[str, Any]:
+    job = await asyncio.to_thread(job_store.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    return job
+
+
+@app.get("/jobs/{job_id}/results")
+async def get_job_results(
+    job_id: str,
+    cursor: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_RESULTS_PAGE_SIZE),
+) -> dict[str, Any]:
+    """Results spilled so far after `cursor`; pass back `next_cursor` until `done`."""
+    if await asyncio.to_thread(job_store.get, job_id) is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    return await asyncio.to_thread(job_store.results, job_id, cursor, limit or settings.job_results_page_size)
+
+
 @app.get("/checks")
 async def list_checks(provider: Optional[str] = None) -> dict[str, Any]:
     checks = discover_checks(provider)
@@ -154,7 +261,7 @@ async def list_compliance(provider: str) -> dict[str, Any]:
 
 @app.get("/compliance/{provider}/mappings")
 async def get_compliance_mappings(provider: str) -> dict[str, Any]:
-    return {"mappings": parse_compliance_mappings(provider)}
+    return {"mappings": warm_cache.compliance_map(provider, parse_compliance_mappings)}
 
 
 @app.get("/metrics")
@@ -167,7 +274,10 @@ async def health() -> dict[str, Any]:
     return {
         "status": "ok",
         "queue_size": scan_queue.size(),
+        "active_jobs": scan_jobs.active(),
+        "inflight_scans": scan_coalescer.inflight(),
         "compatibility": compatibility_report,
+        "warm_cache": warm_cache.stats(),
     }
 
 
@@ -179,6 +289,7 @@ async def infra_scan(req: InfraScanRequest) -> InfraScanResponse:
         role_arn=req.role_arn,
         regions=req.regions,
         scopes=req.scopes,
+        page_size=settings.infra_scan_page_size or None,
     )
     return InfraScanResponse(**result)
 
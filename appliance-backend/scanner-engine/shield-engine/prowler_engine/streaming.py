@@ -0,0 +1,109 @@
+"""Incremental scan result streaming as NDJSON or server-sent events."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+MAX_PENDING_EVENTS = 256
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+SSE_MEDIA_TYPE = "text/event-stream"
+
+
+class StreamClosed(Exception):
+    """The client went away; the scan feeding the stream should stop."""
+
+
+def encode_ndjson(event: dict[str, Any]) -> str:
+    return json.dumps(event, default=str, separators=(",", ":")) + "\n"
+
+
+def encode_sse(event: dict[str, Any]) -> str:
+    data = json.dumps(event, default=str, separators=(",", ":"))
+    return f"event: {event['event']}\ndata: {data}\n\n"
+
+
+class ScanEventStream:
+    """
+    Bridges executor events (run_scan_async(on_event=...)) to a client stream.
+    Findings are forwarded one per event as each check completes and never
+    accumulated; the bounded buffer makes a slow client slow the scan down
+    instead of growing memory. Emits progress after each check and a heartbeat
+    while nothing else happens (including while the job waits in the queue).
+    """
+
+    def __init__(self, max_pending: int = MAX_PENDING_EVENTS) -> None:
+        self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=max_pending)
+        self._closed = False
+        self._started_at = time.perf_counter()
+        self.checks_total = 0
+        self.checks_done = 0
+        self.findings = 0
+
+    async def emit(self, event: dict[str, Any]) -> None:
+        """on_event callback for run_scan_async."""
+        if self._closed:
+            raise StreamClosed()
+        await self._queue.put(event)
+
+    async def events(
+        self,
+        run: Callable[[], Awaitable[Any]],
+        heartbeat_seconds: float,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Run the scan and yield client events until it finishes; ends with `complete` or `error`."""
+        task = asyncio.ensure_future(run())
+        # The job may fail with StreamClosed after the client left; nobody else awaits it.
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        try:
+            while True:
+                getter = asyncio.ensure_future(self._queue.get())
+                done, _ = await asyncio.wait(
+                    {getter, task},
+                    timeout=heartbeat_seconds,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if getter in done:
+                    for out in self._expand(getter.result()):
+                        yield out
+                    continue
+                getter.cancel()
+                if task in done:
+                    while not self._queue.empty():
+                        for out in self._expand(self._queue.get_nowait()):
+                            yield out
+                    exc = task.exception()
+                    if exc is not None:
+                        yield {"event": "error", "detail": str(exc), **self._progress()}
+                    else:
+                        yield {"event": "complete", **self._progress()}
+                    return
+                yield {"event": "heartbeat", **self._progress()}
+        finally:
+            self._closed = True
+            # Unblock an executor worker waiting on a full buffer; its next emit raises StreamClosed.
+            while not self._queue.empty():
+                self._queue.get_nowait()
+
+    def _expand(self, event: dict[str, Any]) -> list[dict[str, Any]]:
+        kind = event["event"]
+        if kind == "started":
+            self.checks_total = event["checks"]
+            return [{"event": "started", "services": event["services"], **self._progress()}]
+        out = [{"event": "finding", "data": result} for result in event["results"]]
+        self.findings += len(out)
+        if kind == "check":
+            self.checks_done += 1
+            out.append({"event": "progress", "check_id": event["check_id"], **self._progress()})
+        return out
+
+    def _progress(self) -> dict[str, Any]:
+        return {
+            "checks_done": self.checks_done,
+            "checks_total": self.checks_total,
+            "findings": self.findings,
+            "elapsed_seconds": round(time.perf_counter() - self._started_at, 3),
+        }
@@ -0,0 +1,107 @@
+"""Process-wide warm cache for provider sessions, compliance maps and check instances."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Hashable
+
+# Re-initialize a cached provider this long before its credentials expire.
+CREDENTIAL_EXPIRY_MARGIN_SECONDS = 300
+
+
+def credential_expiry(global_provider: Any) -> float | None:
+    """Epoch seconds at which the provider's session credentials expire, if they do."""
+    session = getattr(getattr(global_provider, "session", None), "current_session", None)
+    if session is None:
+        return None
+    try:
+        credentials = session.get_credentials()
+    except Exception:  # noqa: BLE001
+        return None
+    expiry = getattr(credentials, "_expiry_time", None)
+    if expiry is None:
+        return None
+    return expiry.timestamp()
+
+
+class WarmCache:
+    """
+    Keeps state that is expensive to build and identical between scans:
+    initialized providers (until the TTL or credential expiry), compliance maps
+    parsed from disk, and instantiated check classes.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._providers: dict[Hashable, tuple[Any, float]] = {}
+        self._compliance: dict[str, dict[str, list[dict[str, str]]]] = {}
+        self._checks: dict[tuple[str, str], Any] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def provider(self, key: Hashable, factory: Callable[[], Any], ttl_seconds: int) -> tuple[Any, bool]:
+        """Cached provider for key, or factory() stored until it expires. Returns (provider, hit)."""
+        now = time.time()
+        with self._lock:
+            entry = self._providers.get(key)
+            if entry is not None and entry[1] > now:
+                self._hits += 1
+                return entry[0], True
+            self._providers.pop(key, None)
+            self._misses += 1
+
+        # Init runs outside the lock; failures are not cached.
+        global_provider = factory()
+        if ttl_seconds > 0:
+            expires_at = now + ttl_seconds
+            cred_expiry = credential_expiry(global_provider)
+            if cred_expiry is not None:
+                expires_at = min(expires_at, cred_expiry - CREDENTIAL_EXPIRY_MARGIN_SECONDS)
+            if expires_at > now:
+                with self._lock:
+                    self._providers[key] = (global_provider, expires_at)
+        return global_provider, False
+
+    def compliance_map(
+        self,
+        provider: str,
+        loader: Callable[[str], dict[str, list[dict[str, str]]]],
+    ) -> dict[str, list[dict[str, str]]]:
+        """Compliance map for provider, parsed once per process."""
+        with self._lock:
+            cached = self._compliance.get(provider)
+        if cached is not None:
+            return cached
+        mapping = loader(provider)
+        with self._lock:
+            return self._compliance.setdefault(provider, mapping)
+
+    def check(self, provider: str, check_name: str, loader: Callable[[str, str], Any]) -> Any:
+        """Check instance, imported and instantiated once per process (None if missing)."""
+        key = (provider, check_name)
+        with self._lock:
+            if key in self._checks:
+                return self._checks[key]
+        instance = loader(provider, check_name)
+        with self._lock:
+            return self._checks.setdefault(key, instance)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._providers.clear()
+            self._compliance.clear()
+            self._checks.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "providers": len(self._providers),
+                "provider_hits": self._hits,
+                "provider_misses": self._misses,
+                "compliance_maps": len(self._compliance),
+                "checks": len(self._checks),
+            }
+
+
+warm_cache = WarmCache()
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+from .inventory import iter_pages
+
+# Values per image-id filter in one DescribeImages request (EC2 filter value limit).
+DESCRIBE_IMAGES_BATCH = 200
+
+# AMI attributes such as CreationDate never change; a day bounds stale "not found" entries.
+DEFAULT_TTL_SECONDS = 24 * 3600
+
+
+class AmiResolver:
+    """Process-wide cache of AMI metadata, shared by every region and scan.
+
+    resolve() looks up only the image IDs it has not seen within the TTL and
+    fetches them in batches of DESCRIBE_IMAGES_BATCH, so resolving the AMIs
+    of N instances costs one call per DESCRIBE_IMAGES_BATCH distinct AMIs.
+    Lookups use an image-id filter rather than ImageIds, which would fail the
+    whole batch on one deregistered AMI; IDs EC2 does not return are cached
+    as None.
+    """
+
+    def __init__(self, ttl_seconds: int = DEFAULT_TTL_SECONDS, max_entries: int = 50_000) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._images: Dict[Hashable, Tuple[Optional[Dict[str, Any]], float]] = {}
+        self.api_calls = 0
+
+    def resolve(
+        self,
+        ec2: Any,
+        account_id: str,
+        region: str,
+        image_ids: Iterable[str],
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Image description (or None if not visible) for each distinct image ID."""
+        now = time.time()
+        resolved: Dict[str, Optional[Dict[str, Any]]] = {}
+        missing = []
+        with self._lock:
+            for image_id in dict.fromkeys(image_ids):
+                entry = self._images.get((account_id, region, image_id))
+                if entry is not None and entry[1] > now:
+                    resolved[image_id] = entry[0]
+                else:
+                    missing.append(image_id)
+
+        # Fetched outside the lock; a failed batch raises and caches nothing.
+        for start in range(0, len(missing), DESCRIBE_IMAGES_BATCH):
+            batch = missing[start : start + DESCRIBE_IMAGES_BATCH]
+            found = {image_id: None for image_id in batch}
+            for page in iter_pages(
+                ec2,
+                "describe_images",
+                Filters=[{"Name": "image-id", "Values": batch}],
+                IncludeDeprecated=True,
+            ):
+                with self._lock:
+                    self.api_calls += 1
+                for image in page.get("Images", []):
+                    found[image["ImageId"]] = image
+            resolved.update(found)
+            self._store(account_id, region, found)
+        return resolved
+
+    def clear(self) -> None:
+        with self._lock:
+            self._images.clear()
+
+    def _store(self, account_id: str, region: str, images: Dict[str, Optional[Dict[str, Any]]]) -> None:
+        now = time.time()
+        expires_at = now + self.ttl_seconds
+        with self._lock:
+            if len(self._images) + len(images) > self.max_entries:
+                self._images = {k: v for k, v in self._images.items() if v[1] > now}
+                if len(self._images) + len(images) > self.max_entries:
+                    self._images.clear()
+            for image_id, image in images.items():
+                self._images[(account_id, region, image_id)] = (image, expires_at)
+
+
+ami_resolver = AmiResolver()
@@ -3,13 +3,20 @@ from __future__ import annotations
 import asyncio
 import logging
 import random
+import threading
 import time
 from dataclasses import dataclass, asdict
-from typing import Any, Dict, Iterable, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
 
 import boto3
+import botocore.session
+from botocore.credentials import RefreshableCredentials
 from botocore.exceptions import ClientError
 
+from .inventory import iter_pages
+
+if TYPE_CHECKING:
+    from .scan_context import ScanContext
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +48,14 @@ class Finding:
 
 
 class AwsSessionFactory:
-    """Creates boto3 sessions, supporting optional AssumeRole."""
+    """Creates boto3 sessions, supporting optional AssumeRole.
+
+    The role is assumed once per factory. Its credentials are botocore
+    RefreshableCredentials, which call AssumeRole again shortly before they
+    expire, so every scanner and region shares one STS session. Each call
+    still returns its own boto3.Session (sessions are not thread-safe); they
+    share the credentials and the botocore data loader, so building one is cheap.
+    """
 
     def __init__(
         self,
@@ -49,27 +63,55 @@ class AwsSessionFactory:
         role_arn: Optional[str] = None,
         session_name: str = "nimbus-guard-infra-scan",
         base_session: Optional[boto3.Session] = None,
+        duration_seconds: int = 3600,
     ) -> None:
         self.account_id = account_id
         self.role_arn = role_arn
         self.session_name = session_name
+        self.duration_seconds = duration_seconds
         self._base_session = base_session or boto3.Session()
+        self._lock = threading.Lock()
+        self._credentials: Optional[RefreshableCredentials] = None
+        self._loader = None
+        self._sts = None
 
     def create_session(self) -> boto3.Session:
         if not self.role_arn:
             return self._base_session
 
-        sts = self._base_session.client("sts")
-        resp = sts.assume_role(
+        with self._lock:
+            if self._credentials is None:
+                self._sts = self._base_session.client("sts")
+                self._credentials = RefreshableCredentials.create_from_metadata(
+                    metadata=self._assume_role(),
+                    refresh_using=self._assume_role,
+                    method="sts-assume-role",
+                )
+                self._loader = self._base_session._session.get_component("data_loader")
+
+        botocore_session = botocore.session.Session()
+        botocore_session._credentials = self._credentials
+        botocore_session.register_component("data_loader", self._loader)
+        return boto3.Session(
+            botocore_session=botocore_session,
+            region_name=self._base_session.region_name,
+        )
+
+    def _assume_role(self) -> Dict[str, str]:
+        """AssumeRole call in the metadata shape RefreshableCredentials expects."""
+        resp = self._sts.assume_role(
             RoleArn=self.role_arn,
             RoleSessionName=self.session_name,
+            DurationSeconds=self.duration_seconds,
         )
         creds = resp["Credentials"]
-        return boto3.Session(
-            aws_access_key_id=creds["AccessKeyId"],
-            aws_secret_access_key=creds["SecretAccessKey"],
-            aws_session_token=creds["SessionToken"],
-        )
+        logger.info("assume_role role_arn=%s expires=%s", self.role_arn, creds["Expiration"])
+        return {
+            "access_key": creds["AccessKeyId"],
+            "secret_key": creds["SecretAccessKey"],
+            "token": creds["SessionToken"],
+            "expiry_time": creds["Expiration"].isoformat(),
+        }
 
 
 class BaseScanner:
@@ -79,12 +121,12 @@ class BaseScanner:
 
     def __init__(
         self,
-        session_factory: AwsSessionFactory,
-        regions: Iterable[str],
+        context: "ScanContext",
+        regions: Optional[Iterable[str]] = None,
         max_concurrent_regions: int = 5,
     ) -> None:
-        self.session_factory = session_factory
-        self.regions = list(regions)
+        self.context = context
+        self.regions = list(regions) if regions is not None else list(context.regions)
         self.max_concurrent_regions = max_concurrent_regions
 
     async def scan(self) -> List[Finding]:
@@ -104,8 +146,7 @@ class BaseScanner:
     ) -> List[Finding]:
         async with semaphore:
             try:
-                session = self.session_factory.create_session()
-                return await asyncio.to_thread(self.scan_region, session, region)
+                return await asyncio.to_thread(self.scan_region, region)
             except Exception as exc:  # noqa: BLE001
                 logger.exception(
                     "scanner_region_error category=%s region=%s error=%s",
@@ -115,14 +156,22 @@ class BaseScanner:
                 )
                 return []
 
-    # Subclasses implement this synchronously using boto3.
-    def scan_region(self, session: boto3.Session, region: str) -> List[Finding]:
+    # Subclasses implement this synchronously using boto3 clients from self._client.
+    def scan_region(self, region: str) -> List[Finding]:
         raise NotImplementedError
 
     # ---- AWS helpers ----
 
-    def _client(self, session: boto3.Session, service: str, region: str):
-        return session.client(service, region_name=region)
+    @property
+    def account_id(self) -> str:
+        return self.context.account_id
+
+    def _client(self, service: str, region: Optional[str] = None):
+        return self.context.client(service, region)
+
+    def _inventory(self, service: str, operation: str, result_key: str, region: Optional[str] = None, **params):
+        """Items from the run-scoped inventory, shared with other scanners and rules."""
+        return self.context.inventory.items(service, operation, result_key, region, **params)
 
     def _call_aws(
         self,
@@ -162,10 +211,9 @@ class BaseScanner:
         result_key: str,
         **kwargs,
     ):
-        paginator = client.get_paginator(method_name)
-        for page in paginator.paginate(**kwargs):
-            for item in page.get(result_key, []):
-                yield item
+        """Stream items page by page, PageSize from the scan context."""
+        for page in iter_pages(client, method_name, self.context.page_size, **kwargs):
+            yield from page.get(result_key, [])
 
 
 def compute_risk_score(findings: List[Finding]) -> Dict[str, Any]:
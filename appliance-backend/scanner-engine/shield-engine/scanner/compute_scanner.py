@@ -3,8 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 from typing import List
 
-import boto3
-
+from .ami_resolver import ami_resolver
 from .base_scanner import BaseScanner, Finding
 
 
@@ -13,54 +12,56 @@ class ComputeScanner(BaseScanner):
 
     category = "Compute"
 
-    def scan_region(self, session: boto3.Session, region: str) -> List[Finding]:
-        ec2 = self._client(session, "ec2", region)
-        ssm = self._client(session, "ssm", region)
-        sts = session.client("sts")
-        account_id = sts.get_caller_identity()["Account"]
+    def scan_region(self, region: str) -> List[Finding]:
+        ec2 = self._client("ec2", region)
+        ssm = self._client("ssm", region)
+        account_id = self.account_id
         findings: List[Finding] = []
 
         now = datetime.now(timezone.utc)
         outdated_ami_threshold = now - timedelta(days=365)
 
-        reservations = ec2.describe_instances().get("Reservations", [])
-        for res in reservations:
-            for inst in res.get("Instances", []):
-                instance_id = inst["InstanceId"]
-                image_id = inst.get("ImageId", "")
+        instances = [
+            inst
+            for res in self._inventory("ec2", "describe_instances", "Reservations", region)
+            for inst in res.get("Instances", [])
+        ]
+
+        # Outdated AMIs – heuristic based on image creation date, one lookup per distinct AMI.
+        try:
+            images = ami_resolver.resolve(
+                ec2, account_id, region, (inst["ImageId"] for inst in instances if inst.get("ImageId"))
+            )
+        except Exception:  # noqa: BLE001
+            # Do not fail the scan if describe_images is restricted.
+            images = {}
 
-                # Outdated AMIs – heuristic based on image creation date.
-                if image_id:
-                    try:
-                        images = ec2.describe_images(ImageIds=[image_id])["Images"]
-                        if images:
-                            created = images[0].get("CreationDate")
-                            if created:
-                                created_at = datetime.fromisoformat(created.replace("Z", "+00:00"))
-                                if created_at < outdated_ami_threshold:
-                                    findings.append(
-                                        Finding(
-                                            account_id=account_id,
-                                            region=region,
-                                            resource_id=instance_id,
-                                            resource_type="ec2_instance",
-                                            service="ec2",
-                                            issue="EC2 instance is running on an AMI older than 12 months",
-                                            severity="medium",
-                                            remediation="Rebuild instances on current hardened AMIs and apply patches.",
-                                            compliance_mapping=["AWS-COMP-AMI-AGE"],
-                                            category=self.category,
-                                            raw={"instance": inst, "image": images[0]},
-                                        )
-                                    )
-                    except Exception:  # noqa: BLE001
-                        # Do not fail the scan if describe_images is restricted.
-                        pass
+        for inst in instances:
+            image = images.get(inst.get("ImageId", ""))
+            created = image.get("CreationDate") if image else None
+            if not created:
+                continue
+            created_at = datetime.fromisoformat(created.replace("Z", "+00:00"))
+            if created_at < outdated_ami_threshold:
+                findings.append(
+                    Finding(
+                        account_id=account_id,
+                        region=region,
+                        resource_id=inst["InstanceId"],
+                        resource_type="ec2_instance",
+                        service="ec2",
+                        issue="EC2 instance is running on an AMI older than 12 months",
+                        severity="medium",
+                        remediation="Rebuild instances on current hardened AMIs and apply patches.",
+                        compliance_mapping=["AWS-COMP-AMI-AGE"],
+                        category=self.category,
+                        raw={"instance": inst, "image": image},
+                    )
+                )
 
         # Patch compliance via SSM – basic check for managed instances.
         try:
-            managed_instances = ssm.describe_instance_information()["InstanceInformationList"]
-            for mi in managed_instances:
+            for mi in self._paginate(ssm, "describe_instance_information", "InstanceInformationList"):
                 if mi.get("PingStatus") != "Online":
                     continue
                 # If SSM has no platform details or agent is old, flag for review.
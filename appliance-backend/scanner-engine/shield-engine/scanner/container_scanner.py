@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from typing import List
 
-import boto3
-
 from .base_scanner import BaseScanner, Finding
 
 
@@ -12,16 +10,14 @@ class ContainerScanner(BaseScanner):
 
     category = "Container"
 
-    def scan_region(self, session: boto3.Session, region: str) -> List[Finding]:
-        sts = session.client("sts")
-        account_id = sts.get_caller_identity()["Account"]
+    def scan_region(self, region: str) -> List[Finding]:
+        account_id = self.account_id
         findings: List[Finding] = []
 
         # ECR checks
-        ecr = self._client(session, "ecr", region)
+        ecr = self._client("ecr", region)
         try:
-            repos = ecr.describe_repositories()["repositories"]
-            for repo in repos:
+            for repo in self._paginate(ecr, "describe_repositories", "repositories"):
                 if repo.get("imageScanningConfiguration", {}).get("scanOnPush") is False:
                     findings.append(
                         Finding(
@@ -69,7 +65,7 @@ class ContainerScanner(BaseScanner):
             pass
 
         # EKS checks – public endpoint exposure and basic RBAC indicators.
-        eks = self._client(session, "eks", region)
+        eks = self._client("eks", region)
         try:
             clusters = eks.list_clusters()["clusters"]
             for name in clusters:
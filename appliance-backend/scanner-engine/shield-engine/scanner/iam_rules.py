@@ -3,14 +3,13 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 from typing import List
 
-import boto3
-
 from .privilege_escalation_analyzer import ESCALATION_ACTIONS
 from .rule_engine import RuleCategory, RuleDefinition, RuleResult
+from .scan_context import ScanContext
 
 
-def _wildcard_policy_detector(session: boto3.Session, region: str, account_id: str) -> List[RuleResult]:
-  iam = session.client("iam")
+def _wildcard_policy_detector(context: ScanContext, region: str) -> List[RuleResult]:
+  iam = context.client("iam")
   results: List[RuleResult] = []
 
   paginator = iam.get_paginator("list_policies")
@@ -48,11 +47,11 @@ def _wildcard_policy_detector(session: boto3.Session, region: str, account_id: s
   return results
 
 
-def _admin_no_mfa_detector(session: boto3.Session, region: str, account_id: str) -> List[RuleResult]:
-  iam = session.client("iam")
+def _admin_no_mfa_detector(context: ScanContext, region: str) -> List[RuleResult]:
+  iam = context.client("iam")
   results: List[RuleResult] = []
 
-  users = iam.list_users()["Users"]
+  users = context.inventory.items("iam", "list_users", "Users")
   for user in users:
     username = user["UserName"]
     attached = iam.list_attached_user_policies(UserName=username)["AttachedPolicies"]
@@ -81,8 +80,8 @@ def _admin_no_mfa_detector(session: boto3.Session, region: str, account_id: str)
   return results
 
 
-def _inactive_keys_detector(session: boto3.Session, region: str, account_id: str) -> List[RuleResult]:
-  iam = session.client("iam")
+def _inactive_keys_detector(context: ScanContext, region: str) -> List[RuleResult]:
+  iam = context.client("iam")
   results: List[RuleResult] = []
 
   try:
@@ -147,8 +146,8 @@ def _inactive_keys_detector(session: boto3.Session, region: str, account_id: str
   return results
 
 
-def _priv_escalation_detector(session: boto3.Session, region: str, account_id: str) -> List[RuleResult]:
-  iam = session.client("iam")
+def _priv_escalation_detector(context: ScanContext, region: str) -> List[RuleResult]:
+  iam = context.client("iam")
   results: List[RuleResult] = []
 
   paginator = iam.get_paginator("list_policies")
@@ -191,8 +190,9 @@ def _priv_escalation_detector(session: boto3.Session, region: str, account_id: s
   return results
 
 
-def _cross_account_role_detector(session: boto3.Session, region: str, account_id: str) -> List[RuleResult]:
-  iam = session.client("iam")
+def _cross_account_role_detector(context: ScanContext, region: str) -> List[RuleResult]:
+  iam = context.client("iam")
+  account_id = context.account_id
   results: List[RuleResult] = []
 
   roles = iam.list_roles()["Roles"]
@@ -3,8 +3,6 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 from typing import List
 
-import boto3
-
 from .base_scanner import BaseScanner, Finding
 from .privilege_escalation_analyzer import analyze_policies_for_escalation
 
@@ -14,14 +12,13 @@ class IamScanner(BaseScanner):
 
     category = "IAM"
 
-    def scan_region(self, session: boto3.Session, region: str) -> List[Finding]:
+    def scan_region(self, region: str) -> List[Finding]:
         # IAM is global; we only execute once in a single pseudo-region.
         if region != "us-east-1":
             return []
 
-        iam = session.client("iam")
-        sts = session.client("sts")
-        account_id = sts.get_caller_identity()["Account"]
+        iam = self._client("iam")
+        account_id = self.account_id
         findings: List[Finding] = []
 
         # Over-permissive policies and privilege escalation.
@@ -54,7 +51,7 @@ class IamScanner(BaseScanner):
         findings.extend(analyze_policies_for_escalation(account_id, policies))
 
         # Admin users without MFA and access keys > 90 days.
-        users = iam.list_users()["Users"]
+        users = self._inventory("iam", "list_users", "Users")
         credential_report = self._get_credential_report(iam)
         ninety_days_ago = datetime.now(timezone.utc) - timedelta(days=90)
 
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional
+
+from botocore.exceptions import PaginationError
+
+logger = logging.getLogger(__name__)
+
+# Accepted page-size range per operation; a configured PageSize is clamped into it.
+_PAGE_SIZE_LIMITS: Dict[tuple, tuple] = {
+    ("ec2", "describe_instances"): (5, 1000),
+    ("ec2", "describe_security_groups"): (5, 1000),
+    ("ec2", "describe_volumes"): (5, 1000),
+    ("ec2", "describe_snapshots"): (5, 1000),
+    ("rds", "describe_db_instances"): (20, 100),
+    ("ssm", "describe_instance_information"): (5, 50),
+    ("ecr", "describe_repositories"): (1, 1000),
+    ("iam", "list_users"): (1, 1000),
+    ("iam", "list_policies"): (1, 1000),
+}
+
+
+def iter_pages(client: Any, operation: str, page_size: Optional[int] = None, **params: Any) -> Iterator[Dict[str, Any]]:
+    """Lazily yield response pages, requesting page_size items per call where supported."""
+    if not client.can_paginate(operation):
+        yield getattr(client, operation)(**params)
+        return
+    paginator = client.get_paginator(operation)
+    if page_size:
+        service = client.meta.service_model.service_name
+        low, high = _PAGE_SIZE_LIMITS.get((service, operation), (1, page_size))
+        config = dict(params.get("PaginationConfig") or {})
+        config["PageSize"] = min(max(page_size, low), high)
+        try:
+            pages = paginator.paginate(**{**params, "PaginationConfig": config})
+        except PaginationError:
+            # Operation has no page-size parameter.
+            pages = paginator.paginate(**params)
+    else:
+        pages = paginator.paginate(**params)
+    yield from pages
+
+
+class _Fetch:
+    """Items of one inventory fetch, published page by page."""
+
+    __slots__ = ("cond", "items", "done", "error")
+
+    def __init__(self) -> None:
+        self.cond = threading.Condition()
+        self.items: List[Dict[str, Any]] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+
+
+class Inventory:
+    """Run-scoped snapshot of AWS list/describe results.
+
+    Each (service, operation, region, params) is fetched once per run, across
+    all pages, and served to every scanner and rule that asks for it. The
+    fetch runs on a background thread and publishes each page as it arrives,
+    so callers evaluate page N while page N+1 is in flight; callers that come
+    later replay the buffered items. A failed fetch is not kept, so the next
+    caller retries it.
+    """
+
+    def __init__(
+        self,
+        client_for: Callable[[str, Optional[str]], Any],
+        page_size: Optional[int] = None,
+        max_fetchers: int = 16,
+    ) -> None:
+        self._client_for = client_for
+        self.page_size = page_size
+        self._lock = threading.Lock()
+        self._fetches: Dict[Hashable, _Fetch] = {}
+        self._pool = ThreadPoolExecutor(max_workers=max_fetchers, thread_name_prefix="inventory")
+        self.api_calls = 0
+
+    def items(
+        self,
+        service: str,
+        operation: str,
+        result_key: str,
+        region: Optional[str] = None,
+        **params: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream all items under result_key for the operation (callers must not mutate them)."""
+        key = (service, operation, region, result_key, _freeze(params))
+        with self._lock:
+            fetch = self._fetches.get(key)
+            if fetch is None:
+                fetch = self._fetches[key] = _Fetch()
+                self._pool.submit(self._fetch, key, fetch, service, operation, result_key, region, params)
+        return self._follow(fetch)
+
+    def close(self) -> None:
+        """Stop the fetch threads once in-flight fetches finish; buffered items stay readable."""
+        self._pool.shutdown(wait=False)
+
+    @staticmethod
+    def _follow(fetch: _Fetch) -> Iterator[Dict[str, Any]]:
+        position = 0
+        while True:
+            with fetch.cond:
+                while position >= len(fetch.items) and not fetch.done:
+                    fetch.cond.wait()
+                batch = fetch.items[position:]
+                done, error = fetch.done, fetch.error
+            position += len(batch)
+            yield from batch
+            if done:
+                if error is not None:
+                    raise error
+                return
+
+    def _fetch(
+        self,
+        key: Hashable,
+        fetch: _Fetch,
+        service: str,
+        operation: str,
+        result_key: str,
+        region: Optional[str],
+        params: Dict[str, Any],
+    ) -> None:
+        try:
+            client = self._client_for(service, region)
+            for page in iter_pages(client, operation, self.page_size, **params):
+                with self._lock:
+                    self.api_calls += 1
+                with fetch.cond:
+                    fetch.items.extend(page.get(result_key, []))
+                    fetch.cond.notify_all()
+        except BaseException as exc:  # noqa: BLE001 - handed to the callers
+            with self._lock:
+                self._fetches.pop(key, None)
+            with fetch.cond:
+                fetch.error = exc
+                fetch.done = True
+                fetch.cond.notify_all()
+            return
+        with fetch.cond:
+            fetch.done = True
+            fetch.cond.notify_all()
+        logger.debug(
+            "inventory_fetch service=%s operation=%s region=%s items=%d",
+            service,
+            operation,
+            region,
+            len(fetch.items),
+        )
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from typing import List
 
-import boto3
-
 from .base_scanner import BaseScanner, Finding
 
 
@@ -12,13 +10,12 @@ class MonitoringScanner(BaseScanner):
 
     category = "Monitoring"
 
-    def scan_region(self, session: boto3.Session, region: str) -> List[Finding]:
-        sts = session.client("sts")
-        account_id = sts.get_caller_identity()["Account"]
+    def scan_region(self, region: str) -> List[Finding]:
+        account_id = self.account_id
         findings: List[Finding] = []
 
         # CloudTrail
-        ct = self._client(session, "cloudtrail", region)
+        ct = self._client("cloudtrail", region)
         try:
             trails = ct.describe_trails(includeShadowTrails=False)["trailList"]
             if not trails:
@@ -41,7 +38,7 @@ class MonitoringScanner(BaseScanner):
             pass
 
         # GuardDuty
-        gd = self._client(session, "guardduty", region)
+        gd = self._client("guardduty", region)
         try:
             detectors = gd.list_detectors()["DetectorIds"]
             if not detectors:
@@ -64,7 +61,7 @@ class MonitoringScanner(BaseScanner):
             pass
 
         # AWS Config
-        cfg = self._client(session, "config", region)
+        cfg = self._client("config", region)
         try:
             recorders = cfg.describe_configuration_recorders()["ConfigurationRecorders"]
             if not recorders:
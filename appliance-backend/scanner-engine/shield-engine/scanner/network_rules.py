@@ -2,49 +2,44 @@ from __future__ import annotations
 
 from typing import List
 
-import boto3
-
 from .rule_engine import RuleCategory, RuleDefinition, RuleResult
+from .scan_context import ScanContext
 
 
-def _sg_open_detector(session: boto3.Session, region: str, account_id: str) -> List[RuleResult]:
-  ec2 = session.client("ec2", region_name=region)
+def _sg_open_detector(context: ScanContext, region: str) -> List[RuleResult]:
   results: List[RuleResult] = []
 
-  paginator = ec2.get_paginator("describe_security_groups")
-  for page in paginator.paginate():
-    for sg in page.get("SecurityGroups", []):
-      for perm in sg.get("IpPermissions", []):
-        from_port = perm.get("FromPort")
-        to_port = perm.get("ToPort")
-        for ip_range in perm.get("IpRanges", []):
-          cidr = ip_range.get("CidrIp")
-          if cidr == "0.0.0.0/0":
-            results.append(
-              RuleResult(
-                resource_id=sg["GroupId"],
-                region=region,
-                rule_id="NET_SG_OPEN_0_0_0_0",
-                severity="High",
-                frameworks=[
-                  "CIS:4.1",
-                  "NIST-800-53:SC-7",
-                  "PCI-DSS:1.2",
-                  "CCM:IVS-09",
-                ],
-                status="FAIL",
-                remediation="Restrict security group rules that allow 0.0.0.0/0; use specific CIDR ranges or security groups.",
-                details={"security_group": sg, "from_port": from_port, "to_port": to_port},
-              )
+  for sg in context.inventory.items("ec2", "describe_security_groups", "SecurityGroups", region):
+    for perm in sg.get("IpPermissions", []):
+      from_port = perm.get("FromPort")
+      to_port = perm.get("ToPort")
+      for ip_range in perm.get("IpRanges", []):
+        cidr = ip_range.get("CidrIp")
+        if cidr == "0.0.0.0/0":
+          results.append(
+            RuleResult(
+              resource_id=sg["GroupId"],
+              region=region,
+              rule_id="NET_SG_OPEN_0_0_0_0",
+              severity="High",
+              frameworks=[
+                "CIS:4.1",
+                "NIST-800-53:SC-7",
+                "PCI-DSS:1.2",
+                "CCM:IVS-09",
+              ],
+              status="FAIL",
+              remediation="Restrict security group rules that allow 0.0.0.0/0; use specific CIDR ranges or security groups.",
+              details={"security_group": sg, "from_port": from_port, "to_port": to_port},
             )
+          )
   return results
 
 
-def _public_rds_detector(session: boto3.Session, region: str, account_id: str) -> List[RuleResult]:
-  rds = session.client("rds", region_name=region)
+def _public_rds_detector(context: ScanContext, region: str) -> List[RuleResult]:
   results: List[RuleResult] = []
 
-  for db in rds.describe_db_instances().get("DBInstances", []):
+  for db in context.inventory.items("rds", "describe_db_instances", "DBInstances", region):
     if db.get("PubliclyAccessible"):
       results.append(
         RuleResult(
@@ -65,11 +60,10 @@ def _public_rds_detector(session: boto3.Session, region: str, account_id: str) -
   return results
 
 
-def _public_ec2_detector(session: boto3.Session, region: str, account_id: str) -> List[RuleResult]:
-  ec2 = session.client("ec2", region_name=region)
+def _public_ec2_detector(context: ScanContext, region: str) -> List[RuleResult]:
   results: List[RuleResult] = []
 
-  reservations = ec2.describe_instances().get("Reservations", [])
+  reservations = context.inventory.items("ec2", "describe_instances", "Reservations", region)
   for res in reservations:
     for inst in res.get("Instances", []):
       if inst.get("PublicIpAddress"):
@@ -92,8 +86,8 @@ def _public_ec2_detector(session: boto3.Session, region: str, account_id: str) -
   return results
 
 
-def _eks_public_api_detector(session: boto3.Session, region: str, account_id: str) -> List[RuleResult]:
-  eks = session.client("eks", region_name=region)
+def _eks_public_api_detector(context: ScanContext, region: str) -> List[RuleResult]:
+  eks = context.client("eks", region)
   results: List[RuleResult] = []
 
   try:
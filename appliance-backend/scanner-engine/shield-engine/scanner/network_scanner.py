@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from typing import List
 
-import boto3
-
 from .base_scanner import BaseScanner, Finding
 
 
@@ -12,14 +10,12 @@ class NetworkScanner(BaseScanner):
 
     category = "Network"
 
-    def scan_region(self, session: boto3.Session, region: str) -> List[Finding]:
-        ec2 = self._client(session, "ec2", region)
-        sts = session.client("sts")
-        account_id = sts.get_caller_identity()["Account"]
+    def scan_region(self, region: str) -> List[Finding]:
+        account_id = self.account_id
         findings: List[Finding] = []
 
         # Security groups open to 0.0.0.0/0
-        for sg in self._paginate(ec2, "describe_security_groups", "SecurityGroups"):
+        for sg in self._inventory("ec2", "describe_security_groups", "SecurityGroups", region):
             for perm in sg.get("IpPermissions", []):
                 from_port = perm.get("FromPort")
                 to_port = perm.get("ToPort")
@@ -49,7 +45,7 @@ class NetworkScanner(BaseScanner):
                         )
 
         # Publicly accessible EC2 / IMDSv1 enabled / public subnets with sensitive workloads.
-        reservations = ec2.describe_instances().get("Reservations", [])
+        reservations = self._inventory("ec2", "describe_instances", "Reservations", region)
         for res in reservations:
             for inst in res.get("Instances", []):
                 instance_id = inst["InstanceId"]
@@ -111,8 +107,7 @@ class NetworkScanner(BaseScanner):
                     )
 
         # Publicly accessible RDS
-        rds = self._client(session, "rds", region)
-        for db in rds.describe_db_instances().get("DBInstances", []):
+        for db in self._inventory("rds", "describe_db_instances", "DBInstances", region):
             if db.get("PubliclyAccessible"):
                 findings.append(
                     Finding(
@@ -13,6 +13,7 @@ from .iam_scanner import IamScanner
 from .monitoring_scanner import MonitoringScanner
 from .network_scanner import NetworkScanner
 from .org_scanner import OrgScanner
+from .scan_context import ScanContext
 from .serverless_scanner import ServerlessScanner
 from .storage_scanner import StorageScanner
 
@@ -34,12 +35,13 @@ async def run_infra_scan(
     role_arn: Optional[str] = None,
     regions: Optional[Iterable[str]] = None,
     scopes: Optional[Iterable[str]] = None,
+    page_size: Optional[int] = None,
 ) -> Dict[str, Any]:
     """Entry point used by FastAPI to execute all infra scanners."""
     base_session = boto3.Session()
-    sts = base_session.client("sts")
-    caller = sts.get_caller_identity()
-    account_id = account_id or caller["Account"]
+    # Resolved once here; scanners read it from the ScanContext instead of calling STS per region.
+    if not account_id:
+        account_id = base_session.client("sts").get_caller_identity()["Account"]
 
     # Discover regions if not explicitly provided.
     if regions is None:
@@ -51,26 +53,30 @@ async def run_infra_scan(
     scope_set = set(scopes or DEFAULT_SCOPES)
 
     session_factory = AwsSessionFactory(account_id=account_id, role_arn=role_arn, base_session=base_session)
+    context = ScanContext(account_id, region_list, session_factory, page_size)
 
     scanners = []
     if "iam" in scope_set:
-        scanners.append(IamScanner(session_factory, ["us-east-1"]))  # IAM/global
+        scanners.append(IamScanner(context, ["us-east-1"]))  # IAM/global
     if "network" in scope_set:
-        scanners.append(NetworkScanner(session_factory, region_list))
+        scanners.append(NetworkScanner(context))
     if "compute" in scope_set:
-        scanners.append(ComputeScanner(session_factory, region_list))
+        scanners.append(ComputeScanner(context))
     if "storage" in scope_set:
-        scanners.append(StorageScanner(session_factory, region_list))
+        scanners.append(StorageScanner(context))
     if "container" in scope_set:
-        scanners.append(ContainerScanner(session_factory, region_list))
+        scanners.append(ContainerScanner(context))
     if "serverless" in scope_set:
-        scanners.append(ServerlessScanner(session_factory, region_list))
+        scanners.append(ServerlessScanner(context))
     if "monitoring" in scope_set:
-        scanners.append(MonitoringScanner(session_factory, region_list))
+        scanners.append(MonitoringScanner(context))
     if "org" in scope_set:
-        scanners.append(OrgScanner(session_factory, ["us-east-1"]))
+        scanners.append(OrgScanner(context, ["us-east-1"]))
 
-    results: List[List[Finding]] = await asyncio.gather(*(s.scan() for s in scanners))
+    try:
+        results: List[List[Finding]] = await asyncio.gather(*(s.scan() for s in scanners))
+    finally:
+        context.close()
     findings: List[Finding] = [f for group in results for f in group]
 
     risk = compute_risk_score(findings)
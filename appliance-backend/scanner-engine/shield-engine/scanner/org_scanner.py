@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from typing import List
 
-import boto3
-
 from .base_scanner import BaseScanner, Finding
 
 
@@ -12,16 +10,15 @@ class OrgScanner(BaseScanner):
 
     category = "Org"
 
-    def scan_region(self, session: boto3.Session, region: str) -> List[Finding]:
+    def scan_region(self, region: str) -> List[Finding]:
         # Organizations, CloudTrail and Config org-level resources are global; run once.
         if region != "us-east-1":
             return []
 
-        sts = session.client("sts")
-        account_id = sts.get_caller_identity()["Account"]
+        account_id = self.account_id
         findings: List[Finding] = []
 
-        org = session.client("organizations")
+        org = self._client("organizations")
         try:
             org.describe_organization()
         except org.exceptions.AWSOrganizationsNotInUseException:
@@ -3,11 +3,12 @@ from __future__ import annotations
 import asyncio
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 import boto3
 
 from .base_scanner import AwsSessionFactory
+from .scan_context import ScanContext
 
 
 class RuleCategory(str, Enum):
@@ -28,8 +29,8 @@ class RuleDefinition:
     severity: str  # Critical | High | Medium | Low
     service: str   # AWS service name, e.g. iam, ec2
     frameworks: List[str]  # e.g. ["CIS:1.2", "NIST-800-53:AC-6"]
-    detector: Callable[[boto3.Session, str, str], List["RuleResult"]]
-    # detector(session, region, account_id) -> list[RuleResult]
+    detector: Callable[[ScanContext, str], List["RuleResult"]]
+    # detector(context, region) -> list[RuleResult]; account id and clients come from the context
 
 
 @dataclass
@@ -58,12 +59,10 @@ class RuleResult:
 
 async def _run_rule_for_region(
     rule: RuleDefinition,
-    session_factory: AwsSessionFactory,
+    context: ScanContext,
     region: str,
-    account_id: str,
 ) -> List[RuleResult]:
-    session = session_factory.create_session()
-    return await asyncio.to_thread(rule.detector, session, region, account_id)
+    return await asyncio.to_thread(rule.detector, context, region)
 
 
 async def run_rules(
@@ -71,15 +70,15 @@ async def run_rules(
     account_id: Optional[str] = None,
     role_arn: Optional[str] = None,
     regions: Optional[Iterable[str]] = None,
+    page_size: Optional[int] = None,
 ) -> Dict[str, Any]:
     """Run a set of rules across all regions asynchronously.
 
     Returns JSON-serializable result with one entry per failed rule/resource.
     """
     base_session = boto3.Session()
-    sts = base_session.client("sts")
-    caller = sts.get_caller_identity()
-    account_id = account_id or caller["Account"]
+    if not account_id:
+        account_id = base_session.client("sts").get_caller_identity()["Account"]
 
     if regions is None:
         ec2 = base_session.client("ec2")
@@ -88,26 +87,17 @@ async def run_rules(
 
     region_list = list(regions)
     session_factory = AwsSessionFactory(account_id=account_id, role_arn=role_arn, base_session=base_session)
+    context = ScanContext(account_id, region_list, session_factory, page_size)
 
-    tasks: List[Awaitable[Tuple[RuleDefinition, str, List[RuleResult]]]] = []
-    for rule in rules:
-        for region in region_list:
-            tasks.append(
-                _run_rule_for_region(rule, session_factory, region, account_id).then(
-                    lambda results, r=rule, reg=region: (r, reg, results)
-                )
-            )
-
-    # asyncio doesn't natively support .then on Awaitables; instead we gather and annotate explicitly.
-    # To keep things simple and avoid extra future glue, we build tasks manually below.
     results: List[RuleResult] = []
-    for rule in rules:
-        region_tasks = [
-            _run_rule_for_region(rule, session_factory, region, account_id) for region in region_list
-        ]
-        region_results = await asyncio.gather(*region_tasks)
-        for rule_results in region_results:
-            results.extend(rule_results)
+    try:
+        for rule in rules:
+            region_tasks = [_run_rule_for_region(rule, context, region) for region in region_list]
+            region_results = await asyncio.gather(*region_tasks)
+            for rule_results in region_results:
+                results.extend(rule_results)
+    finally:
+        context.close()
 
     return {
         "account_id": account_id,
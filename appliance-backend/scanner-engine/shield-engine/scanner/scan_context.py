@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+import boto3
+
+from .base_scanner import AwsSessionFactory
+from .inventory import Inventory
+
+
+class ScanContext:
+    """Run-scoped state shared by every scanner and rule of one infra scan.
+
+    Carries the account id and region list resolved once by the entry point,
+    boto3 clients created once per (service, region) from a single session,
+    the run's AWS inventory (each list/describe operation fetched once), and a
+    memo for other data several scanners need. Clients are thread-safe once
+    built; building them is serialized here because boto3 sessions are not.
+    """
+
+    def __init__(
+        self,
+        account_id: str,
+        regions: Iterable[str],
+        session_factory: AwsSessionFactory,
+        page_size: Optional[int] = None,
+    ) -> None:
+        self.account_id = account_id
+        self.regions: List[str] = list(regions)
+        self.session_factory = session_factory
+        self.page_size = page_size
+        self._lock = threading.Lock()
+        self._session: Optional[boto3.Session] = None
+        self._clients: Dict[Tuple[str, Optional[str]], Any] = {}
+        self._cache: Dict[Hashable, Any] = {}
+        self.inventory = Inventory(self.client, page_size)
+
+    @property
+    def session(self) -> boto3.Session:
+        with self._lock:
+            if self._session is None:
+                self._session = self.session_factory.create_session()
+            return self._session
+
+    def client(self, service: str, region: Optional[str] = None):
+        key = (service, region)
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+        session = self.session
+        with self._lock:
+            if key not in self._clients:
+                self._clients[key] = session.client(service, region_name=region)
+            return self._clients[key]
+
+    def close(self) -> None:
+        self.inventory.close()
+
+    def cached(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Value for key computed once per run (loader runs outside the lock)."""
+        with self._lock:
+            if key in self._cache:
+                return self._cache[key]
+        value = loader()
+        with self._lock:
+            return self._cache.setdefault(key, value)
@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from typing import List
 
-import boto3
-
 from .base_scanner import BaseScanner, Finding
 
 
@@ -12,12 +10,11 @@ class ServerlessScanner(BaseScanner):
 
     category = "Serverless"
 
-    def scan_region(self, session: boto3.Session, region: str) -> List[Finding]:
-        sts = session.client("sts")
-        account_id = sts.get_caller_identity()["Account"]
+    def scan_region(self, region: str) -> List[Finding]:
+        account_id = self.account_id
         findings: List[Finding] = []
 
-        lambda_client = self._client(session, "lambda", region)
+        lambda_client = self._client("lambda", region)
 
         # Lambda role permissions and env var secrets.
         paginator = lambda_client.get_paginator("list_functions")
@@ -63,7 +60,7 @@ class ServerlessScanner(BaseScanner):
                         )
 
         # API Gateway – publicly exposed endpoints (basic check).
-        apigw = self._client(session, "apigateway", region)
+        apigw = self._client("apigateway", region)
         try:
             apis = apigw.get_rest_apis().get("items", [])
             for api in apis:
@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from typing import List
 
-import boto3
-
 from .base_scanner import BaseScanner, Finding
 
 
@@ -12,14 +10,13 @@ class StorageScanner(BaseScanner):
 
     category = "Storage"
 
-    def scan_region(self, session: boto3.Session, region: str) -> List[Finding]:
-        sts = session.client("sts")
-        account_id = sts.get_caller_identity()["Account"]
+    def scan_region(self, region: str) -> List[Finding]:
+        account_id = self.account_id
         findings: List[Finding] = []
 
         # S3 is global – only run once but we still record region as aws-global.
         if region == "us-east-1":
-            s3 = session.client("s3")
+            s3 = self._client("s3")
             buckets = s3.list_buckets()["Buckets"]
             for b in buckets:
                 name = b["Name"]
@@ -80,7 +77,7 @@ class StorageScanner(BaseScanner):
                     )
 
         # EBS and snapshots
-        ec2 = self._client(session, "ec2", region)
+        ec2 = self._client("ec2", region)
         for vol in self._paginate(ec2, "describe_volumes", "Volumes"):
             if not vol.get("Encrypted", False):
                 findings.append(
@@ -121,8 +118,7 @@ class StorageScanner(BaseScanner):
                 )
 
         # RDS encryption and backups
-        rds = self._client(session, "rds", region)
-        for db in rds.describe_db_instances().get("DBInstances", []):
+        for db in self._inventory("rds", "describe_db_instances", "DBInstances", region):
             if not db.get("StorageEncrypted", False):
                 findings.append(
                     Finding(
@@ -0,0 +1,117 @@
+"""Benchmark NetworkScanner over stubbed EC2 pages: fetch-all-then-evaluate vs streamed.
+
+No AWS account needed (botocore Stubber):
+    PYTHONPATH=. python scripts/bench_paginated_inventory.py --instances 10000 --page-size 1000
+"eager" waits for every describe_instances page before scanning; "streamed"
+scans straight off the run inventory, evaluating each page while the next
+one is in flight. --page-latency-ms simulates the API round trip.
+"""
+import argparse
+import asyncio
+import gc
+import time
+
+import boto3
+from botocore.stub import Stubber
+
+from scanner.network_scanner import NetworkScanner
+from scanner.scan_context import ScanContext
+
+REGION = "us-east-1"
+
+
+def _instance(i: int) -> dict:
+    return {
+        "InstanceId": f"i-{i:017x}",
+        "ImageId": "ami-0123456789abcdef0",
+        "SubnetId": f"subnet-{i % 64:08x}",
+        "PublicIpAddress": f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}" if i % 4 == 0 else None,
+        "MetadataOptions": {"HttpTokens": "required" if i % 3 else "optional"},
+    }
+
+
+class _StubSessionFactory:
+    """Stands in for AwsSessionFactory: hands out pre-stubbed clients."""
+
+    def __init__(self, instances: int, page_size: int, latency: float) -> None:
+        self.clients = {}
+        self.stubbers = []
+        session = boto3.Session(aws_access_key_id="bench", aws_secret_access_key="bench", region_name=REGION)
+
+        ec2 = session.client("ec2")
+        stub = Stubber(ec2)
+        stub.add_response("describe_security_groups", {"SecurityGroups": []})
+        starts = range(0, instances, page_size)
+        for n, start in enumerate(starts):
+            batch = [
+                {k: v for k, v in _instance(i).items() if v is not None}
+                for i in range(start, min(start + page_size, instances))
+            ]
+            page = {"Reservations": [{"ReservationId": f"r-{start:017x}", "Instances": batch}]}
+            if n < len(starts) - 1:
+                page["NextToken"] = str(start + page_size)
+            stub.add_response("describe_instances", page)
+        self._register(ec2, stub, latency)
+
+        rds = session.client("rds")
+        stub = Stubber(rds)
+        stub.add_response("describe_db_instances", {"DBInstances": []})
+        self._register(rds, stub, latency)
+
+    def _register(self, client, stub: Stubber, latency: float) -> None:
+        if latency:
+            # Stubber answers at before-call, so the simulated round trip goes just ahead of it.
+            client.meta.events.register("before-parameter-build", lambda **_: time.sleep(latency))
+        stub.activate()
+        self.stubbers.append(stub)
+        self.clients[client.meta.service_model.service_name] = client
+
+    def create_session(self):
+        clients = self.clients
+        return type("StubSession", (), {"client": lambda _self, service, region_name=None: clients[service]})()
+
+
+def _run(label: str, args: argparse.Namespace) -> tuple[float, int, int]:
+    factory = _StubSessionFactory(args.instances, args.page_size, args.page_latency_ms / 1000)
+    context = ScanContext("123456789012", [REGION], factory, page_size=args.page_size)
+    scanner = NetworkScanner(context)
+    # Stubbed responses are served in order, so prime the other (single-page) fetches first.
+    list(context.inventory.items("ec2", "describe_security_groups", "SecurityGroups", REGION))
+    list(context.inventory.items("rds", "describe_db_instances", "DBInstances", REGION))
+    gc.collect()
+    start = time.perf_counter()
+    try:
+        if label == "eager":
+            for _ in context.inventory.items("ec2", "describe_instances", "Reservations", REGION):
+                pass
+        findings = asyncio.run(scanner.scan())
+    finally:
+        context.close()
+    elapsed = time.perf_counter() - start
+    for stub in factory.stubbers:
+        stub.assert_no_pending_responses()
+    return elapsed, context.inventory.api_calls - 2, len(findings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--instances", type=int, default=10000)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--page-latency-ms", type=float, default=50.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    best = {}
+    for label in ("eager", "streamed"):
+        runs = [_run(label, args) for _ in range(args.repeat)]
+        elapsed, pages, findings = min(runs)
+        best[label] = elapsed
+        print(
+            f"{label:<8} instances={args.instances} pages={pages} "
+            f"findings={findings} best={elapsed * 1000:,.0f} ms"
+        )
+    print(f"speedup={best['eager'] / best['streamed']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import logging
+import threading
+from contextlib import contextmanager
 from functools import lru_cache
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
 
 from botocore.exceptions import BotoCoreError, ClientError
 
+from scanner.inventory import Inventory
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,12 +21,48 @@ class AwsClientFactory:
     def __init__(self, session: Any) -> None:
         self._session = session
         self._clients: dict[tuple[str, str], Any] = {}
+        self._lock = threading.Lock()
 
     def client(self, service_name: str, region_name: str) -> Any:
         key = (service_name, region_name)
-        if key not in self._clients:
-            self._clients[key] = self._session.client(service_name, region_name=region_name)
-        return self._clients[key]
+        with self._lock:
+            if key not in self._clients:
+                self._clients[key] = self._session.client(service_name, region_name=region_name)
+            return self._clients[key]
+
+    def paginate(
+        self, service_name: str, region_name: str, operation_name: str, result_key: str, **kwargs: Any
+    ) -> Iterable[dict[str, Any]]:
+        """Items from the run's shared inventory (see shared_inventory), else a fresh paginate()."""
+        with _inventories_lock:
+            inventory = _inventories.get(id(self._session))
+        if inventory is None:
+            yield from paginate(self.client(service_name, region_name), operation_name, result_key, **kwargs)
+            return
+        try:
+            yield from inventory.items(service_name, operation_name, result_key, region_name, **kwargs)
+        except (ClientError, BotoCoreError) as exc:
+            logger.warning(
+                "aws_pagination_error service=%s operation=%s error=%s", service_name, operation_name, exc
+            )
+
+
+_inventories: dict[int, Inventory] = {}
+_inventories_lock = threading.Lock()
+
+
+@contextmanager
+def shared_inventory(session: Any) -> Iterator[Inventory]:
+    """Share one inventory between all rules run against session inside the block."""
+    inventory = Inventory(AwsClientFactory(session).client)
+    with _inventories_lock:
+        _inventories[id(session)] = inventory
+    try:
+        yield inventory
+    finally:
+        with _inventories_lock:
+            _inventories.pop(id(session), None)
+        inventory.close()
 
 
 def safe_call(func: Any, *args: Any, **kwargs: Any) -> Any:
@@ -7,6 +7,7 @@ import json
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
 
+from .aws_utils import shared_inventory
 from .types import RuleResult
 
 RULE_MODULES = [
@@ -30,9 +31,9 @@ def _run_single(module_name: str, session: Any) -> list[RuleResult]:
 
 
 def run_all_rules(session: Any, max_workers: int = 6) -> list[RuleResult]:
-    """Run all rule modules in parallel."""
+    """Run all rule modules in parallel, sharing one AWS inventory between them."""
     results: list[RuleResult] = []
-    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+    with shared_inventory(session), ThreadPoolExecutor(max_workers=max_workers) as pool:
         futures = {pool.submit(_run_single, module_name, session): module_name for module_name in RULE_MODULES}
         for fut in as_completed(futures):
             module_name = futures[fut]
@@ -26,15 +26,13 @@ class ComplianceRule:
         factory = AwsClientFactory(session)
         results: list[RuleResult] = []
         for region in regions:
-            rds = factory.client("rds", region)
-            ec2 = factory.client("ec2", region)
-            results.extend(self._scan_rds(rds, region))
-            results.extend(self._scan_ebs(ec2, region))
+            results.extend(self._scan_rds(factory, region))
+            results.extend(self._scan_ebs(factory, region))
         return results
 
-    def _scan_rds(self, rds: Any, region: str) -> list[RuleResult]:
+    def _scan_rds(self, factory: AwsClientFactory, region: str) -> list[RuleResult]:
         results: list[RuleResult] = []
-        for db in paginate(rds, "describe_db_instances", "DBInstances"):
+        for db in factory.paginate("rds", region, "describe_db_instances", "DBInstances"):
             db_id = db.get("DBInstanceIdentifier", "unknown-db")
             retention = int(db.get("BackupRetentionPeriod", 0) or 0)
             enabled = retention > 0
@@ -53,12 +51,12 @@ class ComplianceRule:
             )
         return results
 
-    def _scan_ebs(self, ec2: Any, region: str) -> list[RuleResult]:
-        volumes = list(paginate(ec2, "describe_volumes", "Volumes"))
+    def _scan_ebs(self, factory: AwsClientFactory, region: str) -> list[RuleResult]:
+        volumes = list(factory.paginate("ec2", region, "describe_volumes", "Volumes"))
         recent_cutoff = datetime.now(timezone.utc) - timedelta(days=self.SNAPSHOT_LOOKBACK_DAYS)
         snapshots = list(
             paginate(
-                ec2,
+                factory.client("ec2", region),
                 "describe_snapshots",
                 "Snapshots",
                 OwnerIds=["self"],
@@ -13,7 +13,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from ...aws_utils import AwsClientFactory, list_enabled_regions, paginate, safe_call
+from ...aws_utils import AwsClientFactory, list_enabled_regions, safe_call
 from ...types import RuleResult, build_result
 
 
@@ -31,8 +31,8 @@ class ComplianceRule:
         results: list[RuleResult] = []
         results.extend(self._scan_s3(session))
         for region in regions:
-            results.extend(self._scan_ebs(factory.client("ec2", region), region))
-            results.extend(self._scan_rds(factory.client("rds", region), region))
+            results.extend(self._scan_ebs(factory, region))
+            results.extend(self._scan_rds(factory, region))
         return results
 
     def _scan_s3(self, session: Any) -> list[RuleResult]:
@@ -62,9 +62,9 @@ class ComplianceRule:
         rules = (response or {}).get("ServerSideEncryptionConfiguration", {}).get("Rules", [])
         return len(rules) > 0
 
-    def _scan_ebs(self, ec2: Any, region: str) -> list[RuleResult]:
+    def _scan_ebs(self, factory: AwsClientFactory, region: str) -> list[RuleResult]:
         results: list[RuleResult] = []
-        for volume in paginate(ec2, "describe_volumes", "Volumes"):
+        for volume in factory.paginate("ec2", region, "describe_volumes", "Volumes"):
             volume_id = volume.get("VolumeId", "unknown-volume")
             encrypted = bool(volume.get("Encrypted", False))
             results.append(
@@ -80,9 +80,9 @@ class ComplianceRule:
             )
         return results
 
-    def _scan_rds(self, rds: Any, region: str) -> list[RuleResult]:
+    def _scan_rds(self, factory: AwsClientFactory, region: str) -> list[RuleResult]:
         results: list[RuleResult] = []
-        for db in paginate(rds, "describe_db_instances", "DBInstances"):
+        for db in factory.paginate("rds", region, "describe_db_instances", "DBInstances"):
             db_id = db.get("DBInstanceIdentifier", "unknown-db")
             encrypted = bool(db.get("StorageEncrypted", False))
             results.append(
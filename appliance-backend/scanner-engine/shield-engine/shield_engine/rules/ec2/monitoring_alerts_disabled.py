@@ -25,11 +25,9 @@ class ComplianceRule:
         results: list[RuleResult] = []
         for region in regions:
             cloudwatch = factory.client("cloudwatch", region)
-            ec2 = factory.client("ec2", region)
-            rds = factory.client("rds", region)
             alarm_targets = self._alarm_targets(cloudwatch)
-            results.extend(self._scan_ec2(ec2, region, alarm_targets))
-            results.extend(self._scan_rds(rds, region, alarm_targets))
+            results.extend(self._scan_ec2(factory, region, alarm_targets))
+            results.extend(self._scan_rds(factory, region, alarm_targets))
         return results
 
     def _alarm_targets(self, cloudwatch: Any) -> set[str]:
@@ -42,9 +40,9 @@ class ComplianceRule:
                     targets.add(str(value))
         return targets
 
-    def _scan_ec2(self, ec2: Any, region: str, alarm_targets: set[str]) -> list[RuleResult]:
+    def _scan_ec2(self, factory: AwsClientFactory, region: str, alarm_targets: set[str]) -> list[RuleResult]:
         results: list[RuleResult] = []
-        for reservation in paginate(ec2, "describe_instances", "Reservations"):
+        for reservation in factory.paginate("ec2", region, "describe_instances", "Reservations"):
             for instance in reservation.get("Instances", []):
                 instance_id = instance.get("InstanceId", "unknown-instance")
                 has_alarm = instance_id in alarm_targets
@@ -63,9 +61,9 @@ class ComplianceRule:
                 )
         return results
 
-    def _scan_rds(self, rds: Any, region: str, alarm_targets: set[str]) -> list[RuleResult]:
+    def _scan_rds(self, factory: AwsClientFactory, region: str, alarm_targets: set[str]) -> list[RuleResult]:
         results: list[RuleResult] = []
-        for db in paginate(rds, "describe_db_instances", "DBInstances"):
+        for db in factory.paginate("rds", region, "describe_db_instances", "DBInstances"):
             db_id = db.get("DBInstanceIdentifier", "unknown-db")
             has_alarm = db_id in alarm_targets
             results.append(
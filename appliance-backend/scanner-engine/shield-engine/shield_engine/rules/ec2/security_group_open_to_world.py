@@ -10,7 +10,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from ...aws_utils import AwsClientFactory, list_enabled_regions, paginate
+from ...aws_utils import AwsClientFactory, list_enabled_regions
 from ...types import RuleResult, build_result
 
 SENSITIVE_PORTS = {22, 3389, 3306, 5432, 6379, 27017}
@@ -27,8 +27,7 @@ class ComplianceRule:
         results: list[RuleResult] = []
 
         for region in regions:
-            ec2 = factory.client("ec2", region)
-            for sg in paginate(ec2, "describe_security_groups", "SecurityGroups"):
+            for sg in factory.paginate("ec2", region, "describe_security_groups", "SecurityGroups"):
                 group_id = sg.get("GroupId", "unknown-sg")
                 open_world = self._has_world_open_sensitive_rule(sg.get("IpPermissions", []))
                 results.append(
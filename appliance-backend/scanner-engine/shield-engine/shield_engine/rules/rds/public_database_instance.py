@@ -10,7 +10,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from ...aws_utils import AwsClientFactory, list_enabled_regions, paginate
+from ...aws_utils import AwsClientFactory, list_enabled_regions
 from ...types import RuleResult, build_result
 
 
@@ -24,8 +24,7 @@ class ComplianceRule:
         factory = AwsClientFactory(session)
         results: list[RuleResult] = []
         for region in regions:
-            rds = factory.client("rds", region)
-            for db in paginate(rds, "describe_db_instances", "DBInstances"):
+            for db in factory.paginate("rds", region, "describe_db_instances", "DBInstances"):
                 db_id = db.get("DBInstanceIdentifier", "unknown-db")
                 public = bool(db.get("PubliclyAccessible", False))
                 results.append(
@@ -0,0 +1,105 @@
+import pytest
+
+pytest.importorskip("botocore")
+
+from scanner.ami_resolver import DESCRIBE_IMAGES_BATCH, AmiResolver
+
+
+class _StubEc2:
+    """describe_images answering only for the AMIs in `images`."""
+
+    def __init__(self, images):
+        self.images = set(images)
+        self.batches = []
+
+    def can_paginate(self, _operation):
+        return False
+
+    def describe_images(self, Filters, IncludeDeprecated):
+        assert IncludeDeprecated is True
+        (image_filter,) = Filters
+        assert image_filter["Name"] == "image-id"
+        batch = image_filter["Values"]
+        self.batches.append(list(batch))
+        return {"Images": [{"ImageId": i, "Name": f"name-{i}"} for i in batch if i in self.images]}
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr("scanner.ami_resolver.time", clock)
+    return clock
+
+
+def _amis(start, count):
+    return [f"ami-{i:017x}" for i in range(start, start + count)]
+
+
+def test_one_call_per_batch_of_distinct_uncached_amis(clock):
+    ec2 = _StubEc2(_amis(0, 1000))
+    resolver = AmiResolver()
+    first = _amis(0, 450)
+    # Duplicates (many instances on one AMI) are looked up once.
+    resolved = resolver.resolve(ec2, "123", "us-east-1", first + first[:100])
+    assert [len(b) for b in ec2.batches] == [DESCRIBE_IMAGES_BATCH, DESCRIBE_IMAGES_BATCH, 50]
+    assert resolved[first[0]]["Name"] == f"name-{first[0]}"
+    assert len(resolved) == 450
+
+    second = _amis(300, 400)
+    resolved = resolver.resolve(ec2, "123", "us-east-1", second)
+    # Only the 250 AMIs not seen by the first resolve are fetched.
+    assert [len(b) for b in ec2.batches[3:]] == [DESCRIBE_IMAGES_BATCH, 50]
+    assert set(ec2.batches[3] + ec2.batches[4]) == set(_amis(450, 250))
+    assert len(resolved) == 400
+    assert resolver.api_calls == 5
+
+
+def test_missing_amis_are_cached_as_none(clock):
+    ec2 = _StubEc2(["ami-live"])
+    resolver = AmiResolver()
+    assert resolver.resolve(ec2, "123", "us-east-1", ["ami-live", "ami-gone"]) == {
+        "ami-live": {"ImageId": "ami-live", "Name": "name-ami-live"},
+        "ami-gone": None,
+    }
+    assert resolver.resolve(ec2, "123", "us-east-1", ["ami-gone"]) == {"ami-gone": None}
+    assert len(ec2.batches) == 1
+
+
+def test_entries_expire_after_ttl(clock):
+    ec2 = _StubEc2(["ami-a"])
+    resolver = AmiResolver(ttl_seconds=60)
+    resolver.resolve(ec2, "123", "us-east-1", ["ami-a"])
+    clock.now += 59
+    resolver.resolve(ec2, "123", "us-east-1", ["ami-a"])
+    assert len(ec2.batches) == 1
+    clock.now += 2
+    resolver.resolve(ec2, "123", "us-east-1", ["ami-a"])
+    assert len(ec2.batches) == 2
+    # Entries are scoped by account and region.
+    resolver.resolve(ec2, "456", "us-east-1", ["ami-a"])
+    resolver.resolve(ec2, "123", "eu-west-1", ["ami-a"])
+    assert len(ec2.batches) == 4
+
+
+def test_max_entries_bounds_the_cache(clock):
+    ec2 = _StubEc2([])
+    resolver = AmiResolver(ttl_seconds=60, max_entries=4)
+    resolver.resolve(ec2, "123", "us-east-1", ["ami-a", "ami-b"])
+    clock.now += 61
+    resolver.resolve(ec2, "123", "us-east-1", ["ami-c", "ami-d", "ami-e"])
+    # Expired entries make room first.
+    assert sorted(k[2] for k in resolver._images) == ["ami-c", "ami-d", "ami-e"]
+
+    resolver.resolve(ec2, "123", "us-east-1", ["ami-f", "ami-g"])
+    # Still over with nothing expired: start over rather than grow past the bound.
+    assert sorted(k[2] for k in resolver._images) == ["ami-f", "ami-g"]
+    resolver.resolve(ec2, "123", "us-east-1", ["ami-c"])
+    assert ec2.batches[-1] == ["ami-c"]
@@ -47,7 +47,7 @@ def test_execution_pipeline_integrity(monkeypatch):
             "rule_timeout_seconds": 5,
             "service_timeout_seconds": 10,
             "global_timeout_seconds": 15,
-            "rule_batch_size": 25,
+            "provider_cache_ttl_seconds": 0,
         },
     )())
 
@@ -0,0 +1,114 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("botocore")
+
+from botocore.exceptions import ClientError
+
+from scanner.inventory import Inventory
+from shield_engine.aws_utils import AwsClientFactory, shared_inventory
+
+
+def _error(operation):
+    return ClientError({"Error": {"Code": "Throttling", "Message": "slow down"}}, operation)
+
+
+class _Paginator:
+    def __init__(self, client):
+        self.client = client
+
+    def paginate(self, **_params):
+        self.client.paginate_calls += 1
+        for n, page in enumerate(self.client.pages):
+            if n:
+                self.client.gate.wait(timeout=5)
+            if isinstance(page, Exception):
+                raise page
+            yield page
+
+
+class _StubClient:
+    """Pages are served in order; pages after the first wait for gate."""
+
+    class meta:
+        class service_model:
+            service_name = "ec2"
+
+    def __init__(self, pages, gated=False):
+        self.pages = pages
+        self.gate = threading.Event()
+        if not gated:
+            self.gate.set()
+        self.paginate_calls = 0
+
+    def can_paginate(self, _operation):
+        return True
+
+    def get_paginator(self, _operation):
+        return _Paginator(self)
+
+
+def _pages(*sizes):
+    start, pages = 0, []
+    for size in sizes:
+        pages.append({"Items": [{"Id": i} for i in range(start, start + size)]})
+        start += size
+    return pages
+
+
+def test_concurrent_callers_share_one_fetch():
+    client = _StubClient(_pages(3, 3, 2), gated=True)
+    inventory = Inventory(lambda _service, _region: client)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [
+                pool.submit(lambda: list(inventory.items("ec2", "describe_things", "Items", "us-east-1")))
+                for _ in range(8)
+            ]
+            client.gate.set()
+            results = [f.result(timeout=5) for f in futures]
+        # A caller arriving after the fetch finished replays the buffered items.
+        results.append(list(inventory.items("ec2", "describe_things", "Items", "us-east-1")))
+    finally:
+        inventory.close()
+    assert client.paginate_calls == 1
+    assert inventory.api_calls == 3
+    assert all(r == [{"Id": i} for i in range(8)] for r in results)
+
+
+def test_items_are_published_page_by_page():
+    client = _StubClient(_pages(2, 2), gated=True)
+    inventory = Inventory(lambda _service, _region: client)
+    try:
+        items = inventory.items("ec2", "describe_things", "Items", "us-east-1")
+        # The first page is readable while the second is still being fetched.
+        first_page = [next(items), next(items)]
+        assert first_page == [{"Id": 0}, {"Id": 1}]
+        assert client.paginate_calls == 1 and not client.gate.is_set()
+        client.gate.set()
+        assert list(items) == [{"Id": 2}, {"Id": 3}]
+    finally:
+        inventory.close()
+
+
+def test_failed_fetch_is_not_cached():
+    client = _StubClient(_pages(2) + [_error("DescribeThings")])
+    inventory = Inventory(lambda _service, _region: client)
+    try:
+        with pytest.raises(ClientError):
+            list(inventory.items("ec2", "describe_things", "Items", "us-east-1"))
+        client.pages = _pages(2, 1)
+        assert len(list(inventory.items("ec2", "describe_things", "Items", "us-east-1"))) == 3
+    finally:
+        inventory.close()
+    assert client.paginate_calls == 2
+
+
+def test_client_factory_paginate_swallows_errors_raised_mid_stream():
+    client = _StubClient(_pages(2) + [_error("DescribeThings")])
+    session = type("Session", (), {"client": lambda _self, _service, region_name=None: client})()
+    with shared_inventory(session):
+        items = list(AwsClientFactory(session).paginate("ec2", "us-east-1", "describe_things", "Items"))
+    assert items == [{"Id": 0}, {"Id": 1}]
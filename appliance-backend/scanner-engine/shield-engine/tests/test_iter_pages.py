@@ -0,0 +1,79 @@
+import pytest
+
+pytest.importorskip("botocore")
+
+from botocore.exceptions import PaginationError
+
+from scanner.inventory import _PAGE_SIZE_LIMITS, iter_pages
+
+
+class _Paginator:
+    def __init__(self, client, limit_key):
+        self.client = client
+        self.limit_key = limit_key
+
+    def paginate(self, **params):
+        # Like botocore: PageSize on an operation without a limit key fails up front.
+        if "PageSize" in params.get("PaginationConfig", {}) and not self.limit_key:
+            raise PaginationError(message="PageSize parameter is not supported")
+        self.client.calls.append(params)
+        return iter([{"Items": [1]}, {"Items": [2]}])
+
+
+class _StubClient:
+    def __init__(self, service, limit_key="MaxResults"):
+        self.meta = type("Meta", (), {"service_model": type("Model", (), {"service_name": service})()})()
+        self.limit_key = limit_key
+        self.calls = []
+
+    def can_paginate(self, operation):
+        return operation != "get_thing"
+
+    def get_paginator(self, _operation):
+        return _Paginator(self, self.limit_key)
+
+    def get_thing(self, **params):
+        self.calls.append(params)
+        return {"Thing": 1}
+
+
+@pytest.mark.parametrize(
+    ("service", "operation", "page_size", "expected"),
+    [
+        ("ec2", "describe_instances", 5000, 1000),
+        ("ec2", "describe_instances", 1, 5),
+        ("ec2", "describe_instances", 500, 500),
+        ("rds", "describe_db_instances", 1000, 100),
+        ("rds", "describe_db_instances", 5, 20),
+        ("ssm", "describe_instance_information", 1000, 50),
+    ],
+)
+def test_page_size_is_clamped_into_the_operation_range(service, operation, page_size, expected):
+    assert (service, operation) in _PAGE_SIZE_LIMITS
+    client = _StubClient(service)
+    pages = list(iter_pages(client, operation, page_size, Filters=[{"Name": "x", "Values": ["y"]}]))
+    assert pages == [{"Items": [1]}, {"Items": [2]}]
+    assert client.calls == [
+        {"Filters": [{"Name": "x", "Values": ["y"]}], "PaginationConfig": {"PageSize": expected}}
+    ]
+
+
+def test_operation_missing_from_the_table_uses_page_size_as_given():
+    assert ("ec2", "describe_vpcs") not in _PAGE_SIZE_LIMITS
+    client = _StubClient("ec2")
+    list(iter_pages(client, "describe_vpcs", 250, PaginationConfig={"MaxItems": 900}))
+    assert client.calls == [{"PaginationConfig": {"MaxItems": 900, "PageSize": 250}}]
+
+
+def test_operation_without_a_limit_key_falls_back_to_default_pages():
+    client = _StubClient("ecr", limit_key=None)
+    pages = list(iter_pages(client, "describe_images", 100, repositoryName="repo"))
+    assert len(pages) == 2
+    assert client.calls == [{"repositoryName": "repo"}]
+
+
+def test_no_page_size_or_no_paginator():
+    client = _StubClient("ec2")
+    list(iter_pages(client, "describe_instances"))
+    assert list(iter_pages(client, "get_thing", 100, Id="a")) == [{"Thing": 1}]
+    assert client.calls == [{}, {"Id": "a"}]
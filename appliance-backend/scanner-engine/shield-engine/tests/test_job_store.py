@@ -0,0 +1,100 @@
+import asyncio
+
+from prowler_engine.job_store import FAILED, QUEUED, RUNNING, SUCCEEDED, JobStore
+from prowler_engine.jobs import ScanJobs
+from prowler_engine.scan_queue import ScanJobQueue
+
+
+def _store(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    store.open()
+    return store
+
+
+def test_results_page_by_cursor(tmp_path):
+    store = _store(tmp_path)
+    store.create("j1", {"provider": "aws"})
+    store.set_total("j1", 2)
+    store.append("j1", [{"check_id": "a", "n": i} for i in range(3)], check_done=True)
+    store.append("j1", [{"check_id": "b", "n": i} for i in range(2)], check_done=True)
+
+    job = store.get("j1")
+    assert (job["status"], job["checks_done"], job["checks_total"], job["findings"]) == (QUEUED, 2, 2, 5)
+    assert job["request"] == {"provider": "aws"}
+
+    first = store.results("j1", cursor=0, limit=3)
+    assert [r["check_id"] for r in first["results"]] == ["a", "a", "a"]
+    assert first["next_cursor"] == 3 and not first["done"]
+
+    second = store.results("j1", cursor=first["next_cursor"], limit=3)
+    assert [r["check_id"] for r in second["results"]] == ["b", "b"]
+    # Still running: more results may arrive after the last page.
+    assert not second["done"]
+
+    store.finish("j1", SUCCEEDED)
+    assert store.results("j1", cursor=second["next_cursor"], limit=3) == {
+        "results": [],
+        "next_cursor": 5,
+        "done": True,
+    }
+
+
+def test_restart_and_purge(tmp_path):
+    store = _store(tmp_path)
+    store.create("old", {})
+    store.append("old", [{"x": 1}], check_done=True)
+    store.create("live", {})
+    store.mark_running("live")
+    store.close()
+
+    reopened = _store(tmp_path)
+    assert reopened.fail_unfinished("restart") == 2
+    assert reopened.get("live")["status"] == FAILED
+    assert reopened.purge(max_age_seconds=0) == 2
+    assert reopened.get("old") is None
+    assert reopened.get("live") is None
+
+
+def test_scan_jobs_spill_events(tmp_path):
+    store = _store(tmp_path)
+
+    def job_factory(on_event):
+        async def run():
+            assert store.get(job_id)["status"] == RUNNING
+            await on_event({"event": "started", "services": 1, "checks": 2})
+            await on_event({"event": "check", "service": "iam", "check_id": "a", "results": [{"check_id": "a"}]})
+            await on_event({"event": "check", "service": "iam", "check_id": "b", "results": []})
+            await on_event({"event": "results", "results": [{"check_id": "service_timeout"}]})
+            return []
+
+        return run
+
+    def failing_factory(_on_event):
+        async def run():
+            raise RuntimeError("boom")
+
+        return run
+
+    async def _scenario():
+        nonlocal job_id
+        queue = ScanJobQueue(max_size=4, worker_count=1)
+        await queue.start()
+        jobs = ScanJobs(store, queue)
+        job_id, _ = await jobs.submit({"provider": "aws"}, job_factory)
+        failed_id, _ = await jobs.submit({"provider": "aws"}, failing_factory)
+        while jobs.active():
+            await asyncio.sleep(0.01)
+        await queue.stop()
+        return failed_id
+
+    job_id = None
+    failed_id = asyncio.run(_scenario())
+
+    job = store.get(job_id)
+    assert (job["status"], job["checks_done"], job["checks_total"], job["findings"]) == (SUCCEEDED, 2, 2, 2)
+    page = store.results(job_id, 0, 10)
+    assert [r["check_id"] for r in page["results"]] == ["a", "service_timeout"]
+    assert page["done"]
+
+    failed = store.get(failed_id)
+    assert failed["status"] == FAILED and failed["error"] == "boom"
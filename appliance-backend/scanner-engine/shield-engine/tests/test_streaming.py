@@ -0,0 +1,101 @@
+import asyncio
+import json
+
+import pytest
+
+from prowler_engine.executor import run_scan_async
+from prowler_engine.streaming import ScanEventStream, StreamClosed, encode_ndjson, encode_sse
+
+
+def _finding(check_id):
+    class Meta:
+        CheckID = check_id
+        ServiceName = check_id.split("_")[0]
+        Severity = type("S", (), {"value": "medium"})()
+        CheckTitle = "Title"
+        Risk = ""
+        Remediation = ""
+
+    class Finding:
+        status = "FAIL"
+        check_metadata = Meta()
+        resource_id = "r1"
+        region = "us-east-1"
+        compliance = {}
+
+    return Finding()
+
+
+@pytest.fixture
+def fake_engine(monkeypatch):
+    monkeypatch.setattr("prowler_engine.executor._import_check", lambda _p, name: name)
+    monkeypatch.setattr("prowler_engine.executor._init_provider", lambda _args: object())
+    monkeypatch.setattr(
+        "prowler_engine.executor._execute_check_sync",
+        lambda name, _provider, _args: [_finding(name), _finding(name)],
+    )
+    monkeypatch.setattr("prowler_engine.executor.parse_compliance_mappings", lambda _p: {})
+    monkeypatch.setattr("prowler_engine.executor.get_settings", lambda: type(
+        "Cfg",
+        (),
+        {
+            "engine_max_workers": 2,
+            "collector_timeout_seconds": 5,
+            "collector_retry_count": 0,
+            "rule_timeout_seconds": 5,
+            "service_timeout_seconds": 10,
+            "global_timeout_seconds": 15,
+            "provider_cache_ttl_seconds": 0,
+        },
+    )())
+
+
+async def _collect(stream, run, heartbeat_seconds=5):
+    return [event async for event in stream.events(run, heartbeat_seconds=heartbeat_seconds)]
+
+
+def test_stream_emits_findings_per_check(fake_engine):
+    stream = ScanEventStream()
+    events = asyncio.run(
+        _collect(stream, lambda: run_scan_async(provider="aws", checks=["iam_a", "s3_b"], on_event=stream.emit))
+    )
+    kinds = [e["event"] for e in events]
+    assert kinds[0] == "started"
+    assert kinds.count("finding") == 4
+    assert kinds.count("progress") == 2
+    assert kinds[-1] == "complete"
+    assert events[-1]["checks_done"] == 2 and events[-1]["checks_total"] == 2
+    assert events[-1]["findings"] == 4
+    assert {e["data"]["check_id"] for e in events if e["event"] == "finding"} == {"iam_a", "s3_b"}
+
+
+def test_stream_heartbeat_and_error():
+    stream = ScanEventStream()
+
+    async def _slow_failure():
+        await asyncio.sleep(0.05)
+        raise RuntimeError("boom")
+
+    events = asyncio.run(_collect(stream, _slow_failure, heartbeat_seconds=0.01))
+    assert events[0]["event"] == "heartbeat"
+    assert events[-1] == {**events[-1], "event": "error", "detail": "boom"}
+
+
+def test_emit_after_client_leaves_raises():
+    stream = ScanEventStream()
+
+    async def _scenario():
+        gen = stream.events(lambda: asyncio.sleep(1), heartbeat_seconds=0.01)
+        assert (await gen.__anext__())["event"] == "heartbeat"
+        await gen.aclose()
+        with pytest.raises(StreamClosed):
+            await stream.emit({"event": "check", "check_id": "x", "results": []})
+
+    asyncio.run(_scenario())
+
+
+def test_encoders():
+    event = {"event": "finding", "data": {"check_id": "iam_a"}}
+    assert json.loads(encode_ndjson(event)) == event
+    assert encode_sse(event).startswith("event: finding\ndata: {")
+    assert encode_sse(event).endswith("\n\n")
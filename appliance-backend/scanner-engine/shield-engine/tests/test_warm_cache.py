@@ -0,0 +1,106 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from prowler_engine.warm_cache import WarmCache
+
+
+class _Finding:
+    class check_metadata:
+        CheckID = "iam_test_check"
+        ServiceName = "iam"
+        Severity = type("S", (), {"value": "medium"})()
+        CheckTitle = "Title"
+        Risk = ""
+        Remediation = ""
+
+    status = "PASS"
+    resource_id = "r1"
+    region = "us-east-1"
+    compliance = {}
+
+
+def _patch_executor(monkeypatch, calls):
+    def fake_init(_args):
+        calls["init"] += 1
+        return object()
+
+    def fake_import_check(_provider, _check_name):
+        calls["import"] += 1
+        return object()
+
+    def fake_activate(_global_provider):
+        calls["activate"] += 1
+
+    def fake_compliance(_provider):
+        calls["compliance"] += 1
+        return {}
+
+    monkeypatch.setattr("prowler_engine.executor.warm_cache", WarmCache())
+    monkeypatch.setattr("prowler_engine.executor._init_provider", fake_init)
+    monkeypatch.setattr("prowler_engine.executor._activate_provider", fake_activate)
+    monkeypatch.setattr("prowler_engine.executor._import_check", fake_import_check)
+    monkeypatch.setattr("prowler_engine.executor.parse_compliance_mappings", fake_compliance)
+    monkeypatch.setattr("prowler_engine.executor._execute_check_sync", lambda *_a: [_Finding()])
+    monkeypatch.setattr("prowler_engine.executor.get_settings", lambda: type(
+        "Cfg",
+        (),
+        {
+            "engine_max_workers": 2,
+            "collector_timeout_seconds": 5,
+            "collector_retry_count": 0,
+            "rule_timeout_seconds": 5,
+            "service_timeout_seconds": 10,
+            "global_timeout_seconds": 15,
+            "provider_cache_ttl_seconds": 600,
+        },
+    )())
+
+
+def test_back_to_back_scans_reuse_warm_state(monkeypatch):
+    from prowler_engine.executor import run_scan_async
+
+    calls = {"init": 0, "activate": 0, "import": 0, "compliance": 0}
+    _patch_executor(monkeypatch, calls)
+
+    async def _scans():
+        first = await run_scan_async(provider="aws", checks=["iam_test_check"], role="arn:role/a")
+        second = await run_scan_async(provider="aws", checks=["iam_test_check"], role="arn:role/a")
+        other = await run_scan_async(provider="aws", checks=["iam_test_check"], role="arn:role/b")
+        return first, second, other
+
+    results = asyncio.run(_scans())
+    assert all(len(r) == 1 and r[0]["check_id"] == "iam_test_check" for r in results)
+    assert calls == {"init": 2, "activate": 1, "import": 1, "compliance": 1}
+
+
+def test_provider_expires_with_credentials():
+    class Credentials:
+        _expiry_time = datetime.now(timezone.utc) + timedelta(seconds=60)
+
+    class Session:
+        def get_credentials(self):
+            return Credentials()
+
+    class Provider:
+        session = type("S", (), {"current_session": Session()})()
+
+    cache = WarmCache()
+    inits = []
+
+    def factory():
+        inits.append(1)
+        return Provider()
+
+    cache.provider("k", factory, ttl_seconds=600)
+    _, hit = cache.provider("k", factory, ttl_seconds=600)
+    # Credentials expire inside the refresh margin, so nothing is kept.
+    assert not hit
+    assert len(inits) == 2
+
+
+def test_provider_ttl_zero_disables_cache():
+    cache = WarmCache()
+    cache.provider("k", object, ttl_seconds=0)
+    _, hit = cache.provider("k", object, ttl_seconds=0)
+    assert not hit
+    assert cache.stats()["providers"] == 0
@@ -44,7 +44,8 @@ def list_jobs(limit: int = 20, db: Session = Depends(get_db)):
     """List recent scan jobs."""
     rows = db.execute(
         text("""
-            SELECT id, scan_type, phase, status, resource_count, finding_count, completed_at
+            SELECT id, scan_type, phase, status, resource_count, finding_count, completed_at, peak_rss_kb,
+                   resources_per_sec, evaluated_count, skipped_count, phase_timings
             FROM scan_history ORDER BY started_at DESC LIMIT :limit
         """),
         {"limit": limit},
@@ -58,6 +59,11 @@ def list_jobs(limit: int = 20, db: Session = Depends(get_db)):
             "resourceCount": r[4],
             "findingCount": r[5],
             "completedAt": str(r[6]) if r[6] else None,
+            "peakRssKb": r[7],
+            "resourcesPerSec": r[8],
+            "evaluatedCount": r[9],
+            "skippedCount": r[10],
+            "phaseTimings": r[11],
         }
         for r in rows
     ]
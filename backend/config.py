@@ -22,6 +22,37 @@ class Settings(BaseSettings):
     collection_interval_hours: int = 6
     scan_interval_hours: int = 1
 
+    # Collection phase - concurrent (collector, region) tasks, in-flight cap per boto3 service
+    collection_max_workers: int = 16
+    collection_service_concurrency: int = 4
+    collection_service_limits: dict[str, int] = {}
+    # Collected items buffered between collectors and the DB writer, resources per upsert batch
+    collection_queue_size: int = 2000
+    resource_batch_size: int = 500
+
+    # Scan phase - findings per multi-row upsert, resources per server-side cursor fetch
+    finding_batch_size: int = 1000
+    scan_stream_chunk_size: int = 500
+
+    # External scanners - run concurrently with native rules, each with its own timeout
+    enable_prowler: bool = True
+    prowler_compliance: str | None = None
+    prowler_timeout_seconds: int = 3600
+    # Opt-in per-service checkpointed Prowler runs, e.g. PROWLER_SERVICES='["iam","s3"]'.
+    # Only the listed services are scanned; the default (empty) is one full, non-resumable run.
+    prowler_services: list[str] = []
+    prowler_unit_timeout_seconds: int = 900
+    prowler_unit_max_attempts: int = 2
+    prowler_checkpoint_dir: str = "/tmp/prowler-checkpoints"
+    prowler_checkpoint_max_age_hours: int = 24
+    # Wait this long for another worker's checkpoint lock, then run without checkpointing
+    prowler_checkpoint_lock_timeout_seconds: int = 60
+    enable_cloudsploit: bool = True
+    cloudsploit_timeout_seconds: int = 3600
+    # Sharded CloudSploit runs: one process per plugin (empty list = a single run of all plugins)
+    cloudsploit_plugins: list[str] = []
+    cloudsploit_max_parallel: int = 4
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -0,0 +1,3 @@
+-- Peak worker RSS (KiB) observed during a scan run
+
+ALTER TABLE scan_history ADD COLUMN IF NOT EXISTS peak_rss_kb BIGINT;
@@ -0,0 +1,3 @@
+-- Collection throughput (resources written per second) for a collection run
+
+ALTER TABLE scan_history ADD COLUMN IF NOT EXISTS resources_per_sec REAL;
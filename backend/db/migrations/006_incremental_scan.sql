@@ -0,0 +1,16 @@
+-- Incremental scanning: content hash per resource, per-(resource, rule version) evaluation cache
+
+ALTER TABLE resources ADD COLUMN IF NOT EXISTS content_hash VARCHAR(32);
+
+CREATE TABLE IF NOT EXISTS rule_evaluations (
+    resource_id INTEGER NOT NULL REFERENCES resources(id) ON DELETE CASCADE,
+    rule_id INTEGER NOT NULL REFERENCES compliance_rules(id) ON DELETE CASCADE,
+    rule_version VARCHAR(32) NOT NULL,
+    content_hash VARCHAR(32) NOT NULL,
+    passed BOOLEAN NOT NULL,
+    evaluated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (resource_id, rule_id)
+);
+
+ALTER TABLE scan_history ADD COLUMN IF NOT EXISTS evaluated_count INTEGER;
+ALTER TABLE scan_history ADD COLUMN IF NOT EXISTS skipped_count INTEGER;
@@ -0,0 +1,3 @@
+-- Per-phase status/seconds/findings for native, Prowler and CloudSploit scan phases
+
+ALTER TABLE scan_history ADD COLUMN IF NOT EXISTS phase_timings JSONB;
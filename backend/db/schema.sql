@@ -8,6 +8,7 @@ CREATE TABLE IF NOT EXISTS resources (
     region VARCHAR(64),
     account_id VARCHAR(32),
     raw_metadata JSONB NOT NULL,
+    content_hash VARCHAR(32),
     collected_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
     UNIQUE(resource_id, resource_type)
 );
@@ -32,6 +33,11 @@ CREATE TABLE IF NOT EXISTS scan_history (
     resource_count INTEGER DEFAULT 0,
     finding_count INTEGER DEFAULT 0,
     error_message TEXT,
+    peak_rss_kb BIGINT,
+    resources_per_sec REAL,
+    evaluated_count INTEGER,
+    skipped_count INTEGER,
+    phase_timings JSONB,
     started_at TIMESTAMPTZ NOT NULL,
     completed_at TIMESTAMPTZ
 );
@@ -69,3 +75,13 @@ CREATE TABLE IF NOT EXISTS findings (
 CREATE INDEX IF NOT EXISTS idx_findings_status ON findings(status);
 CREATE INDEX IF NOT EXISTS idx_findings_severity ON findings(severity);
 CREATE INDEX IF NOT EXISTS idx_findings_scan ON findings(scan_id);
+
+CREATE TABLE IF NOT EXISTS rule_evaluations (
+    resource_id INTEGER NOT NULL REFERENCES resources(id) ON DELETE CASCADE,
+    rule_id INTEGER NOT NULL REFERENCES compliance_rules(id) ON DELETE CASCADE,
+    rule_version VARCHAR(32) NOT NULL,
+    content_hash VARCHAR(32) NOT NULL,
+    passed BOOLEAN NOT NULL,
+    evaluated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (resource_id, rule_id)
+);
@@ -2,63 +2,113 @@
 import json
 import os
 import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
-from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from scanner.json_stream import iter_json_array
+from scanner.scan.external_ingest import ExternalFindingIngest, PartialRunTimeout
+
 CLOUDSPLOIT_DIR = Path(os.environ.get("CLOUDSPLOIT_DIR", "/opt/cloudsploit"))
 
 
-def run_cloudsploit(compliance: str | None = None) -> list[dict[str, Any]]:
+def run_cloudsploit(
+    compliance: str | None = None, timeout: int = 3600, plugin: str | None = None
+) -> Iterator[dict[str, Any]]:
     """
     Run CloudSploit AWS scan. Uses default credential chain (EC2 IAM role).
-    Returns list of findings (non-OK status).
+    Yields findings (non-OK status), streamed from the output file one at a time.
+    Each call writes into its own temp workspace, so concurrent runs never collide.
+    Raises subprocess.TimeoutExpired if the scan exceeds timeout seconds.
+    """
+    with tempfile.TemporaryDirectory(prefix="cloudsploit-") as workspace:
+        out_file = _scan_to_file(Path(workspace), compliance, timeout, plugin)
+        if out_file is not None:
+            yield from _iter_non_ok(out_file)
+
+
+def run_cloudsploit_parallel(
+    db: Session,
+    scan_id: int,
+    plugins: list[str],
+    compliance: str | None = None,
+    timeout: float = 3600,
+    max_parallel: int = 4,
+) -> int:
+    """
+    Run one CloudSploit process per plugin, up to max_parallel at a time, each in its
+    own workspace. Results are merged by ingesting (and committing) each shard's
+    findings on this thread as soon as it finishes.
+    Returns findings ingested; raises PartialRunTimeout if any shard hit the deadline.
     """
+    deadline = time.monotonic() + timeout
+    total = 0
+    timed_out = False
+    with tempfile.TemporaryDirectory(prefix="cloudsploit-") as workspace, \
+            ThreadPoolExecutor(max_workers=max(1, max_parallel), thread_name_prefix="cloudsploit") as pool:
+
+        def scan(shard: int, plugin: str) -> Path | None:
+            shard_dir = Path(workspace) / f"shard-{shard}"
+            shard_dir.mkdir()
+            return _scan_to_file(shard_dir, compliance, max(deadline - time.monotonic(), 1), plugin)
+
+        futures = [pool.submit(scan, i, plugin) for i, plugin in enumerate(dict.fromkeys(plugins))]
+        for future in as_completed(futures):
+            try:
+                out_file = future.result()
+            except subprocess.TimeoutExpired:
+                timed_out = True
+                continue
+            if out_file is not None:
+                total += ingest_cloudsploit_findings(db, _iter_non_ok(out_file), scan_id)
+                out_file.unlink(missing_ok=True)
+    if timed_out:
+        raise PartialRunTimeout(["node", str(CLOUDSPLOIT_DIR / "index.js")], timeout, total)
+    return total
+
+
+def _scan_to_file(workspace: Path, compliance: str | None, timeout: float, plugin: str | None) -> Path | None:
+    """Run CloudSploit writing <workspace>/cloudsploit_out.json. None if unavailable or no output."""
     index_js = CLOUDSPLOIT_DIR / "index.js"
     if not index_js.exists():
-        return []
+        return None
 
-    out_file = Path("/tmp/cloudsploit_out.json")
+    out_file = workspace / "cloudsploit_out.json"
     cmd = ["node", str(index_js), "--json", str(out_file), "--console", "none"]
     if compliance:
         cmd.extend(["--compliance", compliance])
+    if plugin:
+        cmd.extend(["--plugin", plugin])
 
     try:
-        result = subprocess.run(
+        subprocess.run(
             cmd,
             cwd=str(CLOUDSPLOIT_DIR),
             capture_output=True,
             text=True,
-            timeout=3600,
+            timeout=timeout,
             env={**os.environ, "AWS_DEFAULT_REGION": os.environ.get("AWS_REGION", "us-east-1")},
         )
     except subprocess.TimeoutExpired:
-        return []
+        raise
     except Exception:
-        return []
+        return None
 
-    if not out_file.exists():
-        return []
+    return out_file if out_file.exists() else None
 
+
+def _iter_non_ok(out_file: Path) -> Iterator[dict[str, Any]]:
+    """Non-OK findings streamed from a CloudSploit JSON output file."""
     try:
-        data = json.loads(out_file.read_text())
+        for r in iter_json_array(out_file):
+            if isinstance(r, dict) and r.get("status") and str(r.get("status", "")).upper() != "OK":
+                yield r
     except (json.JSONDecodeError, OSError):
-        return []
-    finally:
-        try:
-            out_file.unlink(missing_ok=True)
-        except OSError:
-            pass
-
-    if isinstance(data, list):
-        findings = [r for r in data if r.get("status") and str(r.get("status", "")).upper() != "OK"]
-    elif isinstance(data, dict) and "results" in data:
-        findings = [r for r in data["results"] if r.get("status") and str(r.get("status", "")).upper() != "OK"]
-    else:
-        findings = []
-    return findings
+        return
 
 
 def _category_from_plugin(plugin: str) -> str:
@@ -114,105 +164,43 @@ def _severity_from_cloudsploit(sev: str) -> str:
     return m.get((sev or "").lower(), "medium")
 
 
-def ingest_cloudsploit_findings(db: Session, findings: list[dict], scan_id: int) -> int:
-    """Ingest CloudSploit findings into DB."""
-    count = 0
-    for f in findings:
-        resource_id_str = f.get("resource") or f.get("resourceId") or f.get("ResourceId") or ""
-        region = f.get("region") or f.get("Region") or "global"
-        plugin = f.get("plugin") or f.get("pluginId") or f.get("plugin_id") or "unknown"
-        if not resource_id_str:
-            resource_id_str = f"cloudsploit-{plugin}-{region}"
-
-        resource_type = _resource_type_from_plugin(plugin)
-        category = _category_from_plugin(plugin)
-        rule_id = f"cloudsploit_{plugin}"
-        severity = _severity_from_cloudsploit(f.get("severity") or f.get("Severity"))
-        message = f.get("message") or f.get("statusExtended") or f.get("title", "")
-        remediation = f.get("remediation") or f.get("recommended_action") or ""
-
-        # Upsert resource
-        db.execute(
-            text("""
-                INSERT INTO resources (resource_id, resource_type, region, raw_metadata, collected_at)
-                VALUES (:rid, :rtype, :region, '{}'::jsonb, NOW())
-                ON CONFLICT (resource_id, resource_type)
-                DO UPDATE SET collected_at = NOW()
-            """),
-            {"rid": resource_id_str[:512], "rtype": resource_type, "region": region},
-        )
-        db.commit()
-
-        row = db.execute(
-            text("SELECT id FROM resources WHERE resource_id = :rid AND resource_type = :rtype"),
-            {"rid": resource_id_str[:512], "rtype": resource_type},
-        ).fetchone()
-        if not row:
-            continue
-        res_db_id = row[0]
-
-        # Compliance mappings from CloudSploit
-        compliance = f.get("compliance") or {}
-        mappings = {}
-        if isinstance(compliance, dict):
-            for k, v in compliance.items():
-                if isinstance(v, str) and v:
-                    mappings[k.lower()] = [v]
-                elif isinstance(v, list):
-                    mappings[k.lower()] = v
-
-        # Upsert rule
-        db.execute(
-            text("""
-                INSERT INTO compliance_rules (rule_id, description, resource_type, severity, compliance_mappings, remediation_guidance, category)
-                VALUES (:rid, :desc, :rtype, :sev, CAST(:mappings AS jsonb), :remediation, :category)
-                ON CONFLICT (rule_id) DO UPDATE SET
-                    description = EXCLUDED.description,
-                    resource_type = EXCLUDED.resource_type,
-                    severity = EXCLUDED.severity,
-                    compliance_mappings = EXCLUDED.compliance_mappings,
-                    remediation_guidance = EXCLUDED.remediation_guidance,
-                    category = EXCLUDED.category
-            """),
-            {
-                "rid": rule_id,
-                "desc": f.get("title") or f.get("description") or plugin,
-                "rtype": resource_type,
-                "sev": severity,
-                "mappings": json.dumps(mappings),
-                "remediation": remediation,
-                "category": category[:64],
-            },
-        )
+def ingest_cloudsploit_findings(db: Session, findings: Iterable[dict], scan_id: int) -> int:
+    """Ingest CloudSploit findings into DB. Set-based and committed per batch."""
+    ingest = ExternalFindingIngest(db, scan_id)
+    try:
+        for f in findings:
+            resource_id_str = f.get("resource") or f.get("resourceId") or f.get("ResourceId") or ""
+            region = f.get("region") or f.get("Region") or "global"
+            plugin = f.get("plugin") or f.get("pluginId") or f.get("plugin_id") or "unknown"
+            if not resource_id_str:
+                resource_id_str = f"cloudsploit-{plugin}-{region}"
+
+            resource_type = _resource_type_from_plugin(plugin)
+
+            # Compliance mappings from CloudSploit
+            compliance = f.get("compliance") or {}
+            mappings = {}
+            if isinstance(compliance, dict):
+                for k, v in compliance.items():
+                    if isinstance(v, str) and v:
+                        mappings[k.lower()] = [v]
+                    elif isinstance(v, list):
+                        mappings[k.lower()] = v
+
+            rule = {
+                "rule_id": f"cloudsploit_{plugin}",
+                "description": f.get("title") or f.get("description") or plugin,
+                "resource_type": resource_type,
+                "severity": _severity_from_cloudsploit(f.get("severity") or f.get("Severity")),
+                "compliance_mappings": mappings,
+                "remediation": f.get("remediation") or f.get("recommended_action") or "",
+                "category": _category_from_plugin(plugin),
+            }
+            message = f.get("message") or f.get("statusExtended") or f.get("title", "")
+            ingest.add(resource_id_str, resource_type, region, rule, message)
+        ingest.flush()
         db.commit()
-
-        rule_row = db.execute(text("SELECT id FROM compliance_rules WHERE rule_id = :rid"), {"rid": rule_id}).fetchone()
-        if not rule_row:
-            continue
-        rule_db_id = rule_row[0]
-
-        try:
-            db.execute(
-                text("""
-                    INSERT INTO findings (resource_id, rule_id, severity, status, message, remediation, scan_id, last_seen_at)
-                    VALUES (:res_id, :rule_id, :sev, 'open', :msg, :remediation, :scan_id, NOW())
-                    ON CONFLICT (resource_id, rule_id) DO UPDATE SET
-                        message = EXCLUDED.message,
-                        remediation = EXCLUDED.remediation,
-                        scan_id = EXCLUDED.scan_id,
-                        last_seen_at = NOW()
-                """),
-                {
-                    "res_id": res_db_id,
-                    "rule_id": rule_db_id,
-                    "sev": severity,
-                    "msg": message[:2000],
-                    "remediation": remediation[:5000],
-                    "scan_id": scan_id,
-                },
-            )
-            count += 1
-        except Exception:
-            pass
-    db.commit()
-    return count
+    except Exception:
+        db.rollback()
+        raise
+    return ingest.written
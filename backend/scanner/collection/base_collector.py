@@ -1,16 +1,37 @@
 """Base collector - uses boto3 default credential chain (EC2 IAM role)."""
 import json
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Iterator
 
-import boto3
 from botocore.exceptions import ClientError
 
+from scanner.collection.client_pool import client_pool
+
+
+# default=str matches the old json.loads(json.dumps(..., default=str)) round trip:
+# datetimes, Decimals etc. become strings, but only once, when the row is written.
+_METADATA_ENCODER = json.JSONEncoder(default=str, separators=(",", ":"))
+
+
+def dumps_metadata(metadata: Any) -> str:
+    """Serialize raw_metadata straight to DB-ready JSON text in a single pass."""
+    try:
+        return _METADATA_ENCODER.encode(metadata)
+    except (TypeError, ValueError):
+        return _METADATA_ENCODER.encode({"_raw": str(metadata)})
+
+
+def get_client(service: str, region: str | None = None):
+    """Shared boto3 client via the default credential chain (thread-safe)."""
+    return client_pool.client(service, region)
+
 
 class BaseCollector(ABC):
     """Base class for AWS resource collectors. Uses default credential chain."""
 
     resource_type: str = ""
+    # Global services (S3, IAM) are collected once instead of once per region.
+    is_global: bool = False
 
     def __init__(self, region: str = "us-east-1"):
         self.region = region
@@ -26,13 +47,32 @@ class BaseCollector(ABC):
     def client(self):
         """Lazy boto3 client - uses default credential chain (EC2 IAM role)."""
         if self._client is None:
-            self._client = boto3.client(self.service_name, region_name=self.region)
+            self._client = get_client(self.service_name, self.region)
         return self._client
 
     @abstractmethod
+    def iter_collect_region(self, region: str) -> Iterator[dict[str, Any]]:
+        """Yield resources in one region (called with self.region for global services)."""
+        pass
+
+    def iter_collect(self, regions: list[str] | None = None) -> Iterator[dict[str, Any]]:
+        """Yield resources across all regions as paginator pages arrive (constant memory)."""
+        for region in self.regions(regions):
+            yield from self.iter_collect_region(region)
+
     def collect(self) -> list[dict[str, Any]]:
         """Collect resources. Returns list of {resource_id, region, metadata}."""
-        pass
+        return list(self.iter_collect())
+
+    def regions(self, available: list[str] | None = None) -> list[str]:
+        """Regions this collector runs in; `available` avoids a describe_regions call."""
+        if self.is_global:
+            return [self.region]
+        return available if available is not None else self._get_regions()
+
+    def _get_regions(self) -> list[str]:
+        """Get enabled regions (cached in the client pool for the run)."""
+        return client_pool.regions(self.region)
 
     def _normalize(self, resource_id: str, region: str, metadata: dict) -> dict:
         """Normalize for storage."""
@@ -44,10 +84,12 @@ class BaseCollector(ABC):
         }
 
     def _safe_json(self, obj: Any) -> dict:
-        """Convert to JSON-serializable dict."""
+        """
+        Shallow copy of a boto3 response dict; non-JSON values are converted by dumps_metadata on write.
+        ResponseMetadata (request id, date headers) is dropped so unchanged resources hash the same.
+        """
         if obj is None:
             return {}
-        try:
-            return json.loads(json.dumps(obj, default=str))
-        except (TypeError, ValueError):
+        if not isinstance(obj, dict):
             return {"_raw": str(obj)}
+        return {k: v for k, v in obj.items() if k != "ResponseMetadata"}
@@ -0,0 +1,85 @@
+"""Process-wide boto3 client pool - one client per (service, region, credentials)."""
+import threading
+from typing import Any
+
+import boto3
+
+
+class ClientPool:
+    """
+    Lazily builds and reuses boto3 clients across collectors, regions and runs.
+    Built on one default-chain Session (EC2 IAM role); boto3 sessions are not
+    thread-safe, so builds are serialized while cached lookups are lock-free.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._session: boto3.session.Session | None = None
+        # (service, region) -> (credentials key, client). A rotated access key
+        # (e.g. a refreshed instance role) replaces the stale client.
+        self._clients: dict[tuple[str, str | None], tuple[str | None, Any]] = {}
+        self._regions: dict[str, list[str]] = {}
+
+    def client(self, service: str, region: str | None = None):
+        """Get (or build) the shared client for service/region."""
+        key = (service, region)
+        session = self._get_session()
+        creds = self._credentials_key(session)
+        cached = self._clients.get(key)
+        if cached is not None and cached[0] == creds:
+            return cached[1]
+        with self._lock:
+            cached = self._clients.get(key)
+            if cached is None or cached[0] != creds:
+                cached = (creds, session.client(service, region_name=region))
+                self._clients[key] = cached
+            return cached[1]
+
+    def put(self, service: str, region: str | None, client: Any) -> None:
+        """Register a prebuilt client (e.g. wrapped in botocore Stubber)."""
+        creds = self._credentials_key(self._get_session())
+        with self._lock:
+            self._clients[(service, region)] = (creds, client)
+
+    def regions(self, region: str) -> list[str]:
+        """Enabled regions, cached until clear_regions(); falls back to [region] uncached on error."""
+        cached = self._regions.get(region)
+        if cached is not None:
+            return cached
+        try:
+            resp = self.client("ec2", region).describe_regions()
+        except Exception:
+            return [region]
+        regions = [r["RegionName"] for r in resp.get("Regions", [])]
+        self._regions[region] = regions
+        return regions
+
+    def clear_regions(self) -> None:
+        """Forget the region list so the next run re-discovers enabled regions."""
+        self._regions.clear()
+
+    def clear(self) -> None:
+        """Drop all clients and cached regions."""
+        with self._lock:
+            self._clients.clear()
+            self._regions.clear()
+            self._session = None
+
+    def _get_session(self) -> boto3.session.Session:
+        session = self._session
+        if session is None:
+            with self._lock:
+                if self._session is None:
+                    session = boto3.session.Session()
+                    session.get_credentials()  # Resolve the credential chain once, under the lock
+                    self._session = session
+                session = self._session
+        return session
+
+    @staticmethod
+    def _credentials_key(session: boto3.session.Session) -> str | None:
+        creds = session.get_credentials()
+        return creds.access_key if creds is not None else None
+
+
+client_pool = ClientPool()
@@ -1,17 +1,24 @@
 """Orchestrates collection phase - runs all collectors and stores in PostgreSQL."""
+import threading
+import time
 from datetime import datetime
+from queue import Queue
 from typing import Any
 
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from config import settings
+from scanner.collection.base_collector import BaseCollector
+from scanner.collection.client_pool import client_pool
 from scanner.collection.ec2_collector import EC2Collector
 from scanner.collection.s3_collector import S3Collector
 from scanner.collection.iam_collector import IAMCollector
 from scanner.collection.security_group_collector import SecurityGroupCollector
 from scanner.collection.rds_collector import RDSCollector
 from scanner.collection.vpc_collector import VPCCollector
+from scanner.collection.parallel import run_parallel
+from scanner.collection.resource_writer import BulkResourceWriter
 
 
 COLLECTORS = [
@@ -23,6 +30,8 @@ COLLECTORS = [
     VPCCollector,
 ]
 
+_DONE = object()  # Queue sentinel: all collectors finished
+
 
 def run_collection(db: Session) -> dict[str, Any]:
     """
@@ -41,30 +50,47 @@ def run_collection(db: Session) -> dict[str, Any]:
     scan_id = scan_row[0]
     db.commit()
 
-    total = 0
-    errors = []
+    errors: list[str] = []
+    collectors = [cls(region=settings.aws_region) for cls in COLLECTORS]
+    # Resolved once per run and shared by all regional collectors; clients persist across runs.
+    client_pool.clear_regions()
+    regions = client_pool.regions(settings.aws_region)
 
-    for collector_cls in COLLECTORS:
-        try:
-            collector = collector_cls(region=settings.aws_region)
-            items = collector.collect()
-            for item in items:
-                _upsert_resource(db, item)
-                total += 1
-        except Exception as e:
-            errors.append(f"{collector_cls.__name__}: {e}")
+    # Collector threads put items on a bounded queue (backpressure when the DB
+    # falls behind); this thread owns the Session and writes them in batches.
+    items: Queue = Queue(maxsize=settings.collection_queue_size)
+    producer = threading.Thread(
+        target=_produce, args=(collectors, regions, items, errors), name="collect-producer", daemon=True
+    )
+    writer = BulkResourceWriter(db, batch_size=settings.resource_batch_size)
+    start = time.perf_counter()
+    producer.start()
+    try:
+        for item in iter(items.get, _DONE):
+            writer.add(item)
+        writer.flush()
+    finally:
+        if producer.is_alive():
+            # Writer failed: unblock collectors so the producer can finish.
+            for _ in iter(items.get, _DONE):
+                pass
+        producer.join()
+    elapsed = time.perf_counter() - start
+    total = writer.written
 
     db.execute(
         text("""
             UPDATE scan_history
             SET status = 'completed', resource_count = :total,
-                completed_at = :completed, error_message = :err
+                completed_at = :completed, error_message = :err,
+                resources_per_sec = :rps
             WHERE id = :scan_id
         """),
         {
             "total": total,
             "completed": datetime.utcnow(),
             "err": "; ".join(errors) if errors else None,
+            "rps": round(total / elapsed, 1) if elapsed > 0 else None,
             "scan_id": scan_id,
         },
     )
@@ -73,20 +99,20 @@ def run_collection(db: Session) -> dict[str, Any]:
     return {"scan_id": scan_id, "resource_count": total, "errors": errors}
 
 
-def _upsert_resource(db: Session, item: dict) -> None:
-    """Insert or update resource."""
-    import json
-    db.execute(
-        text("""
-            INSERT INTO resources (resource_id, resource_type, region, raw_metadata, collected_at)
-            VALUES (:rid, :rtype, :region, CAST(:meta AS jsonb), NOW())
-            ON CONFLICT (resource_id, resource_type)
-            DO UPDATE SET raw_metadata = CAST(:meta AS jsonb), collected_at = NOW()
-        """),
-        {
-            "rid": item["resource_id"],
-            "rtype": item["resource_type"],
-            "region": item.get("region"),
-            "meta": json.dumps(item.get("raw_metadata", {})),
-        },
-    )
+def _produce(collectors: list[BaseCollector], regions: list[str], items: Queue, errors: list[str]) -> None:
+    """Run collectors concurrently, streaming their items onto the queue."""
+    try:
+        for result in run_parallel(
+            collectors,
+            regions,
+            max_workers=settings.collection_max_workers,
+            service_limits=settings.collection_service_limits,
+            default_limit=settings.collection_service_concurrency,
+            sink=items.put,
+        ):
+            if result.error is not None:
+                errors.append(f"{result.collector} ({result.region}): {result.error}")
+    except Exception as e:
+        errors.append(f"collection: {e}")
+    finally:
+        items.put(_DONE)
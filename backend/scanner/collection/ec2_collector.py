@@ -1,7 +1,7 @@
 """EC2 instances collector."""
-from typing import Any
+from typing import Any, Iterator
 
-from .base_collector import BaseCollector
+from .base_collector import BaseCollector, get_client
 
 
 class EC2Collector(BaseCollector):
@@ -10,37 +10,21 @@ class EC2Collector(BaseCollector):
     resource_type = "ec2_instance"
     service_name = "ec2"
 
-    def collect(self) -> list[dict[str, Any]]:
-        """Collect EC2 instances across regions."""
-        results = []
-        regions = self._get_regions()
-
-        for region in regions:
-            try:
-                client = boto3.client("ec2", region_name=region)
-                paginator = client.get_paginator("describe_instances")
-                for page in paginator.paginate():
-                    for reservation in page.get("Reservations", []):
-                        for instance in reservation.get("Instances", []):
-                            instance_id = instance.get("InstanceId", "")
-                            metadata = self._safe_json(instance)
-                            results.append(
-                                self._normalize(instance_id, region, metadata)
-                            )
-            except Exception as e:
-                results.append({
-                    "resource_id": f"ec2-error-{region}",
-                    "resource_type": self.resource_type,
-                    "region": region,
-                    "raw_metadata": {"_error": str(e)},
-                })
-        return results
-
-    def _get_regions(self) -> list[str]:
-        """Get enabled regions."""
+    def iter_collect_region(self, region: str) -> Iterator[dict[str, Any]]:
+        """Collect EC2 instances in one region."""
         try:
-            ec2 = boto3.client("ec2", region_name=self.region)
-            resp = ec2.describe_regions()
-            return [r["RegionName"] for r in resp.get("Regions", [])]
-        except Exception:
-            return [self.region]
+            client = get_client("ec2", region)
+            paginator = client.get_paginator("describe_instances")
+            for page in paginator.paginate():
+                for reservation in page.get("Reservations", []):
+                    for instance in reservation.get("Instances", []):
+                        instance_id = instance.get("InstanceId", "")
+                        metadata = self._safe_json(instance)
+                        yield self._normalize(instance_id, region, metadata)
+        except Exception as e:
+            yield {
+                "resource_id": f"ec2-error-{region}",
+                "resource_type": self.resource_type,
+                "region": region,
+                "raw_metadata": {"_error": str(e)},
+            }
@@ -1,9 +1,7 @@
 """IAM roles and policies collector."""
-from typing import Any
+from typing import Any, Iterator
 
-import boto3
-
-from .base_collector import BaseCollector
+from .base_collector import BaseCollector, get_client
 
 
 class IAMCollector(BaseCollector):
@@ -11,12 +9,12 @@ class IAMCollector(BaseCollector):
 
     resource_type = "iam_role"
     service_name = "iam"
+    is_global = True
 
-    def collect(self) -> list[dict[str, Any]]:
+    def iter_collect_region(self, region: str) -> Iterator[dict[str, Any]]:
         """Collect IAM roles with attached policies."""
-        results = []
         try:
-            client = boto3.client("iam")
+            client = get_client("iam")
 
             # Roles
             paginator = client.get_paginator("list_roles")
@@ -41,9 +39,7 @@ class IAMCollector(BaseCollector):
                     except Exception:
                         metadata["InlinePolicies"] = []
 
-                    results.append(
-                        self._normalize(role_arn, "global", metadata)
-                    )
+                    yield self._normalize(role_arn, "global", metadata)
 
             # Policies (managed, customer-managed only)
             paginator = client.get_paginator("list_policies")
@@ -53,13 +49,12 @@ class IAMCollector(BaseCollector):
                     metadata = self._safe_json(policy)
                     item = self._normalize(arn, "global", {"_type": "policy", **metadata})
                     item["resource_type"] = "iam_policy"
-                    results.append(item)
+                    yield item
 
         except Exception as e:
-            results.append({
+            yield {
                 "resource_id": "iam-error",
                 "resource_type": self.resource_type,
                 "region": "global",
                 "raw_metadata": {"_error": str(e)},
-            })
-        return results
+            }
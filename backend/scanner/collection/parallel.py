@@ -0,0 +1,99 @@
+"""Concurrent collection engine - fans collectors x regions out over a bounded thread pool."""
+import time
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator
+
+from scanner.collection.base_collector import BaseCollector
+
+
+@dataclass
+class RegionResult:
+    """Outcome of one collector.iter_collect_region(region) task."""
+
+    collector: str
+    service: str
+    region: str
+    items: list[dict[str, Any]] = field(default_factory=list)
+    count: int = 0
+    error: Exception | None = None
+    elapsed: float = 0.0
+
+
+def plan_tasks(collectors: list[BaseCollector], regions: list[str]) -> list[tuple[BaseCollector, str]]:
+    """One (collector, region) task per region for regional collectors, one for global ones."""
+    return [(c, region) for c in collectors for region in c.regions(regions)]
+
+
+def run_parallel(
+    collectors: list[BaseCollector],
+    regions: list[str],
+    max_workers: int = 16,
+    service_limits: dict[str, int] | None = None,
+    default_limit: int = 4,
+    sink: Callable[[dict[str, Any]], None] | None = None,
+) -> Iterator[RegionResult]:
+    """
+    Run every (collector, region) task concurrently and yield results as they finish.
+
+    At most max_workers tasks run at once, and at most service_limits[service]
+    (default_limit if unset) per boto3 service so one API is not throttled by
+    the whole pool. Tasks are only submitted once a slot for their service is
+    free, so a busy service never parks pool threads that another service could use.
+
+    With a sink, workers hand each item to it (e.g. a bounded Queue.put) as it is
+    collected and RegionResult.items stays empty; only count is reported.
+    """
+    service_limits = service_limits or {}
+    max_workers = max(1, max_workers)
+    pending: dict[str, deque[tuple[BaseCollector, str]]] = {}
+    for collector, region in plan_tasks(collectors, regions):
+        pending.setdefault(collector.service_name, deque()).append((collector, region))
+
+    def limit(service: str) -> int:
+        return max(1, service_limits.get(service, default_limit))
+
+    active: Counter[str] = Counter()
+    running: dict[Future, tuple[BaseCollector, str]] = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="collect") as pool:
+
+        def fill() -> None:
+            # Round-robin across services so each gets slots as soon as they free up.
+            progressed = True
+            while progressed and len(running) < max_workers:
+                progressed = False
+                for service, queue in pending.items():
+                    if queue and active[service] < limit(service) and len(running) < max_workers:
+                        collector, region = queue.popleft()
+                        running[pool.submit(_run_task, collector, region, sink)] = (collector, region)
+                        active[service] += 1
+                        progressed = True
+
+        fill()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                collector, _region = running.pop(future)
+                active[collector.service_name] -= 1
+                yield future.result()
+            fill()
+
+
+def _run_task(
+    collector: BaseCollector, region: str, sink: Callable[[dict[str, Any]], None] | None
+) -> RegionResult:
+    result = RegionResult(type(collector).__name__, collector.service_name, region)
+    start = time.perf_counter()
+    try:
+        for item in collector.iter_collect_region(region):
+            if sink is None:
+                result.items.append(item)
+            else:
+                sink(item)
+            result.count += 1
+    except Exception as e:
+        result.error = e
+    result.elapsed = time.perf_counter() - start
+    return result
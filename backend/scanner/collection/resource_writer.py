@@ -0,0 +1,67 @@
+"""Bulk resource writer - buffers collected resources and upserts them in batches."""
+import hashlib
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from scanner.collection.base_collector import dumps_metadata
+from scanner.db_utils import values_clause
+
+DEFAULT_BATCH_SIZE = 500
+
+_RESOURCE_COLUMNS = ("rid", "rtype", "region", "meta", "hash")
+
+
+class BulkResourceWriter:
+    """
+    Set-based resource writer.
+    Resources are buffered and written as one multi-row INSERT ... ON CONFLICT
+    per batch, each batch in its own transaction.
+    """
+
+    def __init__(self, db: Session, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.db = db
+        self.batch_size = max(1, batch_size)
+        self.written = 0
+        # Keyed by (resource_id, resource_type): Postgres rejects an upsert that
+        # touches the same conflict target twice in one statement.
+        self._buffer: dict[tuple[str, str], dict] = {}
+
+    def add(self, item: dict[str, Any]) -> None:
+        """Buffer a normalized collector item, flushing when the batch is full."""
+        meta = dumps_metadata(item.get("raw_metadata", {}))
+        self._buffer[(item["resource_id"], item["resource_type"])] = {
+            "rid": item["resource_id"],
+            "rtype": item["resource_type"],
+            "region": item.get("region"),
+            "meta": meta,
+            # Lets run_scan skip re-evaluating resources whose metadata did not change.
+            "hash": hashlib.blake2b(meta.encode(), digest_size=16).hexdigest(),
+        }
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write and commit buffered resources. Returns number of rows sent."""
+        if not self._buffer:
+            return 0
+        rows = list(self._buffer.values())
+        self._buffer.clear()
+
+        values, params = values_clause(rows, _RESOURCE_COLUMNS)
+
+        self.db.execute(
+            text(f"""
+                INSERT INTO resources (resource_id, resource_type, region, raw_metadata, content_hash, collected_at)
+                SELECT v.rid, v.rtype, v.region, CAST(v.meta AS jsonb), v.hash, NOW()
+                FROM (VALUES {values}) AS v(rid, rtype, region, meta, hash)
+                ON CONFLICT (resource_id, resource_type)
+                DO UPDATE SET raw_metadata = EXCLUDED.raw_metadata, content_hash = EXCLUDED.content_hash,
+                              collected_at = NOW()
+            """),
+            params,
+        )
+        self.db.commit()
+        self.written += len(rows)
+        return len(rows)
@@ -1,10 +1,9 @@
 """S3 buckets collector."""
-from typing import Any
+from typing import Any, Iterator
 
-import boto3
 from botocore.exceptions import ClientError
 
-from .base_collector import BaseCollector
+from .base_collector import BaseCollector, get_client
 
 
 class S3Collector(BaseCollector):
@@ -12,12 +11,12 @@ class S3Collector(BaseCollector):
 
     resource_type = "s3_bucket"
     service_name = "s3"
+    is_global = True
 
-    def collect(self) -> list[dict[str, Any]]:
+    def iter_collect_region(self, region: str) -> Iterator[dict[str, Any]]:
         """Collect S3 buckets and their config."""
-        results = []
         try:
-            client = boto3.client("s3")
+            client = get_client("s3")
             buckets = client.list_buckets().get("Buckets", [])
 
             for bucket in buckets:
@@ -33,31 +32,28 @@ class S3Collector(BaseCollector):
 
                 try:
                     ver = client.get_bucket_versioning(Bucket=name)
-                    metadata["Versioning"] = ver
+                    metadata["Versioning"] = self._safe_json(ver)
                 except ClientError:
                     metadata["Versioning"] = {}
 
                 try:
                     enc = client.get_bucket_encryption(Bucket=name)
-                    metadata["Encryption"] = enc
+                    metadata["Encryption"] = self._safe_json(enc)
                 except ClientError:
                     metadata["Encryption"] = {}
 
                 try:
                     pab = client.get_public_access_block(Bucket=name)
-                    metadata["PublicAccessBlock"] = pab
+                    metadata["PublicAccessBlock"] = self._safe_json(pab)
                 except ClientError:
                     metadata["PublicAccessBlock"] = {}
 
                 metadata = self._safe_json(metadata)
-                results.append(
-                    self._normalize(f"arn:aws:s3:::{name}", "us-east-1", metadata)
-                )
+                yield self._normalize(f"arn:aws:s3:::{name}", "us-east-1", metadata)
         except Exception as e:
-            results.append({
+            yield {
                 "resource_id": "s3-error",
                 "resource_type": self.resource_type,
                 "region": "global",
                 "raw_metadata": {"_error": str(e)},
-            })
-        return results
+            }
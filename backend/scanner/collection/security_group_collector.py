@@ -1,7 +1,7 @@
 """Security groups collector."""
-from typing import Any
+from typing import Any, Iterator
 
-from .base_collector import BaseCollector
+from .base_collector import BaseCollector, get_client
 
 
 class SecurityGroupCollector(BaseCollector):
@@ -10,37 +10,22 @@ class SecurityGroupCollector(BaseCollector):
     resource_type = "security_group"
     service_name = "ec2"
 
-    def collect(self) -> list[dict[str, Any]]:
-        """Collect security groups per region."""
-        results = []
-        regions = self._get_regions()
-
-        for region in regions:
-            try:
-                client = boto3.client("ec2", region_name=region)
-                paginator = client.get_paginator("describe_security_groups")
-                for page in paginator.paginate():
-                    for sg in page.get("SecurityGroups", []):
-                        sg_id = sg.get("GroupId", "")
-                        metadata = self._safe_json(sg)
-                        metadata["IpPermissions"] = sg.get("IpPermissions", [])
-                        metadata["IpPermissionsEgress"] = sg.get("IpPermissionsEgress", [])
-                        results.append(
-                            self._normalize(sg_id, region, metadata)
-                        )
-            except Exception as e:
-                results.append({
-                    "resource_id": f"sg-error-{region}",
-                    "resource_type": self.resource_type,
-                    "region": region,
-                    "raw_metadata": {"_error": str(e)},
-                })
-        return results
-
-    def _get_regions(self) -> list[str]:
+    def iter_collect_region(self, region: str) -> Iterator[dict[str, Any]]:
+        """Collect security groups in one region."""
         try:
-            ec2 = boto3.client("ec2", region_name=self.region)
-            resp = ec2.describe_regions()
-            return [r["RegionName"] for r in resp.get("Regions", [])]
-        except Exception:
-            return [self.region]
+            client = get_client("ec2", region)
+            paginator = client.get_paginator("describe_security_groups")
+            for page in paginator.paginate():
+                for sg in page.get("SecurityGroups", []):
+                    sg_id = sg.get("GroupId", "")
+                    metadata = self._safe_json(sg)
+                    metadata["IpPermissions"] = sg.get("IpPermissions", [])
+                    metadata["IpPermissionsEgress"] = sg.get("IpPermissionsEgress", [])
+                    yield self._normalize(sg_id, region, metadata)
+        except Exception as e:
+            yield {
+                "resource_id": f"sg-error-{region}",
+                "resource_type": self.resource_type,
+                "region": region,
+                "raw_metadata": {"_error": str(e)},
+            }
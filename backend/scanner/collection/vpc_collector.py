@@ -1,7 +1,7 @@
 """VPC configurations collector."""
-from typing import Any
+from typing import Any, Iterator
 
-from .base_collector import BaseCollector
+from .base_collector import BaseCollector, get_client
 
 
 class VPCCollector(BaseCollector):
@@ -10,54 +10,39 @@ class VPCCollector(BaseCollector):
     resource_type = "vpc"
     service_name = "ec2"
 
-    def collect(self) -> list[dict[str, Any]]:
-        """Collect VPCs per region."""
-        results = []
-        regions = self._get_regions()
-
-        for region in regions:
-            try:
-                client = boto3.client("ec2", region_name=region)
-                paginator = client.get_paginator("describe_vpcs")
-                for page in paginator.paginate():
-                    for vpc in page.get("Vpcs", []):
-                        vpc_id = vpc.get("VpcId", "")
-                        metadata = self._safe_json(vpc)
-
-                        # Subnets
-                        try:
-                            subnets = client.describe_subnets(
-                                Filters=[{"Name": "vpc-id", "Values": [vpc_id]}]
-                            )
-                            metadata["Subnets"] = subnets.get("Subnets", [])
-                        except Exception:
-                            metadata["Subnets"] = []
-
-                        # Flow logs
-                        try:
-                            flow = client.describe_flow_logs(
-                                Filter=[{"Name": "resource-id", "Values": [vpc_id]}]
-                            )
-                            metadata["FlowLogs"] = flow.get("FlowLogs", [])
-                        except Exception:
-                            metadata["FlowLogs"] = []
-
-                        results.append(
-                            self._normalize(vpc_id, region, metadata)
-                        )
-            except Exception as e:
-                results.append({
-                    "resource_id": f"vpc-error-{region}",
-                    "resource_type": self.resource_type,
-                    "region": region,
-                    "raw_metadata": {"_error": str(e)},
-                })
-        return results
-
-    def _get_regions(self) -> list[str]:
+    def iter_collect_region(self, region: str) -> Iterator[dict[str, Any]]:
+        """Collect VPCs in one region."""
         try:
-            ec2 = boto3.client("ec2", region_name=self.region)
-            resp = ec2.describe_regions()
-            return [r["RegionName"] for r in resp.get("Regions", [])]
-        except Exception:
-            return [self.region]
+            client = get_client("ec2", region)
+            paginator = client.get_paginator("describe_vpcs")
+            for page in paginator.paginate():
+                for vpc in page.get("Vpcs", []):
+                    vpc_id = vpc.get("VpcId", "")
+                    metadata = self._safe_json(vpc)
+
+                    # Subnets
+                    try:
+                        subnets = client.describe_subnets(
+                            Filters=[{"Name": "vpc-id", "Values": [vpc_id]}]
+                        )
+                        metadata["Subnets"] = subnets.get("Subnets", [])
+                    except Exception:
+                        metadata["Subnets"] = []
+
+                    # Flow logs
+                    try:
+                        flow = client.describe_flow_logs(
+                            Filter=[{"Name": "resource-id", "Values": [vpc_id]}]
+                        )
+                        metadata["FlowLogs"] = flow.get("FlowLogs", [])
+                    except Exception:
+                        metadata["FlowLogs"] = []
+
+                    yield self._normalize(vpc_id, region, metadata)
+        except Exception as e:
+            yield {
+                "resource_id": f"vpc-error-{region}",
+                "resource_type": self.resource_type,
+                "region": region,
+                "raw_metadata": {"_error": str(e)},
+            }
@@ -0,0 +1,15 @@
+"""SQL helpers shared by the bulk writers."""
+
+
+def values_clause(rows: list[dict], columns: tuple[str, ...]) -> tuple[str, dict]:
+    """
+    Multi-row VALUES list for rows, with :{col}_{i} placeholders, and its params.
+    Use as `FROM (VALUES {values}) AS v(...)`; one statement per batch of rows.
+    """
+    params: dict = {}
+    values = []
+    for i, row in enumerate(rows):
+        values.append("(" + ", ".join(f":{col}_{i}" for col in columns) + ")")
+        for col in columns:
+            params[f"{col}_{i}"] = row[col]
+    return ", ".join(values), params
@@ -0,0 +1,116 @@
+"""Incremental JSON array reader for large scanner output files.
+
+Yields the elements of a top-level array (or of one array-valued key of a
+top-level object, e.g. {"results": [...]}) one at a time, reading the file in
+chunks. Memory stays around one element plus one read chunk, instead of the
+full text plus the full object graph that json.loads(path.read_text()) holds.
+"""
+import json
+from pathlib import Path
+from typing import Any, Iterator, TextIO
+
+CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+_decoder = json.JSONDecoder()
+
+
+class _Reader:
+    """Sliding text buffer over a file; decodes one JSON value at a time."""
+
+    def __init__(self, fh: TextIO, chunk_size: int):
+        self.fh = fh
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, size: int) -> bool:
+        if self.eof:
+            return False
+        chunk = self.fh.read(size)
+        if not chunk:
+            self.eof = True
+            return False
+        if self.pos:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        self.buf += chunk
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character ('' at end of file), without consuming it."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill(self.chunk_size):
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise json.JSONDecodeError(f"Expecting {char!r}", self.buf, self.pos)
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value, reading more input until it parses."""
+        self.peek()
+        size = self.chunk_size
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                # Probably truncated by the buffer edge; grow reads so large values stay linear.
+                if not self._fill(size):
+                    raise
+                size *= 2
+                continue
+            if (
+                isinstance(obj, (int, float))
+                and not self.eof
+                and all(c in _NUMBER_CHARS for c in self.buf[end:])
+            ):
+                # A number cut by the buffer edge (e.g. "1." or "1.25e") may continue in the next chunk.
+                if self._fill(size):
+                    continue
+            self.pos = end
+            return obj
+
+
+def iter_json_array(path: str | Path, key: str = "results", chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Yield elements of the top-level array in path, or of the array under `key`
+    if the document is an object. Other top-level shapes yield nothing.
+    Raises json.JSONDecodeError on malformed input (after yielding the elements before it).
+    """
+    with open(path, encoding="utf-8") as fh:
+        reader = _Reader(fh, chunk_size)
+        first = reader.peek()
+        if first == "[":
+            yield from _iter_array(reader)
+        elif first == "{":
+            reader.expect("{")
+            while reader.peek() != "}":
+                name = reader.value()
+                reader.expect(":")
+                if name == key and reader.peek() == "[":
+                    yield from _iter_array(reader)
+                    return
+                reader.value()  # Skip other members
+                if reader.peek() == ",":
+                    reader.expect(",")
+
+
+def _iter_array(reader: _Reader) -> Iterator[Any]:
+    reader.expect("[")
+    if reader.peek() == "]":
+        return
+    while True:
+        yield reader.value()
+        if reader.peek() == ",":
+            reader.expect(",")
+            continue
+        reader.expect("]")
+        return
@@ -0,0 +1,98 @@
+"""On-disk checkpoint for per-service Prowler runs - lets a timed-out or restarted scan resume."""
+import fcntl
+import json
+import os
+import time
+from pathlib import Path
+
+# Unit lifecycle: pending -> scanned (output file complete) -> ingested; failed after max attempts.
+PENDING, SCANNED, INGESTED, FAILED = "pending", "scanned", "ingested", "failed"
+
+_LOCK_POLL_SECONDS = 0.5
+
+
+class CheckpointBusy(RuntimeError):
+    """Another worker holds the checkpoint directory."""
+
+
+class ProwlerCheckpoint:
+    """
+    <directory>/state.json records each unit's status and attempts; completed
+    Prowler output files stay next to it until they are ingested.
+    State is reset when the run key (compliance + services) changes or it is
+    older than max_age_hours. Use as a context manager: holds an exclusive lock,
+    waiting up to lock_timeout seconds for another worker to release it.
+    """
+
+    def __init__(self, directory: str | Path, key: str, max_age_hours: float = 24, lock_timeout: float = 0):
+        self.directory = Path(directory)
+        self.key = key
+        self.max_age = max_age_hours * 3600
+        self.lock_timeout = lock_timeout
+        self._state: dict = {}
+        self._lock_fh = None
+
+    def __enter__(self) -> "ProwlerCheckpoint":
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock_fh = open(self.directory / ".lock", "w")
+        deadline = time.monotonic() + self.lock_timeout
+        while True:
+            try:
+                fcntl.flock(self._lock_fh, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    self._lock_fh.close()
+                    raise CheckpointBusy(f"Prowler checkpoint in use: {self.directory}")
+                time.sleep(min(_LOCK_POLL_SECONDS, max(0.0, deadline - time.monotonic())))
+        self._state = self._load()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        fcntl.flock(self._lock_fh, fcntl.LOCK_UN)
+        self._lock_fh.close()
+
+    def status(self, unit: str) -> str:
+        return self._unit(unit)["status"]
+
+    def attempts(self, unit: str) -> int:
+        return self._unit(unit)["attempts"]
+
+    def output_path(self, unit: str) -> Path:
+        return self.directory / f"{unit}.json"
+
+    def start_attempt(self, unit: str) -> None:
+        self._unit(unit)["attempts"] += 1
+        self._save()
+
+    def mark(self, unit: str, status: str) -> None:
+        self._unit(unit)["status"] = status
+        self._save()
+
+    def clear(self) -> None:
+        """Remove state and outputs once every unit is done; the next run starts fresh."""
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+        self._state = self._fresh()
+
+    def _unit(self, unit: str) -> dict:
+        return self._state["units"].setdefault(unit, {"status": PENDING, "attempts": 0})
+
+    def _fresh(self) -> dict:
+        return {"key": self.key, "created_at": time.time(), "units": {}}
+
+    def _load(self) -> dict:
+        try:
+            state = json.loads((self.directory / "state.json").read_text())
+        except (OSError, ValueError):
+            return self._fresh()
+        if state.get("key") != self.key or time.time() - state.get("created_at", 0) > self.max_age:
+            self.clear()
+            return self._fresh()
+        return state
+
+    def _save(self) -> None:
+        # Write-then-rename so a crash never leaves a truncated state file.
+        tmp = self.directory / "state.json.tmp"
+        tmp.write_text(json.dumps(self._state))
+        os.replace(tmp, self.directory / "state.json")
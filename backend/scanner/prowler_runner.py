@@ -1,14 +1,21 @@
 """Run Prowler AWS scan and parse JSON output into findings."""
 import json
+import logging
 import os
 import subprocess
 import tempfile
+import time
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
-from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from scanner.json_stream import iter_json_array
+from scanner.prowler_checkpoint import FAILED, INGESTED, SCANNED, CheckpointBusy, ProwlerCheckpoint
+from scanner.scan.external_ingest import ExternalFindingIngest, PartialRunTimeout
+
+logger = logging.getLogger(__name__)
+
 
 def _prowler_bin() -> str:
     """Prowler binary - use venv if available."""
@@ -18,51 +25,150 @@ def _prowler_bin() -> str:
     return "prowler"
 
 
-def run_prowler(compliance: str | None = None) -> list[dict[str, Any]]:
+def run_prowler(
+    compliance: str | None = None, timeout: int = 3600, services: list[str] | None = None
+) -> Iterator[dict[str, Any]]:
     """
     Run Prowler AWS scan. Uses default credential chain (EC2 IAM role).
-    Returns list of findings (FAIL status only).
+    Yields findings (FAIL status only), streamed from the output file one at a time.
+    Raises subprocess.TimeoutExpired if the scan exceeds timeout seconds.
     """
     with tempfile.TemporaryDirectory() as tmp:
-        out_file = Path(tmp) / "prowler_output.json"
-        cmd = [
-            _prowler_bin(), "aws",
-            "-M", "json",
-            "-F", out_file.stem,
-            "-o", tmp,
-            "--quiet",
-        ]
-        if compliance:
-            cmd.extend(["--compliance", compliance])
-
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=3600,
-                env={**os.environ, "AWS_DEFAULT_REGION": os.environ.get("AWS_REGION", "us-east-1")},
+        out_file = _scan_to_file(Path(tmp), "prowler_output", compliance, timeout, services)
+        if out_file is not None:
+            yield from _iter_failed(out_file)
+
+
+def run_prowler_checkpointed(
+    db: Session,
+    scan_id: int,
+    services: list[str],
+    compliance: str | None = None,
+    timeout: float = 3600,
+    unit_timeout: float = 900,
+    checkpoint_dir: str | Path = "/tmp/prowler-checkpoints",
+    max_age_hours: float = 24,
+    max_attempts: int = 2,
+    lock_timeout: float = 60,
+) -> int:
+    """
+    Run Prowler one service at a time, ingesting each service's findings as soon as it finishes.
+
+    Progress is checkpointed on disk (see ProwlerCheckpoint): after a timeout or a worker
+    restart the next call skips ingested services, ingests already-scanned outputs without
+    re-running Prowler, and continues with the rest. A service that times out
+    max_attempts times is marked failed for the rest of the cycle.
+    If another worker still holds the checkpoint after lock_timeout seconds, the services
+    are scanned in one non-checkpointed run instead.
+    Returns findings ingested; raises PartialRunTimeout when `timeout` runs out first.
+    """
+    deadline = time.monotonic() + timeout
+    key = json.dumps([compliance, sorted(services)])
+    try:
+        with ProwlerCheckpoint(checkpoint_dir, key, max_age_hours, min(lock_timeout, timeout)) as checkpoint:
+            return _run_units(
+                db, scan_id, services, compliance, checkpoint, deadline, timeout, unit_timeout, max_attempts
             )
-        except subprocess.TimeoutExpired:
-            return []
-        except FileNotFoundError:
-            return []
-        except Exception:
-            return []
+    except CheckpointBusy:
+        logger.warning("Prowler checkpoint %s busy; running %s without checkpointing", checkpoint_dir, services)
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise PartialRunTimeout([_prowler_bin(), "aws"], timeout, 0)
+    return ingest_prowler_findings(db, run_prowler(compliance, remaining, services), scan_id)
+
+
+def _run_units(
+    db: Session,
+    scan_id: int,
+    services: list[str],
+    compliance: str | None,
+    checkpoint: ProwlerCheckpoint,
+    deadline: float,
+    timeout: float,
+    unit_timeout: float,
+    max_attempts: int,
+) -> int:
+    """Scan and ingest the services not yet done in checkpoint, in order."""
+    total = 0
+    for service in services:
+        status = checkpoint.status(service)
+        if status in (INGESTED, FAILED):
+            continue
+        if status != SCANNED:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise PartialRunTimeout([_prowler_bin(), "aws"], timeout, total)
+            if checkpoint.attempts(service) >= max_attempts:
+                checkpoint.mark(service, FAILED)
+                continue
+            checkpoint.start_attempt(service)
+            try:
+                out_file = _scan_to_file(
+                    checkpoint.directory, service, compliance, min(unit_timeout, remaining), [service]
+                )
+            except subprocess.TimeoutExpired:
+                if remaining <= unit_timeout:
+                    raise PartialRunTimeout([_prowler_bin(), "aws"], timeout, total)
+                continue  # Unit budget exceeded: retried on the next run
+            if out_file is None:
+                checkpoint.mark(service, FAILED)
+                continue
+            checkpoint.mark(service, SCANNED)
+
+        out_file = checkpoint.output_path(service)
+        total += ingest_prowler_findings(db, _iter_failed(out_file), scan_id)
+        checkpoint.mark(service, INGESTED)
+        out_file.unlink(missing_ok=True)
+    if all(checkpoint.status(service) in (INGESTED, FAILED) for service in services):
+        checkpoint.clear()
+    return total
+
+
+def _scan_to_file(
+    out_dir: Path, stem: str, compliance: str | None, timeout: float, services: list[str] | None
+) -> Path | None:
+    """Run Prowler writing <out_dir>/<stem>.json. None if Prowler is unavailable or produced no output."""
+    out_file = out_dir / f"{stem}.json"
+    out_file.unlink(missing_ok=True)  # Never mistake a partial file from an interrupted run for output
+    cmd = [
+        _prowler_bin(), "aws",
+        "-M", "json",
+        "-F", stem,
+        "-o", str(out_dir),
+        "--quiet",
+    ]
+    if services:
+        cmd.extend(["--services", *services])
+    if compliance:
+        cmd.extend(["--compliance", compliance])
+
+    try:
+        subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            env={**os.environ, "AWS_DEFAULT_REGION": os.environ.get("AWS_REGION", "us-east-1")},
+        )
+    except subprocess.TimeoutExpired:
+        out_file.unlink(missing_ok=True)
+        raise
+    except FileNotFoundError:
+        return None
+    except Exception:
+        return None
 
-        if not out_file.exists():
-            return []
+    return out_file if out_file.exists() else None
 
-        try:
-            data = json.loads(out_file.read_text())
-        except (json.JSONDecodeError, OSError):
-            return []
 
-    if isinstance(data, list):
-        return [r for r in data if r.get("Status") == "FAIL"]
-    elif isinstance(data, dict) and "results" in data:
-        return [r for r in data["results"] if r.get("Status") == "FAIL"]
-    return []
+def _iter_failed(out_file: Path) -> Iterator[dict[str, Any]]:
+    """FAIL findings streamed from a Prowler JSON output file."""
+    try:
+        for r in iter_json_array(out_file):
+            if isinstance(r, dict) and r.get("Status") == "FAIL":
+                yield r
+    except (json.JSONDecodeError, OSError):
+        return
 
 
 def _category_from_service(service: str) -> str:
@@ -100,106 +206,46 @@ def _severity_from_prowler(sev: str) -> str:
     return m.get((sev or "").lower(), "medium")
 
 
-def ingest_prowler_findings(db: Session, findings: list[dict], scan_id: int) -> int:
+def ingest_prowler_findings(db: Session, findings: Iterable[dict], scan_id: int) -> int:
     """
     Ingest Prowler findings into DB. Upserts resources and rules, inserts findings.
-    Returns count of findings ingested.
+    Set-based and committed per batch; returns count of findings ingested.
     """
-    count = 0
-    for f in findings:
-        resource_id_str = f.get("ResourceId") or f.get("ResourceArn") or f.get("ResourceIdExtended") or ""
-        if not resource_id_str:
-            resource_id_str = f"prowler-{f.get('CheckID', 'unknown')}-{f.get('Region', 'global')}"
-
-        region = f.get("Region") or "global"
-        service = f.get("ServiceName", "unknown")
-        resource_type = _resource_type_from_service(service)
-        rule_id = f"prowler_{f.get('CheckID', 'unknown')}"
-        severity = _severity_from_prowler(f.get("Severity"))
-        message = f.get("StatusExtended") or f.get("CheckTitle", "")
-        remediation = f.get("Remediation", {}).get("Recommendation", {}).get("Text", "") or ""
-
-        # Upsert resource
-        db.execute(
-            text("""
-                INSERT INTO resources (resource_id, resource_type, region, raw_metadata, collected_at)
-                VALUES (:rid, :rtype, :region, '{}'::jsonb, NOW())
-                ON CONFLICT (resource_id, resource_type)
-                DO UPDATE SET collected_at = NOW()
-            """),
-            {"rid": resource_id_str[:512], "rtype": resource_type, "region": region},
-        )
-        db.commit()
-        row = db.execute(
-            text("SELECT id FROM resources WHERE resource_id = :rid AND resource_type = :rtype"),
-            {"rid": resource_id_str[:512], "rtype": resource_type},
-        ).fetchone()
-        if not row:
-            continue
-        res_db_id = row[0]
-
-        # Upsert compliance rule
-        compliance = f.get("Compliance", {}) or {}
-        mappings = {}
-        for k, v in compliance.items():
-            if isinstance(v, list):
-                mappings[k.lower()] = v
-            elif isinstance(v, dict) and "Framework" in v:
-                mappings[k.lower()] = [v.get("Framework", v.get("Id", ""))]
-        category = _category_from_service(service)
-
-        db.execute(
-            text("""
-                INSERT INTO compliance_rules (rule_id, description, resource_type, severity, compliance_mappings, remediation_guidance, category)
-                VALUES (:rid, :desc, :rtype, :sev, CAST(:mappings AS jsonb), :remediation, :category)
-                ON CONFLICT (rule_id) DO UPDATE SET
-                    description = EXCLUDED.description,
-                    resource_type = EXCLUDED.resource_type,
-                    severity = EXCLUDED.severity,
-                    compliance_mappings = EXCLUDED.compliance_mappings,
-                    remediation_guidance = EXCLUDED.remediation_guidance,
-                    category = EXCLUDED.category
-            """),
-            {
-                "rid": rule_id,
-                "desc": f.get("CheckTitle", rule_id),
-                "rtype": resource_type,
-                "sev": severity,
-                "mappings": json.dumps(mappings),
+    ingest = ExternalFindingIngest(db, scan_id)
+    try:
+        for f in findings:
+            resource_id_str = f.get("ResourceId") or f.get("ResourceArn") or f.get("ResourceIdExtended") or ""
+            if not resource_id_str:
+                resource_id_str = f"prowler-{f.get('CheckID', 'unknown')}-{f.get('Region', 'global')}"
+
+            region = f.get("Region") or "global"
+            service = f.get("ServiceName", "unknown")
+            resource_type = _resource_type_from_service(service)
+            rule_id = f"prowler_{f.get('CheckID', 'unknown')}"
+            remediation = f.get("Remediation", {}).get("Recommendation", {}).get("Text", "") or ""
+
+            compliance = f.get("Compliance", {}) or {}
+            mappings = {}
+            for k, v in compliance.items():
+                if isinstance(v, list):
+                    mappings[k.lower()] = v
+                elif isinstance(v, dict) and "Framework" in v:
+                    mappings[k.lower()] = [v.get("Framework", v.get("Id", ""))]
+
+            rule = {
+                "rule_id": rule_id,
+                "description": f.get("CheckTitle", rule_id),
+                "resource_type": resource_type,
+                "severity": _severity_from_prowler(f.get("Severity")),
+                "compliance_mappings": mappings,
                 "remediation": remediation,
-                "category": category[:64],
-            },
-        )
+                "category": _category_from_service(service),
+            }
+            message = f.get("StatusExtended") or f.get("CheckTitle", "")
+            ingest.add(resource_id_str, resource_type, region, rule, message)
+        ingest.flush()
         db.commit()
-
-        rule_row = db.execute(text("SELECT id FROM compliance_rules WHERE rule_id = :rid"), {"rid": rule_id}).fetchone()
-        if not rule_row:
-            continue
-        rule_db_id = rule_row[0]
-
-        # Upsert finding
-        try:
-            db.execute(
-                text("""
-                    INSERT INTO findings (resource_id, rule_id, severity, status, message, remediation, scan_id, last_seen_at)
-                    VALUES (:res_id, :rule_id, :sev, 'open', :msg, :remediation, :scan_id, NOW())
-                    ON CONFLICT (resource_id, rule_id) DO UPDATE SET
-                        message = EXCLUDED.message,
-                        remediation = EXCLUDED.remediation,
-                        scan_id = EXCLUDED.scan_id,
-                        last_seen_at = NOW()
-                """),
-                {
-                    "res_id": res_db_id,
-                    "rule_id": rule_db_id,
-                    "sev": severity,
-                    "msg": message[:2000],
-                    "remediation": remediation[:5000],
-                    "scan_id": scan_id,
-                },
-            )
-            count += 1
-        except Exception:
-            pass
-    db.commit()
-    return count
+    except Exception:
+        db.rollback()
+        raise
+    return ingest.written
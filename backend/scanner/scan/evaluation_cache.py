@@ -0,0 +1,88 @@
+"""Per-(resource, rule version) evaluation cache - lets run_scan skip unchanged pairs."""
+from typing import Iterable
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from scanner.db_utils import values_clause
+
+DEFAULT_CHUNK_SIZE = 1000
+
+_EVALUATION_COLUMNS = ("res_id", "rule_id", "version", "hash", "passed")
+
+
+class EvaluationCache:
+    """
+    Outcome of the last evaluation of each (resource, rule) pair, tagged with the
+    rule version and the resource content_hash it was computed from.
+    Entries are loaded per chunk of resources and written back in multi-row upserts.
+    """
+
+    def __init__(self, db: Session, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.db = db
+        self.chunk_size = max(1, chunk_size)
+        self._entries: dict[tuple[int, int], tuple[str, str, bool]] = {}
+        self._buffer: dict[tuple[int, int], dict] = {}
+
+    def load(self, resource_ids: Iterable[int]) -> None:
+        """Replace the in-memory entries with those of the given resources (one round trip)."""
+        self._entries.clear()
+        ids = list(resource_ids)
+        if not ids:
+            return
+        rows = self.db.execute(
+            text("""
+                SELECT resource_id, rule_id, rule_version, content_hash, passed
+                FROM rule_evaluations WHERE resource_id = ANY(:ids)
+            """),
+            {"ids": ids},
+        ).fetchall()
+        self._entries = {(r[0], r[1]): (r[2], r[3], r[4]) for r in rows}
+
+    def lookup(self, resource_id: int, rule_db_id: int, version: str, content_hash: str | None) -> bool | None:
+        """Cached `passed` if the pair was evaluated at this rule version and content, else None."""
+        if content_hash is None:
+            return None
+        entry = self._entries.get((resource_id, rule_db_id))
+        if entry is None or entry[0] != version or entry[1] != content_hash:
+            return None
+        return entry[2]
+
+    def record(self, resource_id: int, rule_db_id: int, version: str, content_hash: str | None, passed: bool) -> None:
+        """Buffer an evaluation outcome; resources without a content_hash are not cached."""
+        if content_hash is None:
+            return
+        self._buffer[(resource_id, rule_db_id)] = {
+            "res_id": resource_id,
+            "rule_id": rule_db_id,
+            "version": version,
+            "hash": content_hash,
+            "passed": passed,
+        }
+        if len(self._buffer) >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write buffered outcomes. Returns number of rows sent."""
+        if not self._buffer:
+            return 0
+        rows = list(self._buffer.values())
+        self._buffer.clear()
+
+        values, params = values_clause(rows, _EVALUATION_COLUMNS)
+
+        self.db.execute(
+            text(f"""
+                INSERT INTO rule_evaluations (resource_id, rule_id, rule_version, content_hash, passed, evaluated_at)
+                SELECT CAST(v.res_id AS integer), CAST(v.rule_id AS integer), v.version, v.hash,
+                       CAST(v.passed AS boolean), NOW()
+                FROM (VALUES {values}) AS v(res_id, rule_id, version, hash, passed)
+                ON CONFLICT (resource_id, rule_id) DO UPDATE SET
+                    rule_version = EXCLUDED.rule_version,
+                    content_hash = EXCLUDED.content_hash,
+                    passed = EXCLUDED.passed,
+                    evaluated_at = NOW()
+            """),
+            params,
+        )
+        return len(rows)
@@ -0,0 +1,144 @@
+"""Bulk ingest for external scanner findings (Prowler, CloudSploit)."""
+import json
+import subprocess
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from scanner.db_utils import values_clause
+from scanner.scan.finding_writer import BulkFindingWriter
+
+DEFAULT_BATCH_SIZE = 1000
+
+_RESOURCE_COLUMNS = ("rid", "rtype", "region")
+_RULE_COLUMNS = ("rid", "descr", "rtype", "sev", "mappings", "remediation", "category")
+
+
+class PartialRunTimeout(subprocess.TimeoutExpired):
+    """Deadline reached after some units were ingested and committed; `findings` counts them."""
+
+    def __init__(self, cmd: list[str], timeout: float, findings: int):
+        super().__init__(cmd, timeout)
+        self.findings = findings
+
+
+class ExternalFindingIngest:
+    """
+    Buffers external findings and writes them set-based, per batch:
+    one multi-row resource upsert and one multi-row rule upsert (both RETURNING id)
+    for keys not seen earlier in the run, then the findings via BulkFindingWriter.
+    Each flushed batch is committed, and upsert rows are sorted by their conflict
+    key, so concurrent ingests (Prowler and CloudSploit phases) lock shared
+    resource/rule rows in the same order and only briefly, instead of deadlocking.
+    """
+
+    def __init__(self, db: Session, scan_id: int, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.db = db
+        self.batch_size = max(1, batch_size)
+        self._findings = BulkFindingWriter(db, scan_id, chunk_size=batch_size)
+        self._resource_ids: dict[tuple[str, str], int] = {}
+        self._rule_seen: set[str] = set()
+        # Pending entries for the next flush; rules deduped in memory (last definition wins).
+        self._resources: dict[tuple[str, str], str] = {}
+        self._rules: dict[str, dict[str, Any]] = {}
+        self._pending: list[tuple[tuple[str, str], str, str, str, str]] = []
+
+    @property
+    def written(self) -> int:
+        return self._findings.written
+
+    def add(
+        self,
+        resource_id: str,
+        resource_type: str,
+        region: str,
+        rule: dict[str, Any],
+        message: str,
+    ) -> None:
+        """
+        Buffer one finding. rule: {rule_id, description, resource_type, severity,
+        compliance_mappings, remediation, category}.
+        """
+        key = (resource_id[:512], resource_type)
+        if key not in self._resource_ids:
+            self._resources[key] = region
+        if rule["rule_id"] not in self._rule_seen:
+            self._rules[rule["rule_id"]] = rule
+        self._pending.append((key, rule["rule_id"], rule["severity"], message[:2000], rule["remediation"][:5000]))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> int:
+        """Upsert new resources and rules, write buffered findings and commit. Returns findings sent."""
+        if not self._pending:
+            return 0
+        self._upsert_resources()
+        self._upsert_rules()
+        for key, rule_id, severity, message, remediation in self._pending:
+            res_db_id = self._resource_ids.get(key)
+            if res_db_id is not None:
+                self._findings.add(res_db_id, {"rule_id": rule_id, "severity": severity, "remediation": remediation}, message)
+        sent = len(self._pending)
+        self._pending.clear()
+        self._findings.flush()
+        self.db.commit()
+        return sent
+
+    def _upsert_resources(self) -> None:
+        if not self._resources:
+            return
+        rows = [
+            {"rid": rid, "rtype": rtype, "region": region}
+            for (rid, rtype), region in sorted(self._resources.items())
+        ]
+        self._resources.clear()
+        values, params = values_clause(rows, _RESOURCE_COLUMNS)
+        returned = self.db.execute(
+            text(f"""
+                INSERT INTO resources (resource_id, resource_type, region, raw_metadata, collected_at)
+                SELECT v.rid, v.rtype, v.region, '{{}}'::jsonb, NOW()
+                FROM (VALUES {values}) AS v(rid, rtype, region)
+                ON CONFLICT (resource_id, resource_type)
+                DO UPDATE SET collected_at = NOW()
+                RETURNING id, resource_id, resource_type
+            """),
+            params,
+        ).fetchall()
+        self._resource_ids.update({(r[1], r[2]): r[0] for r in returned})
+
+    def _upsert_rules(self) -> None:
+        if not self._rules:
+            return
+        rows = [
+            {
+                "rid": rule_id,
+                "descr": rule["description"],
+                "rtype": rule["resource_type"],
+                "sev": rule["severity"],
+                "mappings": json.dumps(rule.get("compliance_mappings") or {}),
+                "remediation": rule["remediation"],
+                "category": rule["category"][:64],
+            }
+            for rule_id, rule in sorted(self._rules.items())
+        ]
+        self._rule_seen.update(self._rules)
+        self._rules.clear()
+        values, params = values_clause(rows, _RULE_COLUMNS)
+        returned = self.db.execute(
+            text(f"""
+                INSERT INTO compliance_rules (rule_id, description, resource_type, severity, compliance_mappings, remediation_guidance, category)
+                SELECT v.rid, v.descr, v.rtype, v.sev, CAST(v.mappings AS jsonb), v.remediation, v.category
+                FROM (VALUES {values}) AS v(rid, descr, rtype, sev, mappings, remediation, category)
+                ON CONFLICT (rule_id) DO UPDATE SET
+                    description = EXCLUDED.description,
+                    resource_type = EXCLUDED.resource_type,
+                    severity = EXCLUDED.severity,
+                    compliance_mappings = EXCLUDED.compliance_mappings,
+                    remediation_guidance = EXCLUDED.remediation_guidance,
+                    category = EXCLUDED.category
+                RETURNING rule_id, id
+            """),
+            params,
+        ).fetchall()
+        self._findings.register_rule_ids({r[0]: r[1] for r in returned})
@@ -0,0 +1,115 @@
+"""Bulk finding writer - buffers failing (resource, rule) pairs and upserts them in chunks."""
+from typing import Iterable
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from scanner.db_utils import values_clause
+
+DEFAULT_CHUNK_SIZE = 1000
+
+_FINDING_COLUMNS = ("res_id", "rule_id", "sev", "msg", "remediation")
+
+
+class BulkFindingWriter:
+    """
+    Set-based finding writer.
+    Rule IDs are resolved once into an in-memory map, findings are buffered and
+    written as one multi-row INSERT ... SELECT ... ON CONFLICT per chunk.
+    """
+
+    def __init__(self, db: Session, scan_id: int, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.db = db
+        self.scan_id = scan_id
+        self.chunk_size = max(1, chunk_size)
+        self.written = 0
+        self._rule_ids: dict[str, int] = {}
+        # Keyed by (resource_id, rule_db_id): Postgres rejects an upsert that
+        # touches the same conflict target twice in one statement.
+        self._buffer: dict[tuple[int, int], dict] = {}
+
+    def load_rule_ids(self, rule_ids: Iterable[str]) -> None:
+        """Resolve compliance_rules.id for the given rule_ids in one round trip."""
+        wanted = [rid for rid in set(rule_ids) if rid not in self._rule_ids]
+        if not wanted:
+            return
+        rows = self.db.execute(
+            text("SELECT rule_id, id FROM compliance_rules WHERE rule_id = ANY(:rids)"),
+            {"rids": wanted},
+        ).fetchall()
+        self._rule_ids.update({r[0]: r[1] for r in rows})
+
+    def register_rule_ids(self, rule_ids: dict[str, int]) -> None:
+        """Add already-resolved rule_id -> compliance_rules.id entries (e.g. from RETURNING)."""
+        self._rule_ids.update(rule_ids)
+
+    def rule_db_id(self, rule_id: str) -> int | None:
+        """compliance_rules.id for a loaded rule_id (None if unknown)."""
+        return self._rule_ids.get(rule_id)
+
+    def add(self, resource_id: int, rule: dict, message: str) -> bool:
+        """Buffer a finding. Returns False if the rule is not known to the DB."""
+        rule_db_id = self._rule_ids.get(rule["rule_id"])
+        if rule_db_id is None:
+            return False
+        remediation = rule.get("remediation") or rule.get("remediation_guidance") or ""
+        self._buffer[(resource_id, rule_db_id)] = {
+            "res_id": resource_id,
+            "rule_id": rule_db_id,
+            "sev": rule["severity"],
+            "msg": message,
+            "remediation": remediation,
+        }
+        if len(self._buffer) >= self.chunk_size:
+            self.flush()
+        return True
+
+    def mark_seen(self, pairs: Iterable[tuple[int, int]]) -> int:
+        """
+        Stamp existing findings for (resource_id, rule_db_id) pairs with this scan,
+        without rewriting them: one UPDATE for pairs whose cached outcome is a failure.
+        """
+        pairs = list(pairs)
+        if not pairs:
+            return 0
+        self.db.execute(
+            text("""
+                UPDATE findings SET scan_id = :scan_id, last_seen_at = NOW()
+                WHERE (resource_id, rule_id) IN (
+                    SELECT * FROM unnest(CAST(:res_ids AS integer[]), CAST(:rule_ids AS integer[]))
+                )
+            """),
+            {
+                "scan_id": self.scan_id,
+                "res_ids": [p[0] for p in pairs],
+                "rule_ids": [p[1] for p in pairs],
+            },
+        )
+        return len(pairs)
+
+    def flush(self) -> int:
+        """Write buffered findings. Returns number of rows sent."""
+        if not self._buffer:
+            return 0
+        rows = list(self._buffer.values())
+        self._buffer.clear()
+
+        values, params = values_clause(rows, _FINDING_COLUMNS)
+        params["scan_id"] = self.scan_id
+
+        self.db.execute(
+            text(f"""
+                INSERT INTO findings (resource_id, rule_id, severity, status, message, remediation, scan_id, last_seen_at)
+                SELECT CAST(v.res_id AS integer), CAST(v.rule_id AS integer), v.sev, 'open', v.msg, v.remediation,
+                       :scan_id, NOW()
+                FROM (VALUES {values}) AS v(res_id, rule_id, sev, msg, remediation)
+                ON CONFLICT (resource_id, rule_id) DO UPDATE SET
+                    message = EXCLUDED.message,
+                    remediation = EXCLUDED.remediation,
+                    scan_id = EXCLUDED.scan_id,
+                    last_seen_at = NOW()
+            """),
+            params,
+        )
+        self.written += len(rows)
+        return len(rows)
@@ -0,0 +1,337 @@
+"""Safe expression language for declarative YAML rules.
+
+Expressions use Python-like syntax but are only parsed (ast), never compiled
+to bytecode or executed: each node becomes a closure once, at rule load time.
+
+    not PublicAccessBlock.PublicAccessBlockConfiguration.BlockPublicAcls
+    any(is_public_cidr(r.CidrIp) for r in IpRanges)
+    first(port for p in IpPermissions for port in [22, 3389] if port_in_range(port, p.FromPort, p.ToPort))
+
+Bare names resolve to comprehension variables, then to raw_metadata keys.
+.field / [key] / [index] lookups return None on missing data instead of raising.
+"""
+import ast
+import ipaddress
+import operator
+from functools import lru_cache
+from typing import Any, Callable
+
+Scope = dict[str, Any]
+Node = Callable[[Scope], Any]
+
+_ROOT = "__root__"
+
+
+class RuleSyntaxError(ValueError):
+    """Expression uses syntax or names outside the rule language."""
+
+
+def compile_expression(source: str) -> Callable[[dict], Any]:
+    """Compile an expression into a callable: raw_metadata -> value."""
+    try:
+        tree = ast.parse(str(source).strip(), mode="eval")
+    except SyntaxError as e:
+        raise RuleSyntaxError(f"invalid expression {source!r}: {e.msg}") from e
+    node = _compile(tree.body)
+
+    def evaluate(metadata: dict) -> Any:
+        return node({_ROOT: metadata})
+
+    return evaluate
+
+
+# ---- Runtime helpers (tolerant of missing / mistyped metadata) ----
+
+def _get(obj: Any, key: Any) -> Any:
+    if isinstance(obj, dict):
+        return obj.get(key)
+    if isinstance(obj, (list, tuple)) and isinstance(key, int) and -len(obj) <= key < len(obj):
+        return obj[key]
+    return None
+
+
+def _iterable(obj: Any):
+    if hasattr(obj, "__next__"):  # generator from a comprehension
+        return obj
+    if isinstance(obj, (list, tuple)):
+        return obj
+    if isinstance(obj, dict):
+        return obj.values()
+    return ()
+
+
+def _first(items: Any) -> Any:
+    for item in _iterable(items):
+        if item is not None and item is not False:
+            return item
+    return None
+
+
+def _any(items: Any) -> bool:
+    return any(_iterable(items))
+
+
+def _all(items: Any) -> bool:
+    return all(_iterable(items))
+
+
+def _len(obj: Any) -> int:
+    return len(obj) if isinstance(obj, (list, tuple, dict, str)) else 0
+
+
+@lru_cache(maxsize=4096)
+def _network(cidr: str) -> ipaddress.IPv4Network | ipaddress.IPv6Network | None:
+    # Accounts reuse a handful of CIDRs across thousands of rules: parse each once.
+    try:
+        return ipaddress.ip_network(cidr, strict=False)
+    except ValueError:
+        return None
+
+
+def _is_public_cidr(cidr: Any) -> bool:
+    """True for 0.0.0.0/0 and ::/0 (any prefix-length-zero network)."""
+    if not isinstance(cidr, str):
+        return False
+    network = _network(cidr)
+    return network is not None and network.prefixlen == 0
+
+
+def _cidr_contains(cidr: Any, address: Any) -> bool:
+    network = _network(cidr) if isinstance(cidr, str) else None
+    if network is None:
+        return False
+    try:
+        return ipaddress.ip_address(str(address)) in network
+    except ValueError:
+        return False
+
+
+def _port_in_range(port: Any, from_port: Any, to_port: Any) -> bool:
+    """Inclusive range check; a missing bound means unbounded (0 / 65535)."""
+    lo = 0 if from_port is None else from_port
+    hi = 65535 if to_port is None else to_port
+    try:
+        return lo <= port <= hi
+    except TypeError:
+        return False
+
+
+FUNCTIONS: dict[str, Callable[..., Any]] = {
+    "any": _any,
+    "all": _all,
+    "first": _first,
+    "len": _len,
+    "exists": lambda obj: obj is not None,
+    "is_public_cidr": _is_public_cidr,
+    "cidr_contains": _cidr_contains,
+    "port_in_range": _port_in_range,
+}
+
+
+def _contains(container: Any, item: Any) -> bool:
+    if isinstance(container, (list, tuple, dict, str)):
+        try:
+            return item in container
+        except TypeError:
+            return False
+    return False
+
+
+_COMPARE_OPS: dict[type, Callable[[Any, Any], bool]] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.In: lambda a, b: _contains(b, a),
+    ast.NotIn: lambda a, b: not _contains(b, a),
+    ast.Is: operator.is_,
+    ast.IsNot: operator.is_not,
+}
+
+
+# ---- AST -> closure compiler ----
+
+def _compile(node: ast.AST) -> Node:
+    compiler = _COMPILERS.get(type(node))
+    if compiler is None:
+        raise RuleSyntaxError(f"unsupported syntax: {type(node).__name__}")
+    return compiler(node)
+
+
+def _compile_constant(node: ast.Constant) -> Node:
+    value = node.value
+    if not isinstance(value, (str, int, float, bool, type(None))):
+        raise RuleSyntaxError(f"unsupported constant: {value!r}")
+    return lambda scope: value
+
+
+def _compile_name(node: ast.Name) -> Node:
+    name = node.id
+    if name.startswith("__"):
+        raise RuleSyntaxError(f"name not allowed: {name}")
+
+    def load(scope: Scope) -> Any:
+        if name in scope:
+            return scope[name]
+        return _get(scope[_ROOT], name)
+
+    return load
+
+
+def _compile_attribute(node: ast.Attribute) -> Node:
+    value, attr = _compile(node.value), node.attr
+    if attr.startswith("__"):
+        raise RuleSyntaxError(f"name not allowed: {attr}")
+    return lambda scope: _get(value(scope), attr)
+
+
+def _compile_subscript(node: ast.Subscript) -> Node:
+    value, key = _compile(node.value), _compile(node.slice)
+    return lambda scope: _get(value(scope), key(scope))
+
+
+def _compile_sequence(node: ast.List | ast.Tuple) -> Node:
+    items = [_compile(e) for e in node.elts]
+    if all(isinstance(e, ast.Constant) for e in node.elts):
+        constant = [e.value for e in node.elts]
+        return lambda scope: constant
+    return lambda scope: [item(scope) for item in items]
+
+
+def _compile_boolop(node: ast.BoolOp) -> Node:
+    values = [_compile(v) for v in node.values]
+    if isinstance(node.op, ast.And):
+        def run_and(scope: Scope) -> Any:
+            result = True
+            for value in values:
+                result = value(scope)
+                if not result:
+                    return result
+            return result
+        return run_and
+
+    def run_or(scope: Scope) -> Any:
+        result = False
+        for value in values:
+            result = value(scope)
+            if result:
+                return result
+        return result
+    return run_or
+
+
+def _compile_unaryop(node: ast.UnaryOp) -> Node:
+    operand = _compile(node.operand)
+    if isinstance(node.op, ast.Not):
+        return lambda scope: not operand(scope)
+    if isinstance(node.op, ast.USub):
+        def negate(scope: Scope) -> Any:
+            value = operand(scope)
+            return -value if isinstance(value, (int, float)) else None
+        return negate
+    raise RuleSyntaxError(f"unsupported operator: {type(node.op).__name__}")
+
+
+def _compile_binop(node: ast.BinOp) -> Node:
+    if not isinstance(node.op, ast.Add):
+        raise RuleSyntaxError(f"unsupported operator: {type(node.op).__name__}")
+    left, right = _compile(node.left), _compile(node.right)
+
+    def add(scope: Scope) -> Any:
+        a, b = left(scope), right(scope)
+        if a is None:
+            return b
+        if b is None:
+            return a
+        try:
+            return a + b
+        except TypeError:
+            return None
+
+    return add
+
+
+def _compile_compare(node: ast.Compare) -> Node:
+    left = _compile(node.left)
+    pairs = []
+    for op, comparator in zip(node.ops, node.comparators):
+        fn = _COMPARE_OPS.get(type(op))
+        if fn is None:
+            raise RuleSyntaxError(f"unsupported comparison: {type(op).__name__}")
+        pairs.append((fn, _compile(comparator)))
+
+    def compare(scope: Scope) -> bool:
+        a = left(scope)
+        for fn, right in pairs:
+            b = right(scope)
+            try:
+                if not fn(a, b):
+                    return False
+            except TypeError:
+                return False
+            a = b
+        return True
+
+    return compare
+
+
+def _compile_ifexp(node: ast.IfExp) -> Node:
+    test, body, orelse = _compile(node.test), _compile(node.body), _compile(node.orelse)
+    return lambda scope: body(scope) if test(scope) else orelse(scope)
+
+
+def _compile_call(node: ast.Call) -> Node:
+    if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS:
+        raise RuleSyntaxError(f"unknown function: {ast.unparse(node.func)}")
+    if node.keywords:
+        raise RuleSyntaxError(f"keyword arguments not supported: {node.func.id}")
+    fn = FUNCTIONS[node.func.id]
+    args = [_compile(a) for a in node.args]
+    return lambda scope: fn(*(a(scope) for a in args))
+
+
+def _compile_comprehension(node: ast.GeneratorExp | ast.ListComp) -> Node:
+    loops = []
+    for gen in node.generators:
+        if not isinstance(gen.target, ast.Name) or gen.is_async:
+            raise RuleSyntaxError("comprehension target must be a single name")
+        if gen.target.id.startswith("__"):
+            raise RuleSyntaxError(f"name not allowed: {gen.target.id}")
+        loops.append((gen.target.id, _compile(gen.iter), [_compile(c) for c in gen.ifs]))
+    element = _compile(node.elt)
+    depth = len(loops)
+
+    def walk(level: int, scope: Scope):
+        if level == depth:
+            yield element(scope)
+            return
+        name, source, conditions = loops[level]
+        for item in _iterable(source(scope)):
+            inner = {**scope, name: item}
+            if all(cond(inner) for cond in conditions):
+                yield from walk(level + 1, inner)
+
+    if isinstance(node, ast.ListComp):
+        return lambda scope: list(walk(0, scope))
+    # Lazy so any()/all()/first() can short-circuit.
+    return lambda scope: walk(0, scope)
+
+
+_COMPILERS: dict[type, Callable[[Any], Node]] = {
+    ast.Constant: _compile_constant,
+    ast.Name: _compile_name,
+    ast.Attribute: _compile_attribute,
+    ast.Subscript: _compile_subscript,
+    ast.List: _compile_sequence,
+    ast.Tuple: _compile_sequence,
+    ast.BoolOp: _compile_boolop,
+    ast.UnaryOp: _compile_unaryop,
+    ast.BinOp: _compile_binop,
+    ast.Compare: _compile_compare,
+    ast.IfExp: _compile_ifexp,
+    ast.Call: _compile_call,
+    ast.GeneratorExp: _compile_comprehension,
+    ast.ListComp: _compile_comprehension,
+}
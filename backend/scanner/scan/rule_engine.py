@@ -1,10 +1,24 @@
 """YAML-based compliance rule engine. Evaluates collected resources against rules."""
-import re
+import hashlib
+import json
+import logging
 from pathlib import Path
-from typing import Any
+from typing import Callable
 
 import yaml
 
+from scanner.scan.rule_dsl import RuleSyntaxError, compile_expression
+
+logger = logging.getLogger(__name__)
+
+Evaluator = Callable[[dict], tuple[bool, str]]
+
+# Bump when rule_dsl semantics change so cached evaluations are invalidated.
+ENGINE_VERSION = "1"
+
+# Rule fields that affect an evaluation outcome or the finding it produces.
+_VERSIONED_FIELDS = ("resource_type", "severity", "description", "evaluation", "remediation", "remediation_guidance")
+
 
 def load_rules(rules_dir: str | Path | None = None) -> list[dict]:
     """Load all YAML rules from directory."""
@@ -15,70 +29,76 @@ def load_rules(rules_dir: str | Path | None = None) -> list[dict]:
             data = yaml.safe_load(path.read_text())
             if data and data.get("rule_id"):
                 rules.append(data)
-        except Exception:
-            continue
+        except Exception as exc:
+            logger.error("rule file %s not loaded: %s", path.name, exc)
     return rules
 
 
-def evaluate_rule(rule: dict, resource: dict) -> tuple[bool, str]:
+class RuleRegistry:
+    """Rules compiled once and indexed by resource_type -> [(rule, evaluator)]."""
+
+    def __init__(self, rules: list[dict]):
+        self.rules: list[dict] = []
+        self.versions: dict[str, str] = {}
+        self._by_type: dict[str, list[tuple[dict, Evaluator]]] = {}
+        for rule in rules:
+            try:
+                evaluator = compile_rule(rule)
+            except RuleSyntaxError as exc:
+                logger.error("rule %s not loaded: %s", rule.get("rule_id"), exc)
+                continue
+            self.rules.append(rule)
+            self.versions[rule["rule_id"]] = rule_version(rule)
+            self._by_type.setdefault(rule.get("resource_type", ""), []).append((rule, evaluator))
+
+    def for_type(self, resource_type: str) -> list[tuple[dict, Evaluator]]:
+        """Compiled rules that apply to resource_type (empty if none)."""
+        return self._by_type.get(resource_type, [])
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+
+def load_registry(rules_dir: str | Path | None = None) -> RuleRegistry:
+    """Load YAML rules and build the resource_type dispatch table."""
+    return RuleRegistry(load_rules(rules_dir))
+
+
+def rule_version(rule: dict) -> str:
+    """Stable hash of a rule's definition; changes whenever its results could change."""
+    spec = {field: rule.get(field) for field in _VERSIONED_FIELDS}
+    payload = json.dumps([ENGINE_VERSION, spec], sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=8).hexdigest()
+
+
+def compile_rule(rule: dict) -> Evaluator:
     """
-    Evaluate a rule against a resource.
-    Returns (passed, message).
+    Compile a rule's declarative `evaluation` block into resource -> (passed, message).
+
+        evaluation:
+          fail_when: <expression over raw_metadata, see rule_dsl>
+          message: "Text shown on failure; {value} is the fail_when result"
+
+    Raises RuleSyntaxError for malformed blocks or expressions.
     """
-    rtype = rule.get("resource_type", "")
-    if resource.get("resource_type") != rtype:
-        return True, "N/A"  # Rule doesn't apply
-
-    eval_str = rule.get("evaluation", "")
-    if not eval_str:
-        return True, "OK"
-
-    # Simple eval - extract the evaluate function logic
-    # We use a safe subset: check metadata fields directly
-    return _evaluate_inline(rule, resource)
-
-
-def _evaluate_inline(rule: dict, resource: dict) -> tuple[bool, str]:
-    """Evaluate using inline logic - no exec for safety."""
-    rule_id = rule.get("rule_id", "")
-    meta = resource.get("raw_metadata", {})
-
-    if rule_id == "s3_public_access":
-        pab = meta.get("PublicAccessBlock", {})
-        config = pab.get("PublicAccessBlockConfiguration", {})
-        if not config.get("BlockPublicAcls") or not config.get("BlockPublicPolicy"):
-            return False, "Public access block not fully configured"
-        return True, "OK"
-
-    if rule_id == "s3_encryption":
-        if "ServerSideEncryptionConfiguration" not in meta.get("Encryption", {}):
-            return False, "Server-side encryption not configured"
-        return True, "OK"
-
-    if rule_id == "sg_public_ingress":
-        perms = meta.get("IpPermissions", [])
-        bad_ports = [22, 3389, 5432, 3306, 1433]
-        for p in perms:
-            from_port = p.get("FromPort") or 0
-            to_port = p.get("ToPort") or 65535
-            for rng in p.get("IpRanges", []) + p.get("Ipv6Ranges", []):
-                cidr = rng.get("CidrIp") or rng.get("CidrIpv6", "")
-                if "0.0.0.0/0" in cidr or "::/0" in cidr:
-                    for port in bad_ports:
-                        if from_port <= port <= to_port:
-                            return False, f"Public access on port {port}"
-        return True, "OK"
-
-    if rule_id == "rds_encryption":
-        if not meta.get("StorageEncrypted"):
-            return False, "RDS storage encryption not enabled"
-        return True, "OK"
-
-    if rule_id == "vpc_flow_logs":
-        logs = meta.get("FlowLogs", [])
-        active = [l for l in logs if l.get("FlowLogStatus") == "ACTIVE"]
-        if not active:
-            return False, "VPC flow logs not enabled"
-        return True, "OK"
+    spec = rule.get("evaluation")
+    if not spec:
+        return _ok
+    if not isinstance(spec, dict) or not spec.get("fail_when"):
+        raise RuleSyntaxError(f"{rule.get('rule_id')}: evaluation must define fail_when")
+
+    fail_when = compile_expression(spec["fail_when"])
+    message = str(spec.get("message") or rule.get("description") or "Check failed")
+    templated = "{value}" in message
+
+    def evaluate(resource: dict) -> tuple[bool, str]:
+        value = fail_when(resource.get("raw_metadata") or {})
+        if not value:
+            return True, "OK"
+        return False, message.replace("{value}", str(value)) if templated else message
+
+    return evaluate
+
 
+def _ok(resource: dict) -> tuple[bool, str]:
     return True, "OK"
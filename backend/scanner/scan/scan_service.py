@@ -1,18 +1,31 @@
 """Run compliance scan on collected resources.
 Native YAML rules + Prowler (572+ checks) + CloudSploit (600+ plugins)."""
 import json
+import logging
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
+from resource import RUSAGE_SELF, getrusage
+from typing import Callable
 
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from config import settings
-from scanner.scan.rule_engine import load_rules, evaluate_rule
+from db.database import SessionLocal
+from scanner.scan.evaluation_cache import EvaluationCache
+from scanner.scan.finding_writer import BulkFindingWriter
+from scanner.scan.rule_engine import RuleRegistry, load_registry
+
+logger = logging.getLogger(__name__)
 
 
 def run_scan(db: Session) -> dict:
     """Run scanning phase. Plugin-based compliance rule engine."""
     started = datetime.utcnow()
+    _reset_peak_rss()
     scan_row = db.execute(
         text("""
             INSERT INTO scan_history (scan_type, phase, status, started_at)
@@ -24,16 +37,210 @@ def run_scan(db: Session) -> dict:
     scan_id = scan_row[0]
     db.commit()
 
-    rules = load_rules()
-    _ensure_rules_in_db(db, rules)
-    resources = db.execute(
-        text("SELECT id, resource_id, resource_type, region, raw_metadata FROM resources")
-    ).fetchall()
+    registry = load_registry()
+    _ensure_rules_in_db(db, registry.rules)
+
+    writer = BulkFindingWriter(db, scan_id, chunk_size=settings.finding_batch_size)
+    writer.load_rule_ids(r["rule_id"] for r in registry.rules)
+    cache = EvaluationCache(db, chunk_size=settings.finding_batch_size)
+    stats = {"evaluated": 0, "skipped": 0}
+    timings: dict[str, dict] = {}
+
+    # Phases 2/3 (Prowler, CloudSploit) run in worker threads with their own
+    # sessions while native rules evaluate here: wall time is max(), not sum().
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="scan-phase") as pool:
+        external = {name: pool.submit(phase, scan_id) for name, phase in _external_phases().items()}
+
+        # Phase 1: native YAML rules.
+        # Named server-side cursor over the light columns; raw_metadata is fetched per
+        # chunk only for resources that still have a stale (resource, rule) pair.
+        # The cursor lives until commit, so findings are flushed but not committed in the loop.
+        start = time.perf_counter()
+        result = db.execute(
+            text("SELECT id, resource_id, resource_type, region, content_hash FROM resources"),
+            execution_options={"yield_per": settings.scan_stream_chunk_size},
+        )
+        finding_count = 0
+        for chunk in result.partitions():
+            finding_count += _scan_chunk(db, chunk, registry, writer, cache, stats)
+        result.close()
+        writer.flush()
+        cache.flush()
+        db.commit()
+        timings["native"] = _phase_timing("completed", start, finding_count)
+
+        for name, future in external.items():
+            timings[name] = future.result()
+            finding_count += timings[name]["findings"]
+
+    peak_rss_kb = _peak_rss_kb()
+    db.execute(
+        text("""
+            UPDATE scan_history
+            SET status = 'completed', finding_count = :cnt, completed_at = :completed,
+                peak_rss_kb = :rss, evaluated_count = :evaluated, skipped_count = :skipped,
+                phase_timings = CAST(:timings AS jsonb)
+            WHERE id = :scan_id
+        """),
+        {
+            "cnt": finding_count,
+            "completed": datetime.utcnow(),
+            "rss": peak_rss_kb,
+            "evaluated": stats["evaluated"],
+            "skipped": stats["skipped"],
+            "timings": json.dumps(timings),
+            "scan_id": scan_id,
+        },
+    )
+    db.commit()
+
+    return {
+        "scan_id": scan_id,
+        "finding_count": finding_count,
+        "peak_rss_kb": peak_rss_kb,
+        "evaluated_count": stats["evaluated"],
+        "skipped_count": stats["skipped"],
+        "phase_timings": timings,
+    }
+
+
+def _external_phases() -> dict[str, Callable[[int], dict]]:
+    """Enabled subprocess-based scan phases, by name."""
+    phases = {}
+    if settings.enable_prowler:
+        phases["prowler"] = _run_prowler_phase
+    if settings.enable_cloudsploit:
+        phases["cloudsploit"] = _run_cloudsploit_phase
+    return phases
+
+
+def _run_prowler_phase(scan_id: int) -> dict:
+    """Phase 2: Prowler (572+ AWS checks, 41 frameworks)."""
+    from scanner.prowler_runner import run_prowler, run_prowler_checkpointed, ingest_prowler_findings
+
+    if settings.prowler_services:
+        # One resumable Prowler run per service, ingested as each finishes.
+        return _run_external_phase(
+            "prowler",
+            lambda db: run_prowler_checkpointed(
+                db,
+                scan_id,
+                settings.prowler_services,
+                compliance=settings.prowler_compliance,
+                timeout=settings.prowler_timeout_seconds,
+                unit_timeout=settings.prowler_unit_timeout_seconds,
+                checkpoint_dir=settings.prowler_checkpoint_dir,
+                max_age_hours=settings.prowler_checkpoint_max_age_hours,
+                max_attempts=settings.prowler_unit_max_attempts,
+                lock_timeout=settings.prowler_checkpoint_lock_timeout_seconds,
+            )
+        )
+    return _run_external_phase(
+        "prowler",
+        lambda db: ingest_prowler_findings(
+            db,
+            run_prowler(compliance=settings.prowler_compliance, timeout=settings.prowler_timeout_seconds),
+            scan_id,
+        )
+    )
+
+
+def _run_cloudsploit_phase(scan_id: int) -> dict:
+    """Phase 3: CloudSploit (600+ AWS plugins)."""
+    from scanner.cloudsploit_runner import run_cloudsploit, run_cloudsploit_parallel, ingest_cloudsploit_findings
+
+    if settings.cloudsploit_plugins:
+        # One CloudSploit process per plugin, cloudsploit_max_parallel at a time.
+        return _run_external_phase(
+            "cloudsploit",
+            lambda db: run_cloudsploit_parallel(
+                db,
+                scan_id,
+                settings.cloudsploit_plugins,
+                timeout=settings.cloudsploit_timeout_seconds,
+                max_parallel=settings.cloudsploit_max_parallel,
+            )
+        )
+    return _run_external_phase(
+        "cloudsploit",
+        lambda db: ingest_cloudsploit_findings(
+            db,
+            run_cloudsploit(timeout=settings.cloudsploit_timeout_seconds),
+            scan_id,
+        )
+    )
+
+
+def _run_external_phase(name: str, ingest: Callable[[Session], int]) -> dict:
+    """Run one external phase on its own Session (Sessions are not thread-safe)."""
+    start = time.perf_counter()
+    db = SessionLocal()
+    try:
+        return _phase_timing("completed", start, ingest(db))
+    except subprocess.TimeoutExpired as e:
+        # Checkpointed runs report what was ingested before the deadline.
+        return _phase_timing("timeout", start, getattr(e, "findings", 0))
+    except Exception:
+        logger.exception("external phase %s failed", name)
+        return _phase_timing("failed", start, 0)
+    finally:
+        db.close()
+
+
+def _phase_timing(status: str, start: float, findings: int) -> dict:
+    return {"status": status, "seconds": round(time.perf_counter() - start, 2), "findings": findings}
+
+
+def _scan_chunk(
+    db: Session,
+    rows: list,
+    registry: RuleRegistry,
+    writer: BulkFindingWriter,
+    cache: EvaluationCache,
+    stats: dict[str, int],
+) -> int:
+    """
+    Evaluate native rules for one cursor chunk of (id, resource_id, resource_type, region, content_hash).
+    Pairs already evaluated at the current rule version and content_hash are skipped;
+    cached failures still count towards the returned finding count, and their
+    findings are stamped with this scan so they do not look stale.
+    """
+    rows = [r for r in rows if registry.for_type(r[2]) and "-error" not in str(r[1])]
+    if not rows:
+        return 0
+    cache.load(r[0] for r in rows)
 
     finding_count = 0
-    for row in resources:
-        res_id, rid, rtype, region, raw = row
-        if "-error" in str(rid) or "_error" in str(raw or {}):
+    stale: dict[int, list[tuple]] = {}
+    cached_failures: list[tuple[int, int]] = []
+    for res_id, _rid, rtype, _region, content_hash in rows:
+        for rule, evaluate in registry.for_type(rtype):
+            rule_db_id = writer.rule_db_id(rule["rule_id"])
+            if rule_db_id is None:
+                continue
+            version = registry.versions[rule["rule_id"]]
+            cached = cache.lookup(res_id, rule_db_id, version, content_hash)
+            if cached is None:
+                stale.setdefault(res_id, []).append((rule, evaluate, rule_db_id, version))
+                continue
+            stats["skipped"] += 1
+            if not cached:
+                cached_failures.append((res_id, rule_db_id))
+                finding_count += 1
+    writer.mark_seen(cached_failures)
+    if not stale:
+        return finding_count
+
+    raw_by_id = dict(
+        db.execute(
+            text("SELECT id, raw_metadata FROM resources WHERE id = ANY(:ids)"),
+            {"ids": list(stale)},
+        ).fetchall()
+    )
+    for res_id, rid, rtype, region, content_hash in rows:
+        pairs = stale.get(res_id)
+        raw = raw_by_id.get(res_id)
+        if not pairs or "_error" in str(raw or {}):
             continue
         resource = {
             "id": res_id,
@@ -42,43 +249,32 @@ def run_scan(db: Session) -> dict:
             "region": region,
             "raw_metadata": raw or {},
         }
-        for rule in rules:
-            if rule.get("resource_type") != rtype:
-                continue
-            passed, message = evaluate_rule(rule, resource)
-            if not passed:
-                _upsert_finding(db, res_id, rule, message, scan_id)
+        for rule, evaluate, rule_db_id, version in pairs:
+            passed, message = evaluate(resource)
+            stats["evaluated"] += 1
+            cache.record(res_id, rule_db_id, version, content_hash, passed)
+            if not passed and writer.add(res_id, rule, message):
                 finding_count += 1
+    return finding_count
 
-    # Phase 2: Prowler (572+ AWS checks, 41 frameworks)
-    if getattr(settings, "enable_prowler", True):
-        try:
-            from scanner.prowler_runner import run_prowler, ingest_prowler_findings
-            prowler_findings = run_prowler(compliance=settings.prowler_compliance)
-            finding_count += ingest_prowler_findings(db, prowler_findings, scan_id)
-        except Exception:
-            pass
-
-    # Phase 3: CloudSploit (600+ AWS plugins)
-    if getattr(settings, "enable_cloudsploit", True):
-        try:
-            from scanner.cloudsploit_runner import run_cloudsploit, ingest_cloudsploit_findings
-            cloudsploit_findings = run_cloudsploit()
-            finding_count += ingest_cloudsploit_findings(db, cloudsploit_findings, scan_id)
-        except Exception:
-            pass
 
-    db.execute(
-        text("""
-            UPDATE scan_history
-            SET status = 'completed', finding_count = :cnt, completed_at = :completed
-            WHERE id = :scan_id
-        """),
-        {"cnt": finding_count, "completed": datetime.utcnow(), "scan_id": scan_id},
-    )
-    db.commit()
+def _reset_peak_rss() -> None:
+    """Reset the kernel's RSS high-water mark so the next reading covers this scan only (Linux)."""
+    try:
+        Path("/proc/self/clear_refs").write_text("5")
+    except OSError:
+        pass
+
 
-    return {"scan_id": scan_id, "finding_count": finding_count}
+def _peak_rss_kb() -> int:
+    """Peak resident set size in KiB since the last reset. Falls back to the process lifetime peak."""
+    try:
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        pass
+    return getrusage(RUSAGE_SELF).ru_maxrss
 
 
 def _category_from_resource_type(rtype: str) -> str:
@@ -118,33 +314,3 @@ def _ensure_rules_in_db(db: Session, rules: list[dict]) -> None:
         )
     db.commit()
 
-
-def _upsert_finding(db: Session, resource_id: int, rule: dict, message: str, scan_id: int) -> None:
-    """Insert or update finding with remediation."""
-    rule_row = db.execute(
-        text("SELECT id FROM compliance_rules WHERE rule_id = :rid"),
-        {"rid": rule["rule_id"]},
-    ).fetchone()
-    if not rule_row:
-        return
-    rule_db_id = rule_row[0]
-    remediation = rule.get("remediation") or rule.get("remediation_guidance") or ""
-    db.execute(
-        text("""
-            INSERT INTO findings (resource_id, rule_id, severity, status, message, remediation, scan_id, last_seen_at)
-            VALUES (:res_id, :rule_id, :sev, 'open', :msg, :remediation, :scan_id, NOW())
-            ON CONFLICT (resource_id, rule_id) DO UPDATE SET
-                message = EXCLUDED.message,
-                remediation = EXCLUDED.remediation,
-                scan_id = EXCLUDED.scan_id,
-                last_seen_at = NOW()
-        """),
-        {
-            "res_id": resource_id,
-            "rule_id": rule_db_id,
-            "sev": rule["severity"],
-            "msg": message,
-            "remediation": remediation,
-            "scan_id": scan_id,
-        },
-    )
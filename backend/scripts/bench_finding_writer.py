@@ -0,0 +1,140 @@
+"""Benchmark finding upserts: per-row round trips vs BulkFindingWriter.
+
+Runs against DATABASE_URL (local Postgres with schema.sql applied):
+    PYTHONPATH=. python scripts/bench_finding_writer.py --rows 20000
+Scratch rows use resource_type 'bench_resource' and are removed afterwards.
+"""
+import argparse
+import time
+from datetime import datetime
+
+from sqlalchemy import text
+
+from db.database import SessionLocal
+from scanner.scan.finding_writer import BulkFindingWriter
+
+BENCH_RULE = {
+    "rule_id": "bench_finding_writer",
+    "description": "Benchmark rule",
+    "resource_type": "bench_resource",
+    "severity": "low",
+    "remediation": "n/a",
+}
+
+
+def _legacy_upsert(db, resource_id: int, rule: dict, message: str, scan_id: int) -> None:
+    """Previous scan_service._upsert_finding: one SELECT + one upsert per finding."""
+    rule_db_id = db.execute(
+        text("SELECT id FROM compliance_rules WHERE rule_id = :rid"),
+        {"rid": rule["rule_id"]},
+    ).fetchone()[0]
+    db.execute(
+        text("""
+            INSERT INTO findings (resource_id, rule_id, severity, status, message, remediation, scan_id, last_seen_at)
+            VALUES (:res_id, :rule_id, :sev, 'open', :msg, :remediation, :scan_id, NOW())
+            ON CONFLICT (resource_id, rule_id) DO UPDATE SET
+                message = EXCLUDED.message,
+                remediation = EXCLUDED.remediation,
+                scan_id = EXCLUDED.scan_id,
+                last_seen_at = NOW()
+        """),
+        {
+            "res_id": resource_id,
+            "rule_id": rule_db_id,
+            "sev": rule["severity"],
+            "msg": message,
+            "remediation": rule["remediation"],
+            "scan_id": scan_id,
+        },
+    )
+
+
+def _setup(db, rows: int) -> tuple[int, list[int]]:
+    scan_id = db.execute(
+        text("""
+            INSERT INTO scan_history (scan_type, phase, status, started_at)
+            VALUES ('bench', 'scan', 'running', :started) RETURNING id
+        """),
+        {"started": datetime.utcnow()},
+    ).fetchone()[0]
+    db.execute(
+        text("""
+            INSERT INTO compliance_rules (rule_id, description, resource_type, severity)
+            VALUES (:rid, :desc, :rtype, :sev)
+            ON CONFLICT (rule_id) DO NOTHING
+        """),
+        {"rid": BENCH_RULE["rule_id"], "desc": BENCH_RULE["description"],
+         "rtype": BENCH_RULE["resource_type"], "sev": BENCH_RULE["severity"]},
+    )
+    ids = db.execute(
+        text("""
+            INSERT INTO resources (resource_id, resource_type, region, raw_metadata)
+            SELECT 'bench-' || g, 'bench_resource', 'us-east-1', '{}'::jsonb
+            FROM generate_series(1, :n) AS g
+            ON CONFLICT (resource_id, resource_type) DO UPDATE SET collected_at = NOW()
+            RETURNING id
+        """),
+        {"n": rows},
+    ).fetchall()
+    db.commit()
+    return scan_id, [r[0] for r in ids]
+
+
+def _clear_findings(db) -> None:
+    db.execute(
+        text("DELETE FROM findings WHERE rule_id = (SELECT id FROM compliance_rules WHERE rule_id = :rid)"),
+        {"rid": BENCH_RULE["rule_id"]},
+    )
+    db.commit()
+
+
+def _teardown(db, scan_id: int) -> None:
+    db.execute(text("DELETE FROM resources WHERE resource_type = 'bench_resource'"))
+    db.execute(text("DELETE FROM compliance_rules WHERE rule_id = :rid"), {"rid": BENCH_RULE["rule_id"]})
+    db.execute(text("DELETE FROM scan_history WHERE id = :id"), {"id": scan_id})
+    db.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    scan_id, resource_ids = _setup(db, args.rows)
+    try:
+        # "insert" starts from an empty findings set; "update" re-upserts existing rows.
+        for label in ("insert", "update"):
+            if label == "insert":
+                _clear_findings(db)
+            start = time.perf_counter()
+            for res_id in resource_ids:
+                _legacy_upsert(db, res_id, BENCH_RULE, "legacy", scan_id)
+            db.commit()
+            legacy = time.perf_counter() - start
+
+            if label == "insert":
+                _clear_findings(db)
+            start = time.perf_counter()
+            writer = BulkFindingWriter(db, scan_id, chunk_size=args.chunk_size)
+            writer.load_rule_ids([BENCH_RULE["rule_id"]])
+            for res_id in resource_ids:
+                writer.add(res_id, BENCH_RULE, "bulk")
+            writer.flush()
+            db.commit()
+            bulk = time.perf_counter() - start
+
+            n = len(resource_ids)
+            print(
+                f"{label:<7} rows={n} per-row={n / legacy:,.0f} rows/s "
+                f"bulk={n / bulk:,.0f} rows/s speedup={legacy / bulk:.1f}x"
+            )
+    finally:
+        _clear_findings(db)
+        _teardown(db, scan_id)
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Benchmark raw_metadata serialization: old loads(dumps()) + dumps vs single-pass dumps_metadata.
+
+No AWS or database needed:
+    PYTHONPATH=. python scripts/bench_metadata_json.py --instances 5000
+Uses a synthetic describe_instances payload (datetimes, nested lists/dicts).
+"""
+import argparse
+import json
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from scanner.collection.base_collector import dumps_metadata
+
+
+def _instance(i: int) -> dict:
+    launched = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return {
+        "InstanceId": f"i-{i:017x}",
+        "ImageId": "ami-0abcdef1234567890",
+        "InstanceType": "m5.large",
+        "LaunchTime": launched,
+        "State": {"Code": 16, "Name": "running"},
+        "Placement": {"AvailabilityZone": "us-east-1a", "Tenancy": "default"},
+        "PrivateIpAddress": f"10.0.{i // 256 % 256}.{i % 256}",
+        "SecurityGroups": [{"GroupId": f"sg-{i:08x}", "GroupName": "web"}],
+        "BlockDeviceMappings": [
+            {
+                "DeviceName": f"/dev/xvd{c}",
+                "Ebs": {"AttachTime": launched, "DeleteOnTermination": True, "Status": "attached",
+                        "VolumeId": f"vol-{i:08x}{c}"},
+            }
+            for c in "abcd"
+        ],
+        "NetworkInterfaces": [
+            {
+                "Attachment": {"AttachTime": launched, "DeviceIndex": 0, "Status": "attached"},
+                "Groups": [{"GroupId": f"sg-{i:08x}", "GroupName": "web"}],
+                "PrivateIpAddresses": [{"Primary": True, "PrivateIpAddress": "10.0.0.1"}],
+                "SubnetId": "subnet-0123456789abcdef0",
+            }
+        ],
+        "Tags": [{"Key": f"tag{t}", "Value": f"value-{i}-{t}"} for t in range(8)],
+        "MetadataOptions": {"HttpTokens": "required", "HttpEndpoint": "enabled"},
+    }
+
+
+def _legacy(instance: dict) -> str:
+    """Previous path: _safe_json round trip, then json.dumps in _upsert_resource."""
+    metadata = json.loads(json.dumps(instance, default=str))
+    return json.dumps(metadata)
+
+
+def _single_pass(instance: dict) -> str:
+    return dumps_metadata(dict(instance))
+
+
+def _measure(fn, instances: list[dict]) -> tuple[float, float, int]:
+    """Returns (wall seconds, CPU seconds, peak traced bytes per call)."""
+    wall, cpu = time.perf_counter(), time.process_time()
+    for instance in instances:
+        fn(instance)
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+
+    # Separate pass: tracemalloc slows allocation-heavy code several-fold.
+    peak = 0
+    for instance in instances[:200]:
+        tracemalloc.start()
+        fn(instance)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return wall, cpu, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--instances", type=int, default=5000)
+    args = parser.parse_args()
+
+    instances = [_instance(i) for i in range(args.instances)]
+    assert json.loads(_legacy(instances[0])) == json.loads(_single_pass(instances[0]))
+
+    results = {}
+    for label, fn in (("legacy", _legacy), ("single-pass", _single_pass)):
+        _measure(fn, instances[:100])  # warm up
+        results[label] = _measure(fn, instances)
+        wall, cpu, peak = results[label]
+        print(
+            f"{label:<12} {args.instances / wall:>10,.0f} instances/s "
+            f"cpu={cpu * 1000:,.0f} ms peak_alloc/instance={peak / 1024:,.1f} KiB"
+        )
+    legacy, single = results["legacy"], results["single-pass"]
+    print(f"cpu speedup={legacy[1] / single[1]:.1f}x  peak alloc ratio={legacy[2] / max(single[2], 1):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Microbenchmark compiled YAML rules: evaluations/sec per rule.
+
+No database needed:
+    PYTHONPATH=. python scripts/bench_rule_dsl.py --iterations 200000
+Each rule is timed against a synthetic passing and failing resource.
+"""
+import argparse
+import time
+
+from scanner.scan.rule_engine import load_registry
+
+# (passing raw_metadata, failing raw_metadata) per resource_type
+SAMPLES: dict[str, tuple[dict, dict]] = {
+    "s3_bucket": (
+        {
+            "Encryption": {"ServerSideEncryptionConfiguration": {"Rules": []}},
+            "PublicAccessBlock": {
+                "PublicAccessBlockConfiguration": {"BlockPublicAcls": True, "BlockPublicPolicy": True},
+            },
+        },
+        {"Encryption": {}, "PublicAccessBlock": {}},
+    ),
+    "security_group": (
+        {
+            "IpPermissions": [
+                {"FromPort": 443, "ToPort": 443, "IpRanges": [{"CidrIp": "0.0.0.0/0"}], "Ipv6Ranges": []},
+                {"FromPort": 22, "ToPort": 22, "IpRanges": [{"CidrIp": "10.0.0.0/8"}], "Ipv6Ranges": []},
+            ],
+        },
+        {
+            "IpPermissions": [
+                {"FromPort": 443, "ToPort": 443, "IpRanges": [{"CidrIp": "0.0.0.0/0"}], "Ipv6Ranges": []},
+                {"FromPort": 0, "ToPort": 65535, "IpRanges": [], "Ipv6Ranges": [{"CidrIpv6": "::/0"}]},
+            ],
+        },
+    ),
+    "rds_instance": ({"StorageEncrypted": True}, {"StorageEncrypted": False}),
+    "vpc": (
+        {"FlowLogs": [{"FlowLogStatus": "ACTIVE"}]},
+        {"FlowLogs": [{"FlowLogStatus": "DELETING"}]},
+    ),
+}
+
+
+def _rate(evaluate, resource: dict, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        evaluate(resource)
+    return iterations / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200000)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    registry = load_registry()
+    print(f"loaded+compiled {len(registry)} rules in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    for rule in sorted(registry.rules, key=lambda r: r["rule_id"]):
+        rtype = rule["resource_type"]
+        if rtype not in SAMPLES:
+            print(f"{rule['rule_id']:<20} (no sample for {rtype})")
+            continue
+        evaluate = next(ev for r, ev in registry.for_type(rtype) if r is rule)
+        good, bad = ({"resource_type": rtype, "raw_metadata": md} for md in SAMPLES[rtype])
+        assert evaluate(good)[0] and not evaluate(bad)[0], rule["rule_id"]
+        print(
+            f"{rule['rule_id']:<20} pass={_rate(evaluate, good, args.iterations):>12,.0f}/s "
+            f"fail={_rate(evaluate, bad, args.iterations):>12,.0f}/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+import os
+import uuid
+from pathlib import Path
+
+import pytest
+
+SCHEMA_SQL = Path(__file__).resolve().parent.parent / "db" / "schema.sql"
+
+
+@pytest.fixture
+def pg_session():
+    """Session on a fresh schema built from db/schema.sql in the Postgres at TEST_DATABASE_URL; skipped when unset."""
+    url = os.environ.get("TEST_DATABASE_URL")
+    if not url:
+        pytest.skip("TEST_DATABASE_URL not set")
+    sqlalchemy = pytest.importorskip("sqlalchemy")
+    from sqlalchemy.orm import Session
+
+    schema = f"test_{uuid.uuid4().hex[:12]}"
+    admin = sqlalchemy.create_engine(url)
+    with admin.begin() as conn:
+        conn.execute(sqlalchemy.text(f"CREATE SCHEMA {schema}"))
+    engine = sqlalchemy.create_engine(url, connect_args={"options": f"-csearch_path={schema}"})
+    with engine.begin() as conn:
+        conn.exec_driver_sql(SCHEMA_SQL.read_text())
+    session = Session(engine)
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+        with admin.begin() as conn:
+            conn.execute(sqlalchemy.text(f"DROP SCHEMA {schema} CASCADE"))
+        admin.dispose()
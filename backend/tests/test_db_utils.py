@@ -0,0 +1,8 @@
+from scanner.db_utils import values_clause
+
+
+def test_values_clause_numbers_placeholders_per_row():
+    rows = [{"a": 1, "b": "x", "extra": 0}, {"a": 2, "b": "y", "extra": 0}]
+    values, params = values_clause(rows, ("a", "b"))
+    assert values == "(:a_0, :b_0), (:a_1, :b_1)"
+    assert params == {"a_0": 1, "b_0": "x", "a_1": 2, "b_1": "y"}
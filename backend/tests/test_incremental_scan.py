@@ -0,0 +1,76 @@
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("pydantic_settings")
+
+from sqlalchemy import text
+
+from scanner.scan.evaluation_cache import EvaluationCache
+from scanner.scan.finding_writer import BulkFindingWriter
+from scanner.scan.rule_engine import load_registry
+from scanner.scan.scan_service import _scan_chunk
+
+
+def _new_scan(db) -> int:
+    scan_id = db.execute(
+        text("""
+            INSERT INTO scan_history (scan_type, phase, status, started_at)
+            VALUES ('full', 'scan', 'running', :started) RETURNING id
+        """),
+        {"started": datetime.utcnow()},
+    ).scalar()
+    db.commit()
+    return scan_id
+
+
+def _scan(db, registry) -> tuple[int, dict[str, int]]:
+    scan_id = _new_scan(db)
+    writer = BulkFindingWriter(db, scan_id)
+    writer.load_rule_ids(r["rule_id"] for r in registry.rules)
+    cache = EvaluationCache(db)
+    stats = {"evaluated": 0, "skipped": 0}
+    rows = db.execute(text("SELECT id, resource_id, resource_type, region, content_hash FROM resources")).fetchall()
+    count = _scan_chunk(db, rows, registry, writer, cache, stats)
+    writer.flush()
+    cache.flush()
+    db.commit()
+    return scan_id, {**stats, "findings": count}
+
+
+def test_skipped_failure_is_stamped_with_the_new_scan(pg_session):
+    db = pg_session
+    registry = load_registry()
+    for rule in registry.rules:
+        db.execute(
+            text("""
+                INSERT INTO compliance_rules (rule_id, description, resource_type, severity)
+                VALUES (:rid, :descr, :rtype, :sev)
+            """),
+            {"rid": rule["rule_id"], "descr": rule["description"], "rtype": rule["resource_type"], "sev": rule["severity"]},
+        )
+    db.execute(
+        text("""
+            INSERT INTO resources (resource_id, resource_type, region, raw_metadata, content_hash)
+            VALUES ('db-1', 'rds_instance', 'us-east-1', '{"StorageEncrypted": false}', 'h1'),
+                   ('db-2', 'rds_instance', 'us-east-1', '{"StorageEncrypted": true}', 'h2')
+        """)
+    )
+    db.commit()
+
+    first_scan, first = _scan(db, registry)
+    assert first == {"evaluated": 2, "skipped": 0, "findings": 1}
+    db.execute(text("UPDATE findings SET last_seen_at = NOW() - INTERVAL '1 day'"))
+    db.commit()
+
+    second_scan, second = _scan(db, registry)
+    assert second == {"evaluated": 0, "skipped": 2, "findings": 1}
+    rows = db.execute(
+        text("""
+            SELECT r.resource_id, f.scan_id, f.last_seen_at > NOW() - INTERVAL '1 hour'
+            FROM findings f JOIN resources r ON r.id = f.resource_id
+        """)
+    ).fetchall()
+    assert [tuple(r) for r in rows] == [("db-1", second_scan, True)]
+    assert second_scan != first_scan
@@ -0,0 +1,34 @@
+import json
+
+import pytest
+
+from scanner.json_stream import iter_json_array
+
+DOCUMENTS = [
+    '[1.5, 2]',
+    '[-1e5]',
+    '[1.25e3, -0.5E-2, 10, 3.0e+1]',
+    '[{"a": 1.5, "b": [true, false, null]}, "x,]", 12345678901234567890]',
+    '{"meta": {"n": 2.5e-3}, "results": [{"status": "FAIL", "score": 7.25}, -12.75, 0]}',
+    '[]',
+]
+
+
+@pytest.mark.parametrize("doc", DOCUMENTS)
+def test_every_chunk_size_matches_json_loads(tmp_path, doc):
+    path = tmp_path / "doc.json"
+    path.write_text(doc, encoding="utf-8")
+    loaded = json.loads(doc)
+    expected = loaded["results"] if isinstance(loaded, dict) else loaded
+    for chunk_size in range(1, len(doc) + 1):
+        assert list(iter_json_array(path, chunk_size=chunk_size)) == expected, chunk_size
+
+
+def test_malformed_input_raises_after_good_elements(tmp_path):
+    path = tmp_path / "bad.json"
+    path.write_text('[1, 2 3]', encoding="utf-8")
+    seen = []
+    with pytest.raises(json.JSONDecodeError):
+        for item in iter_json_array(path, chunk_size=2):
+            seen.append(item)
+    assert seen == [1, 2]
@@ -0,0 +1,36 @@
+import threading
+import time
+
+import pytest
+
+from scanner.prowler_checkpoint import CheckpointBusy, ProwlerCheckpoint
+
+
+def test_lock_waits_for_the_holder_then_gives_up(tmp_path):
+    holder = ProwlerCheckpoint(tmp_path, "k").__enter__()
+    threading.Timer(0.1, holder.__exit__).start()
+    with ProwlerCheckpoint(tmp_path, "k", lock_timeout=5) as checkpoint:
+        assert checkpoint.status("iam") == "pending"
+
+    with ProwlerCheckpoint(tmp_path, "k"):
+        start = time.monotonic()
+        with pytest.raises(CheckpointBusy):
+            ProwlerCheckpoint(tmp_path, "k", lock_timeout=0.2).__enter__()
+        assert time.monotonic() - start >= 0.2
+
+
+def test_busy_checkpoint_falls_back_to_a_plain_run(tmp_path, monkeypatch):
+    pytest.importorskip("sqlalchemy")
+    from scanner import prowler_runner
+
+    calls = []
+    monkeypatch.setattr(
+        prowler_runner, "run_prowler", lambda compliance, timeout, services: calls.append(services) or iter(["f"])
+    )
+    monkeypatch.setattr(prowler_runner, "ingest_prowler_findings", lambda _db, findings, _scan_id: len(list(findings)))
+    with ProwlerCheckpoint(tmp_path, "other-worker"):
+        total = prowler_runner.run_prowler_checkpointed(
+            None, 1, ["iam", "s3"], timeout=60, checkpoint_dir=tmp_path, lock_timeout=0.1
+        )
+    assert total == 1
+    assert calls == [["iam", "s3"]]
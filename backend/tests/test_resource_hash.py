@@ -0,0 +1,63 @@
+import itertools
+from datetime import datetime, timezone
+
+import pytest
+
+pytest.importorskip("boto3")
+pytest.importorskip("sqlalchemy")
+
+from scanner.collection import s3_collector
+from scanner.collection.resource_writer import BulkResourceWriter
+from scanner.collection.s3_collector import S3Collector
+
+
+class _StubS3:
+    """Same bucket every call; ResponseMetadata differs per request, like the real API."""
+
+    def __init__(self):
+        self._requests = itertools.count()
+
+    def _response(self, body):
+        n = next(self._requests)
+        return {
+            **body,
+            "ResponseMetadata": {
+                "RequestId": f"REQ{n}",
+                "HostId": f"host-{n}",
+                "HTTPStatusCode": 200,
+                "HTTPHeaders": {"date": f"Mon, 05 Oct 2026 10:00:{n:02d} GMT", "x-amz-request-id": f"REQ{n}"},
+                "RetryAttempts": 0,
+            },
+        }
+
+    def list_buckets(self):
+        created = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        return self._response({"Buckets": [{"Name": "logs", "CreationDate": created}]})
+
+    def get_bucket_location(self, Bucket):
+        return self._response({"LocationConstraint": "eu-west-1"})
+
+    def get_bucket_versioning(self, Bucket):
+        return self._response({"Status": "Enabled"})
+
+    def get_bucket_encryption(self, Bucket):
+        rules = [{"ApplyServerSideEncryptionByDefault": {"SSEAlgorithm": "AES256"}}]
+        return self._response({"ServerSideEncryptionConfiguration": {"Rules": rules}})
+
+    def get_public_access_block(self, Bucket):
+        return self._response({"PublicAccessBlockConfiguration": {"BlockPublicAcls": True, "BlockPublicPolicy": True}})
+
+
+def _collect_hash() -> str:
+    writer = BulkResourceWriter(db=None)
+    for item in S3Collector().iter_collect_region("us-east-1"):
+        writer.add(item)
+    (row,) = writer._buffer.values()
+    assert "ResponseMetadata" not in row["meta"]
+    return row["hash"]
+
+
+def test_unchanged_bucket_hashes_the_same_across_collections(monkeypatch):
+    client = _StubS3()
+    monkeypatch.setattr(s3_collector, "get_client", lambda _service, _region=None: client)
+    assert _collect_hash() == _collect_hash()
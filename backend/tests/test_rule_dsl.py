@@ -0,0 +1,169 @@
+import logging
+import random
+
+import pytest
+
+from scanner.scan.rule_dsl import RuleSyntaxError, compile_expression
+from scanner.scan.rule_engine import RuleRegistry, compile_rule, load_registry
+
+
+# ---- Parser: only whitelisted syntax compiles ----
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "__import__('os')",
+        "StorageEncrypted.__class__",
+        "[x for __x in Tags]",
+        "lambda: 1",
+        "open('/etc/passwd')",
+        "len(Tags, key=1)",
+        "Port * 2",
+        "(x := 1)",
+        "{'a': 1}",
+        "{1, 2}",
+        "f'{Name}'",
+        "Tags[1:2]",
+        "[*Tags]",
+        "b'bytes'",
+        "Tags.pop()",
+        "not (",
+    ],
+)
+def test_rejects_syntax_outside_the_language(source):
+    with pytest.raises(RuleSyntaxError):
+        compile_expression(source)
+
+
+def test_registry_drops_rules_that_do_not_compile(caplog):
+    good = {"rule_id": "good", "resource_type": "x", "evaluation": {"fail_when": "not Enabled"}}
+    bad = {"rule_id": "bad", "resource_type": "x", "evaluation": {"fail_when": "__import__('os')"}}
+    with caplog.at_level(logging.ERROR, logger="scanner.scan.rule_engine"):
+        registry = RuleRegistry([good, bad])
+    assert [rule["rule_id"] for rule in registry.rules] == ["good"]
+    assert [r.getMessage().split(":")[0] for r in caplog.records] == ["rule bad not loaded"]
+
+
+# ---- Equivalence with the hand-written evaluators the YAML rules replaced ----
+
+def _s3_public_access(raw: dict) -> tuple[bool, str]:
+    config = raw.get("PublicAccessBlock", {}).get("PublicAccessBlockConfiguration", {})
+    if not config.get("BlockPublicAcls") or not config.get("BlockPublicPolicy"):
+        return False, "Public access block not fully configured"
+    return True, "OK"
+
+
+def _s3_encryption(raw: dict) -> tuple[bool, str]:
+    if "ServerSideEncryptionConfiguration" not in raw.get("Encryption", {}):
+        return False, "Server-side encryption not configured"
+    return True, "OK"
+
+
+def _sg_public_ingress(raw: dict) -> tuple[bool, str]:
+    for p in raw.get("IpPermissions", []):
+        from_port = p.get("FromPort") or 0
+        to_port = p.get("ToPort") or 65535
+        for rng in p.get("IpRanges", []) + p.get("Ipv6Ranges", []):
+            cidr = rng.get("CidrIp") or rng.get("CidrIpv6", "")
+            if "0.0.0.0/0" in cidr or "::/0" in cidr:
+                for port in [22, 3389, 5432, 3306, 1433]:
+                    if from_port <= port <= to_port:
+                        return False, f"Public access on port {port}"
+    return True, "OK"
+
+
+def _rds_encryption(raw: dict) -> tuple[bool, str]:
+    if not raw.get("StorageEncrypted"):
+        return False, "RDS storage encryption not enabled"
+    return True, "OK"
+
+
+def _vpc_flow_logs(raw: dict) -> tuple[bool, str]:
+    if not [l for l in raw.get("FlowLogs", []) if l.get("FlowLogStatus") == "ACTIVE"]:
+        return False, "VPC flow logs not enabled"
+    return True, "OK"
+
+
+def _maybe(rng: random.Random, key: str, values: list, out: dict) -> None:
+    choice = rng.choice(values + ["<absent>"])
+    if choice != "<absent>":
+        out[key] = choice
+
+
+def _gen_s3_public_access(rng: random.Random) -> dict:
+    raw: dict = {}
+    if rng.random() < 0.9:
+        pab: dict = {}
+        if rng.random() < 0.9:
+            config: dict = {}
+            _maybe(rng, "BlockPublicAcls", [True, False], config)
+            _maybe(rng, "BlockPublicPolicy", [True, False], config)
+            pab["PublicAccessBlockConfiguration"] = config
+        raw["PublicAccessBlock"] = pab
+    return raw
+
+
+def _gen_s3_encryption(rng: random.Random) -> dict:
+    raw: dict = {}
+    if rng.random() < 0.9:
+        raw["Encryption"] = rng.choice([{}, {"ServerSideEncryptionConfiguration": {"Rules": []}}, {"Other": 1}])
+    return raw
+
+
+def _gen_sg_public_ingress(rng: random.Random) -> dict:
+    ports = [-1, 0, 1, 21, 22, 80, 443, 1433, 3306, 3389, 5432, 8080, 65535]
+    cidrs = ["0.0.0.0/0", "10.0.0.0/8", "192.168.1.0/24", "1.2.3.4/32"]
+    cidrs6 = ["::/0", "2001:db8::/32", "fd00::/8"]
+    perms = []
+    for _ in range(rng.randint(0, 3)):
+        perm: dict = {}
+        _maybe(rng, "FromPort", ports, perm)
+        _maybe(rng, "ToPort", ports, perm)
+        if rng.random() < 0.9:
+            perm["IpRanges"] = [{"CidrIp": rng.choice(cidrs)} for _ in range(rng.randint(0, 2))]
+        if rng.random() < 0.5:
+            perm["Ipv6Ranges"] = [{"CidrIpv6": rng.choice(cidrs6)} for _ in range(rng.randint(0, 2))]
+        perms.append(perm)
+    return {"IpPermissions": perms} if rng.random() < 0.95 else {}
+
+
+def _gen_rds_encryption(rng: random.Random) -> dict:
+    raw: dict = {}
+    _maybe(rng, "StorageEncrypted", [True, False], raw)
+    return raw
+
+
+def _gen_vpc_flow_logs(rng: random.Random) -> dict:
+    logs = []
+    for _ in range(rng.randint(0, 3)):
+        log: dict = {}
+        _maybe(rng, "FlowLogStatus", ["ACTIVE", "INACTIVE"], log)
+        logs.append(log)
+    return {"FlowLogs": logs} if rng.random() < 0.9 else {}
+
+
+BASELINES = {
+    "s3_public_access": (_s3_public_access, _gen_s3_public_access),
+    "s3_encryption": (_s3_encryption, _gen_s3_encryption),
+    "sg_public_ingress": (_sg_public_ingress, _gen_sg_public_ingress),
+    "rds_encryption": (_rds_encryption, _gen_rds_encryption),
+    "vpc_flow_logs": (_vpc_flow_logs, _gen_vpc_flow_logs),
+}
+
+
+@pytest.mark.parametrize("rule_id", sorted(BASELINES))
+def test_yaml_rule_matches_previous_evaluator(rule_id):
+    rules = {rule["rule_id"]: rule for rule in load_registry().rules}
+    evaluator = compile_rule(rules[rule_id])
+    baseline, generate = BASELINES[rule_id]
+    rng = random.Random(rule_id)
+    for _ in range(5000):
+        raw = generate(rng)
+        assert evaluator({"raw_metadata": raw}) == baseline(raw), raw
+
+
+def test_sg_to_port_zero_means_all_ports():
+    rules = {rule["rule_id"]: rule for rule in load_registry().rules}
+    evaluator = compile_rule(rules["sg_public_ingress"])
+    raw = {"IpPermissions": [{"FromPort": 0, "ToPort": 0, "IpRanges": [{"CidrIp": "0.0.0.0/0"}]}]}
+    assert evaluator({"raw_metadata": raw}) == (False, "Public access on port 22")